@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Alert Store Benchmark
+
+Loads N synthetic alerts into AlertStorage with batched inserts, then times
+investigator-style queries: a customer's latest alerts, a paginated walk of
+one customer's history, and an open-alerts time-range page.
+
+Usage:
+  python3 scripts/bench_alert_store.py --alerts 1000000 --customers 50000
+"""
+
+import argparse
+import logging
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from statistics import mean
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.monitoring.transaction_monitor import (
+    MANILA_TZ,
+    Alert,
+    AlertSeverity,
+    AlertStorage,
+    AlertType,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark the indexed alert store")
+    ap.add_argument("--alerts", type=int, default=1_000_000)
+    ap.add_argument("--customers", type=int, default=50_000)
+    ap.add_argument("--batch-size", type=int, default=10_000)
+    ap.add_argument("--queries", type=int, default=1000)
+    ap.add_argument("--seed", type=int, default=11)
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    rng = random.Random(args.seed)
+    logging.getLogger("src.monitoring.transaction_monitor").setLevel(logging.WARNING)
+    workdir = Path(tempfile.mkdtemp(prefix="alert_bench_"))
+    storage = AlertStorage(workdir)
+    base = datetime(2025, 1, 1, tzinfo=MANILA_TZ)
+    alert_types = list(AlertType)
+    severities = list(AlertSeverity)
+
+    try:
+        t0 = time.perf_counter()
+        batch = []
+        for i in range(args.alerts):
+            batch.append(Alert(
+                alert_id=f"{i:016x}",
+                alert_type=rng.choice(alert_types),
+                severity=rng.choice(severities),
+                customer_id=f"CUST{rng.randrange(args.customers):07d}",
+                transaction_ids=[f"TX{i}"],
+                score=0.5,
+                reason="synthetic",
+                details={},
+                created_at=(base + timedelta(seconds=i * 3)).isoformat(),
+                requires_review=True,
+                status=rng.choice(["open", "open", "closed"]),
+            ))
+            if len(batch) >= args.batch_size:
+                storage.store_alerts(batch)
+                batch = []
+        storage.store_alerts(batch)
+        load_s = time.perf_counter() - t0
+
+        lookups = []
+        for _ in range(args.queries):
+            customer_id = f"CUST{rng.randrange(args.customers):07d}"
+            t0 = time.perf_counter()
+            storage.get_customer_alerts(customer_id, limit=50)
+            lookups.append((time.perf_counter() - t0) * 1000)
+
+        t0 = time.perf_counter()
+        pages, cursor = 0, None
+        while True:
+            _, cursor = storage.query_alerts(customer_id="CUST0000001", limit=5, cursor=cursor)
+            pages += 1
+            if cursor is None:
+                break
+        walk_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        storage.query_alerts(status="open", start=base + timedelta(days=10),
+                             end=base + timedelta(days=11), limit=100)
+        range_ms = (time.perf_counter() - t0) * 1000
+
+        lookups.sort()
+        print(f"alerts stored:           {storage.count_alerts():,}")
+        print(f"load:                    {load_s:.1f}s ({args.alerts / load_s:,.0f} alerts/s)")
+        print(f"customer lookup (ms):    avg={mean(lookups):.2f} p99={lookups[int(len(lookups) * 0.99) - 1]:.2f}")
+        print(f"paginated walk (ms):     {walk_ms:.2f} over {pages} page(s)")
+        print(f"status+time page (ms):   {range_ms:.2f}")
+        print(f"db size:                 {storage.db_path.stat().st_size / 1e6:.1f} MB")
+    finally:
+        storage.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
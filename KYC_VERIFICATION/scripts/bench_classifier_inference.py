@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Classifier CNN Inference Benchmark
+
+Drives DocumentClassifier._get_model_predictions from 1, 4 and 16 client
+threads and reports CPU throughput for per-request forward passes against
+the micro-batching queue (eager and TorchScript). Requires torch and
+torchvision; the CNN uses random weights unless --model is given.
+
+Usage:
+  python3 scripts/bench_classifier_inference.py
+  python3 scripts/bench_classifier_inference.py --clients 1 4 16 --requests 64 --threads 1
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.classification.document_classifier import DocumentClassifier, TORCH_AVAILABLE, TRANSFORMS_AVAILABLE
+
+MODES = {
+    "per_request": {"micro_batching": False, "torchscript": False},
+    "batched": {"micro_batching": True, "torchscript": False},
+    "batched_torchscript": {"micro_batching": True, "torchscript": True},
+}
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark batched CNN inference for document classification")
+    ap.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16])
+    ap.add_argument("--requests", type=int, default=96, help="Requests per client count (split across clients)")
+    ap.add_argument("--threads", type=int, default=0, help="torch.set_num_threads (0 = torch default)")
+    ap.add_argument("--batch-size", type=int, default=8)
+    ap.add_argument("--wait-ms", type=float, default=2.0)
+    ap.add_argument("--model", help="Path to trained weights")
+    return ap.parse_args()
+
+
+def run_clients(classifier: DocumentClassifier, images: list, clients: int, total: int) -> dict:
+    latencies: list = []
+    lock = threading.Lock()
+    per_client = max(1, total // clients)
+
+    def client(offset: int) -> None:
+        local = []
+        for i in range(per_client):
+            t0 = time.perf_counter()
+            classifier._get_model_predictions(images[(offset + i) % len(images)])
+            local.append((time.perf_counter() - t0) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client, args=(c,)) for c in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return {"throughput": len(latencies) / elapsed, "p50": statistics.median(latencies),
+            "p95": float(np.percentile(latencies, 95))}
+
+
+def main() -> None:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+    if not (TORCH_AVAILABLE and TRANSFORMS_AVAILABLE):
+        print("torch and torchvision are required")
+        return
+
+    rng = np.random.default_rng(0)
+    images = [rng.integers(0, 255, (540, 856, 3), dtype=np.uint8) for _ in range(8)]
+    classifier = DocumentClassifier(model_path=args.model)
+    settings = classifier.config["inference"]
+    settings.update(num_threads=args.threads or None, max_batch_size=args.batch_size, max_wait_ms=args.wait_ms)
+
+    print(f"torch threads: {args.threads or 'default'}, batch <= {args.batch_size}, wait {args.wait_ms} ms")
+    for mode, overrides in MODES.items():
+        settings.update(overrides)
+        classifier.close()
+        classifier.inference_model = classifier._prepare_inference_model(classifier.model)
+        for image in images[:2]:
+            classifier._get_model_predictions(image)
+        for clients in args.clients:
+            # Fresh batcher so batch metrics cover this run only
+            classifier.close()
+            result = run_clients(classifier, images, clients, args.requests)
+            metrics = classifier.get_inference_metrics()
+            batch = f"  avg batch={metrics['avg_batch_size']:.1f}" if metrics else ""
+            print(f"{mode:<20} clients={clients:>2}  {result['throughput']:7.1f} img/s  "
+                  f"p50={result['p50']:7.1f} ms  p95={result['p95']:7.1f} ms{batch}")
+    classifier.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Color Feature Benchmark
+
+Compares DocumentClassifier._extract_color_features (k-means on a fixed-size
+sample of a downscaled image) against the previous implementation, which
+clustered every pixel of the full-resolution image. Reports per-image
+latency and whether _match_templates picks the same template for each image
+of the evaluation set. --upscale resizes each image to the given long side
+first, to mimic 12 MP phone captures.
+
+Usage:
+  python3 scripts/bench_color_features.py
+  python3 scripts/bench_color_features.py --upscale 4000 --limit 10
+"""
+
+import argparse
+import glob
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.classification.document_classifier import DocumentClassifier
+
+DEFAULT_GLOBS = [
+    "datasets/synthetic/*/*.ppm",
+    "KYC_VERIFICATION/datasets/synthetic/*/*.jpg",
+    "tests/*.jpg",
+]
+
+
+def full_resolution_colors(image: np.ndarray) -> list:
+    """Previous behaviour: MiniBatchKMeans over every pixel"""
+    from sklearn.cluster import MiniBatchKMeans  # type: ignore
+    pixels = cv2.cvtColor(image, cv2.COLOR_BGR2RGB).reshape(-1, 3)
+    kmeans = MiniBatchKMeans(n_clusters=5, random_state=42, n_init=3).fit(pixels)
+    return [tuple(color) for color in kmeans.cluster_centers_.astype(int)]
+
+
+def load_images(patterns: list, limit: int, upscale: int) -> list:
+    paths = sorted(p for pattern in patterns for p in glob.glob(str(PKG_ROOT / pattern)))[:limit or None]
+    images = []
+    for path in paths:
+        image = cv2.imread(path)
+        if image is None:
+            continue
+        if upscale:
+            scale = upscale / max(image.shape[:2])
+            image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+        images.append((path, image))
+    return images
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark sampled vs full-resolution color clustering")
+    ap.add_argument("--glob", action="append", help="Image glob relative to the package root (repeatable)")
+    ap.add_argument("--limit", type=int, default=0, help="Max images (0 = all)")
+    ap.add_argument("--upscale", type=int, default=0, help="Resize long side to this many pixels")
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+    images = load_images(args.glob or DEFAULT_GLOBS, args.limit, args.upscale)
+    if not images:
+        print("no images found")
+        return
+
+    classifier = DocumentClassifier()
+    # Warm up imports and the k-means code path
+    classifier._extract_color_features(images[0][1])
+    full_resolution_colors(images[0][1][:64, :64])
+
+    full_ms, sampled_ms, same, max_delta = [], [], 0, 0.0
+    for path, image in images:
+        features = classifier._extract_features(image)
+
+        t0 = time.perf_counter()
+        full_colors = full_resolution_colors(image)
+        full_ms.append((time.perf_counter() - t0) * 1000)
+
+        t0 = time.perf_counter()
+        sampled_colors = classifier._extract_color_features(image)["dominant_colors"]
+        sampled_ms.append((time.perf_counter() - t0) * 1000)
+
+        full = classifier._match_templates({**features, "dominant_colors": full_colors})
+        sampled = classifier._match_templates({**features, "dominant_colors": sampled_colors})
+        same += max(full, key=full.get) == max(sampled, key=sampled.get)
+        max_delta = max(max_delta, max(abs(full[k] - sampled[k]) for k in full))
+
+    height, width = images[0][1].shape[:2]
+    print(f"images:                 {len(images)} (first is {width}x{height})")
+    print(f"template decision same: {same}/{len(images)}")
+    print(f"max template score diff:{max_delta:9.4f}")
+    for name, latencies in (("full_resolution", full_ms), ("sampled", sampled_ms)):
+        print(f"{name:<22}  mean={statistics.fmean(latencies):8.2f} ms  "
+              f"p50={statistics.median(latencies):8.2f} ms  max={max(latencies):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Copy-Move Detection Benchmark
+
+Times AuthenticityVerifier.detect_copy_move at 1, 4 and 12 MP on captures
+built from the test photos (or a synthetic texture when the photos are
+missing), each with and without a cloned region, and saved as JPEG like a
+phone upload. Reports latency, whether the clone was found at the right
+shift and whether the untouched capture stayed clean.
+
+--legacy also times the previous implementation (overlapping blocks,
+np.corrcoef against the next search_window blocks in raster order) up to
+--legacy-max-mp; it takes minutes per image beyond 1 MP.
+
+Usage:
+  python3 scripts/bench_copy_move.py
+  python3 scripts/bench_copy_move.py --sizes 1 4 12 --repeats 3 --legacy
+"""
+
+import argparse
+import glob
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.forensics.authenticity_verifier import AuthenticityVerifier
+
+
+def legacy_copy_move(image: np.ndarray, block_size: int = 16, search_window: int = 64,
+                     threshold: float = 0.9) -> int:
+    """Previous detect_copy_move matching loop; returns the number of matches"""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+    h, w = gray.shape
+    blocks, positions = [], []
+    for i in range(0, h - block_size, block_size // 2):
+        for j in range(0, w - block_size, block_size // 2):
+            blocks.append(gray[i:i + block_size, j:j + block_size].flatten())
+            positions.append((i, j))
+    blocks = np.array(blocks)
+    matches = 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for i in range(len(blocks)):
+            for j in range(i + 1, min(i + search_window, len(blocks))):
+                if np.corrcoef(blocks[i], blocks[j])[0, 1] > threshold:
+                    dist = np.hypot(positions[i][0] - positions[j][0], positions[i][1] - positions[j][1])
+                    matches += dist > block_size * 2
+    return matches
+
+
+def base_images() -> list:
+    photos = [cv2.imread(p) for p in sorted(glob.glob(str(PKG_ROOT / "tests" / "*.jpg")))]
+    photos = [p for p in photos if p is not None]
+    if photos:
+        return photos
+    noise = np.random.default_rng(0).normal(size=(1536, 2048)).astype(np.float32)
+    texture = cv2.normalize(cv2.GaussianBlur(noise, (0, 0), 2.0), None, 20, 235, cv2.NORM_MINMAX)
+    return [cv2.cvtColor(texture.astype(np.uint8), cv2.COLOR_GRAY2BGR)]
+
+
+def capture(photo: np.ndarray, megapixels: float) -> np.ndarray:
+    h, w = photo.shape[:2]
+    factor = np.sqrt(megapixels * 1e6 / (h * w))
+    size = (int(round(w * factor)), int(round(h * factor)))
+    return cv2.resize(photo, size, interpolation=cv2.INTER_AREA if factor < 1 else cv2.INTER_CUBIC)
+
+
+def textured_spot(image: np.ndarray, size: int, rng: np.random.Generator) -> tuple:
+    """Top-left corner of a patch with enough detail to be clone-detectable"""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY).astype(np.float32)
+    h, w = gray.shape
+    best, best_var = (0, 0), -1.0
+    for _ in range(40):
+        y, x = int(rng.integers(0, h - size)), int(rng.integers(0, w - size))
+        var = float(cv2.Laplacian(gray[y:y + size, x:x + size], cv2.CV_32F).var())
+        if var > best_var:
+            best, best_var = (y, x), var
+    return best
+
+
+def tamper(image: np.ndarray, rng: np.random.Generator) -> tuple:
+    """Clone a textured patch (1/8 of the short side) to a far-away spot"""
+    h, w = image.shape[:2]
+    size = min(h, w) // 8
+    sy, sx = textured_spot(image, size, rng)
+    while True:
+        ty, tx = int(rng.integers(0, h - size)), int(rng.integers(0, w - size))
+        if abs(ty - sy) > size or abs(tx - sx) > size:
+            break
+    tampered = image.copy()
+    tampered[ty:ty + size, tx:tx + size] = image[sy:sy + size, sx:sx + size]
+    return tampered, (ty - sy, tx - sx)
+
+
+def jpeg(image: np.ndarray, quality: int = 90) -> np.ndarray:
+    return cv2.imdecode(cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])[1], cv2.IMREAD_COLOR)
+
+
+def found_shift(findings: list, shift: tuple, tolerance: int) -> bool:
+    if not findings:
+        return False
+    reported = np.array(findings[0].evidence["shift"])
+    return min(np.abs(reported - shift).max(), np.abs(reported + shift).max()) <= tolerance
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark copy-move detection latency and accuracy")
+    ap.add_argument("--sizes", type=float, nargs="+", default=[1, 4, 12], help="Capture sizes in megapixels")
+    ap.add_argument("--repeats", type=int, default=3, help="Cloned captures per photo and size")
+    ap.add_argument("--seed", type=int, default=3)
+    ap.add_argument("--legacy", action="store_true", help="Also time the previous pairwise implementation")
+    ap.add_argument("--legacy-max-mp", type=float, default=1.0)
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+    rng = np.random.default_rng(args.seed)
+    verifier = AuthenticityVerifier()
+    photos = base_images()
+
+    for megapixels in args.sizes:
+        latencies, legacy_ms, found, clean = [], [], 0, 0
+        trials = 0
+        for photo in photos:
+            image = capture(photo, megapixels)
+            scale = max(image.shape[:2]) / verifier.config["copy_move"]["analysis_max_side"]
+            clean += not verifier.detect_copy_move(jpeg(image))
+            for _ in range(args.repeats):
+                tampered, shift = tamper(image, rng)
+                tampered = jpeg(tampered)
+                t0 = time.perf_counter()
+                findings = verifier.detect_copy_move(tampered)
+                latencies.append((time.perf_counter() - t0) * 1000)
+                found += found_shift(findings, shift, max(3, int(np.ceil(2 * scale))))
+                trials += 1
+            if args.legacy and megapixels <= args.legacy_max_mp:
+                t0 = time.perf_counter()
+                legacy_copy_move(tampered)
+                legacy_ms.append((time.perf_counter() - t0) * 1000)
+
+        line = (f"{megapixels:>5.1f} MP  mean={statistics.fmean(latencies):8.1f} ms  "
+                f"p50={statistics.median(latencies):8.1f} ms  clone found {found}/{trials}  "
+                f"clean kept {clean}/{len(photos)}")
+        if legacy_ms:
+            line += f"  legacy mean={statistics.fmean(legacy_ms):9.1f} ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Concurrent Extraction Benchmark
+
+Times each EvidenceExtractor sub-extractor (OCR, MRZ, barcode, face) on a
+sample ID image set, then times extract_all, which runs them concurrently.
+Concurrent wall time should approach the slowest single extractor rather
+than their sum (given enough cores for the native code to overlap).
+
+Usage:
+  python3 scripts/bench_extract_all.py --images "datasets/synthetic/legit/*.ppm" --rounds 3
+"""
+
+import argparse
+import glob
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import cv2
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.extraction.evidence_extractor import EvidenceExtractor
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark concurrent sub-extractors in extract_all")
+    ap.add_argument("--images", default=str(PKG_ROOT / "datasets/synthetic/legit/*.ppm"),
+                    help="Glob of sample ID images")
+    ap.add_argument("--rounds", type=int, default=3, help="Passes over the image set")
+    ap.add_argument("--upscale", type=float, default=1.0,
+                    help="Resize factor, e.g. 4 to approximate phone captures")
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+
+    images = [img for img in (cv2.imread(p) for p in sorted(glob.glob(args.images))) if img is not None]
+    if not images:
+        raise SystemExit(f"No images matched {args.images}")
+    if args.upscale != 1.0:
+        images = [cv2.resize(img, None, fx=args.upscale, fy=args.upscale) for img in images]
+
+    extractor = EvidenceExtractor()
+    steps = {
+        "ocr": extractor.extract_ocr,
+        "mrz": extractor.extract_mrz,
+        "barcode": extractor.extract_barcodes,
+        "face": extractor.extract_faces,
+    }
+    extractor.extract_all(images[0])  # start the thread pool
+
+    per_step = {name: [] for name in steps}
+    sequential, concurrent = [], []
+    for _ in range(args.rounds):
+        for image in images:
+            total = 0.0
+            for name, step in steps.items():
+                t0 = time.perf_counter()
+                step(image)
+                elapsed = (time.perf_counter() - t0) * 1000
+                per_step[name].append(elapsed)
+                total += elapsed
+            sequential.append(total)
+
+            t0 = time.perf_counter()
+            extractor.extract_all(image)
+            concurrent.append((time.perf_counter() - t0) * 1000)
+
+    print(f"images:               {len(images)} x {args.rounds} rounds, shape {images[0].shape}")
+    for name, samples in per_step.items():
+        print(f"  {name:<8}           mean={statistics.fmean(samples):8.2f} ms")
+    slowest = max(statistics.fmean(samples) for samples in per_step.values())
+    print(f"slowest extractor:    {slowest:8.2f} ms")
+    print(f"sequential (sum):     {statistics.fmean(sequential):8.2f} ms")
+    print(f"extract_all:          {statistics.fmean(concurrent):8.2f} ms")
+    extractor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Extractor Pool Benchmark
+
+Runs the /extract workload (EvidenceExtractor.extract_all) over a sample ID
+image set twice: constructing a new EvidenceExtractor per request, as the
+handler used to, and borrowing a pre-initialized one from an ExtractorPool.
+Reports per-request latency for both and the pool's utilization metrics.
+
+Usage:
+  python3 scripts/bench_extractor_pool.py --images "datasets/synthetic/legit/*.ppm" --requests 200
+"""
+
+import argparse
+import glob
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import cv2
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.extraction.evidence_extractor import EvidenceExtractor
+from src.extraction.extractor_pool import ExtractorPool
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark pooled vs per-request EvidenceExtractor")
+    ap.add_argument("--images", default=str(PKG_ROOT / "datasets/synthetic/legit/*.ppm"),
+                    help="Glob of sample ID images")
+    ap.add_argument("--requests", type=int, default=200, help="Requests per mode")
+    ap.add_argument("--pool-size", type=int, default=2)
+    ap.add_argument("--tesseract-workers", type=int, default=2,
+                    help="Long-lived tesseract workers (needs tesserocr; 0 disables)")
+    return ap.parse_args()
+
+
+def summarize(label: str, samples: list) -> float:
+    ordered = sorted(samples)
+    p95 = ordered[int(0.95 * (len(ordered) - 1))]
+    mean = statistics.fmean(samples)
+    print(f"{label:<22} mean={mean:7.2f} ms  p50={statistics.median(samples):7.2f} ms  p95={p95:7.2f} ms")
+    return mean
+
+
+def main() -> None:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+
+    images = [img for img in (cv2.imread(p) for p in sorted(glob.glob(args.images))) if img is not None]
+    if not images:
+        raise SystemExit(f"No images matched {args.images}")
+
+    fresh = []
+    for i in range(args.requests):
+        t0 = time.perf_counter()
+        EvidenceExtractor().extract_all(images[i % len(images)], "PHILIPPINE_ID")
+        fresh.append((time.perf_counter() - t0) * 1000)
+
+    pool = ExtractorPool(args.pool_size, args.tesseract_workers)
+    pooled = []
+    for i in range(args.requests):
+        t0 = time.perf_counter()
+        with pool.acquire() as extractor:
+            extractor.extract_all(images[i % len(images)], "PHILIPPINE_ID")
+        pooled.append((time.perf_counter() - t0) * 1000)
+
+    print(f"images:                {len(images)} ({args.requests} requests per mode)")
+    fresh_mean = summarize("new extractor/request", fresh)
+    pooled_mean = summarize("pooled extractor", pooled)
+    print(f"saved per request:     {fresh_mean - pooled_mean:.2f} ms")
+    print("pool metrics:")
+    print(json.dumps(pool.get_metrics(), indent=2))
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
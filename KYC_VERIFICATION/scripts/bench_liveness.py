@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Liveness Detection Benchmark
+
+Times FaceMatcher.detect_liveness per frame on bursts built from the test
+photos (or a synthetic texture when the photos are missing) at a few
+capture sizes. --legacy also times the previous work per burst: per-pixel
+Python LBP, a grayscale conversion in every check and separate face
+detection for the blink and head-movement checks.
+
+Usage:
+  python3 scripts/bench_liveness.py
+  python3 scripts/bench_liveness.py --sizes 320x240 640x480 --frames 12 --legacy
+"""
+
+import argparse
+import glob
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.biometrics.face_matcher import FaceMatcher
+
+
+def legacy_lbp(gray: np.ndarray) -> np.ndarray:
+    rows, cols = gray.shape
+    lbp = np.zeros_like(gray)
+    for i in range(1, rows - 1):
+        for j in range(1, cols - 1):
+            center = gray[i, j]
+            code = 0
+            neighbors = [
+                gray[i-1, j-1], gray[i-1, j], gray[i-1, j+1],
+                gray[i, j+1], gray[i+1, j+1], gray[i+1, j],
+                gray[i+1, j-1], gray[i, j-1]
+            ]
+            for k, neighbor in enumerate(neighbors):
+                if neighbor >= center:
+                    code |= (1 << k)
+            lbp[i, j] = code
+    return lbp
+
+
+def legacy_detect_liveness(matcher: FaceMatcher, frames: list) -> None:
+    """Work done by the previous detect_liveness (scores are not assembled)"""
+    for frame in frames[:5]:
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        np.histogram(legacy_lbp(gray).ravel(), bins=256, range=(0, 256))
+    for frame in frames[:5]:
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        np.abs(np.fft.fftshift(np.fft.fft2(gray)))
+    for frame in frames[:5]:
+        _, _, v = cv2.split(cv2.cvtColor(frame, cv2.COLOR_BGR2HSV))
+        cv2.HoughLinesP(cv2.Canny(v, 50, 150), 1, np.pi/180, 100, minLineLength=100, maxLineGap=10)
+    if len(frames) >= 10:
+        for frame in frames:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            faces = matcher.face_detector(gray)
+            if faces and matcher.shape_predictor:
+                matcher.shape_predictor(gray, faces[0])
+    if len(frames) >= 5:
+        for frame in frames:
+            matcher.face_detector(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+
+
+def base_images() -> list:
+    photos = [cv2.imread(p) for p in sorted(glob.glob(str(PKG_ROOT / "tests" / "*.jpg")))]
+    photos = [p for p in photos if p is not None]
+    if photos:
+        return photos
+    noise = np.random.default_rng(0).normal(size=(960, 1280)).astype(np.float32)
+    texture = cv2.normalize(cv2.GaussianBlur(noise, (0, 0), 2.0), None, 20, 235, cv2.NORM_MINMAX)
+    return [cv2.cvtColor(texture.astype(np.uint8), cv2.COLOR_GRAY2BGR)]
+
+
+def burst(photo: np.ndarray, size: tuple, count: int) -> list:
+    """Frames of a slowly panning crop, like a selfie video"""
+    w, h = size
+    base = cv2.resize(photo, (w + 4 * count, h + 2 * count), interpolation=cv2.INTER_AREA)
+    return [base[2 * i:2 * i + h, 4 * i:4 * i + w].copy() for i in range(count)]
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark liveness detection per frame")
+    ap.add_argument("--sizes", nargs="+", default=["320x240", "640x480"], help="Frame sizes as WxH")
+    ap.add_argument("--frames", type=int, default=12, help="Frames per burst")
+    ap.add_argument("--repeats", type=int, default=3)
+    ap.add_argument("--legacy", action="store_true", help="Also time the previous implementation")
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+    matcher = FaceMatcher()
+    photos = base_images()
+
+    for size in args.sizes:
+        w, h = (int(v) for v in size.lower().split("x"))
+        per_frame, legacy_per_frame = [], []
+        for photo in photos:
+            frames = burst(photo, (w, h), args.frames)
+            matcher.detect_liveness(frames)  # warm-up
+            for _ in range(args.repeats):
+                t0 = time.perf_counter()
+                matcher.detect_liveness(frames)
+                per_frame.append((time.perf_counter() - t0) * 1000 / len(frames))
+            if args.legacy:
+                t0 = time.perf_counter()
+                legacy_detect_liveness(matcher, frames)
+                legacy_per_frame.append((time.perf_counter() - t0) * 1000 / len(frames))
+
+        line = (f"{size:>9}  {args.frames} frames  mean={statistics.fmean(per_frame):7.2f} ms/frame  "
+                f"p50={statistics.median(per_frame):7.2f} ms/frame")
+        if legacy_per_frame:
+            legacy = statistics.fmean(legacy_per_frame)
+            line += f"  legacy={legacy:8.2f} ms/frame  x{legacy / statistics.fmean(per_frame):.1f}"
+        print(line)
+    matcher.close()
+
+
+if __name__ == "__main__":
+    main()
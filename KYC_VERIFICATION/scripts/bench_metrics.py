@@ -4,10 +4,13 @@ Benchmark Metrics Runner (Phase 17 / 18)
 
 Computes simple forensic-detectability metrics over a provided dataset path
 and exports CSV with timestamped results. This is a lightweight proxy for
-measuring red-team catch rate and basic latency stats.
+measuring red-team catch rate and basic latency stats. avg_cpu_ms is the
+process CPU time per document; --exhaustive runs every forensic check
+instead of the tiered early-exit schedule.
 
 Usage:
   python3 scripts/bench_metrics.py --dataset datasets/red_team --out artifacts/benchmarks.csv
+  python3 scripts/bench_metrics.py --dataset datasets/red_team --exhaustive
 """
 
 import argparse
@@ -34,20 +37,23 @@ def list_images(root: Path) -> List[Path]:
     return [p for p in root.rglob("*") if p.suffix.lower() in exts]
 
 
-def assess_dir(verifier: AuthenticityVerifier, path: Path) -> Dict[str, float]:
+def assess_dir(verifier: AuthenticityVerifier, path: Path, exhaustive: bool = False) -> Dict[str, float]:
     images = list_images(path)
     if not images:
-        return {"count": 0, "authentic_count": 0, "authentic_ratio": 0.0, "avg_ms": 0.0}
+        return {"count": 0, "authentic_count": 0, "authentic_ratio": 0.0, "avg_ms": 0.0, "avg_cpu_ms": 0.0}
 
     authentic = 0
     total_ms = 0.0
+    total_cpu_ms = 0.0
     for img_path in images:
         img = cv2.imread(str(img_path))
         if img is None:
             continue
         t0 = time.time()
-        result = verifier.verify_authenticity(img)
+        c0 = time.process_time()
+        result = verifier.verify_authenticity(img, exhaustive=exhaustive)
         total_ms += (time.time() - t0) * 1000
+        total_cpu_ms += (time.process_time() - c0) * 1000
         authentic += 1 if result.is_authentic else 0
 
     n = max(1, len(images))
@@ -56,6 +62,7 @@ def assess_dir(verifier: AuthenticityVerifier, path: Path) -> Dict[str, float]:
         "authentic_count": authentic,
         "authentic_ratio": authentic / n,
         "avg_ms": total_ms / n,
+        "avg_cpu_ms": total_cpu_ms / n,
     }
 
 
@@ -63,6 +70,7 @@ def parse_args() -> argparse.Namespace:
     ap = argparse.ArgumentParser(description="Run benchmark metrics over dataset")
     ap.add_argument("--dataset", required=True, help="Dataset directory (legit/fraud or red_team subset)")
     ap.add_argument("--out", default="artifacts/benchmarks.csv", help="CSV output path")
+    ap.add_argument("--exhaustive", action="store_true", help="Run every forensic check (no early exit)")
     return ap.parse_args()
 
 
@@ -88,18 +96,20 @@ def main() -> None:
             subsets.append((f"red_team_{name}", sub))
 
     rows: List[List[str]] = []
-    header = ["subset", "id_type", "count", "authentic_ratio", "avg_ms", "fpr", "fnr", "tpr", "timestamp"]
+    header = ["subset", "id_type", "count", "authentic_ratio", "avg_ms", "avg_cpu_ms", "fpr", "fnr", "tpr", "timestamp"]
 
     # Aggregates for overall metrics
     overall_legit_count = 0
     overall_legit_fp = 0
     overall_legit_ms_sum = 0.0
+    overall_legit_cpu_sum = 0.0
     overall_fraud_count = 0
     overall_fraud_fn = 0
     overall_fraud_ms_sum = 0.0
+    overall_fraud_cpu_sum = 0.0
 
     for label, path in subsets:
-        stats = assess_dir(verifier, path)
+        stats = assess_dir(verifier, path, args.exhaustive)
         ts = datetime.now(timezone(timedelta(hours=8))).isoformat(timespec="seconds")
         count = int(stats["count"])
         authentic_count = int(stats.get("authentic_count", round(stats["authentic_ratio"] * max(1, count))))
@@ -115,10 +125,12 @@ def main() -> None:
             overall_legit_count += count
             overall_legit_fp += pred_fraud
             overall_legit_ms_sum += stats["avg_ms"] * count
+            overall_legit_cpu_sum += stats["avg_cpu_ms"] * count
         else:
             overall_fraud_count += count
             overall_fraud_fn += authentic_count
             overall_fraud_ms_sum += stats["avg_ms"] * count
+            overall_fraud_cpu_sum += stats["avg_cpu_ms"] * count
 
         rows.append([
             label,
@@ -126,6 +138,7 @@ def main() -> None:
             str(count),
             f"{stats['authentic_ratio']:.4f}",
             f"{stats['avg_ms']:.2f}",
+            f"{stats['avg_cpu_ms']:.2f}",
             f"{fpr:.4f}",
             f"{fnr:.4f}" if fnr != 0.0 else "",
             f"{tpr:.4f}" if isinstance(tpr, float) else "",
@@ -143,6 +156,7 @@ def main() -> None:
             str(overall_legit_count),
             f"{(overall_legit_auth / overall_legit_count):.4f}",
             f"{(overall_legit_ms_sum / max(1, overall_legit_count)):.2f}",
+            f"{(overall_legit_cpu_sum / max(1, overall_legit_count)):.2f}",
             f"{(overall_legit_fp / overall_legit_count):.4f}",
             "",
             "",
@@ -156,6 +170,7 @@ def main() -> None:
             str(overall_fraud_count),
             f"{(overall_fraud_fn / overall_fraud_count):.4f}",
             f"{(overall_fraud_ms_sum / max(1, overall_fraud_count)):.2f}",
+            f"{(overall_fraud_cpu_sum / max(1, overall_fraud_count)):.2f}",
             "",
             f"{(overall_fraud_fn / overall_fraud_count):.4f}",
             f"{(1.0 - (overall_fraud_fn / overall_fraud_count)):.4f}",
@@ -165,6 +180,7 @@ def main() -> None:
     total_count = overall_legit_count + overall_fraud_count
     if total_count > 0:
         overall_ms = (overall_legit_ms_sum + overall_fraud_ms_sum) / total_count
+        overall_cpu = (overall_legit_cpu_sum + overall_fraud_cpu_sum) / total_count
         overall_fp = overall_legit_fp
         overall_fn = overall_fraud_fn
         rows.append([
@@ -173,6 +189,7 @@ def main() -> None:
             str(total_count),
             "",
             f"{overall_ms:.2f}",
+            f"{overall_cpu:.2f}",
             f"{(overall_fp / overall_legit_count):.4f}" if overall_legit_count else "",
             f"{(overall_fn / overall_fraud_count):.4f}" if overall_fraud_count else "",
             "",
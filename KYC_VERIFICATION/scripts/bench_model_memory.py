@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Risk Model Memory Sharing Report
+
+Trains the risk ensemble locally, writes it both as legacy pickles and as
+flat memory-mapped artifacts, then forks N workers per format. Each worker
+loads the models, runs the warm-up prediction, and reports RSS before and
+after plus proportional (PSS) and private memory while all workers are alive,
+so pages shared through the page cache show up as a lower PSS/private cost.
+
+Linux only (reads /proc/self/smaps_rollup).
+
+Usage:
+  python3 scripts/bench_model_memory.py --workers 8 --trees 300
+"""
+
+import argparse
+import logging
+import multiprocessing as mp
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.risk.model_artifacts import load_model_artifact
+from src.risk.risk_engine import RiskEngine
+
+
+def memory_kb() -> Dict[str, int]:
+    stats = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                stats[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": stats.get("Rss", 0),
+        "pss": stats.get("Pss", 0),
+        "private": stats.get("Private_Clean", 0) + stats.get("Private_Dirty", 0),
+    }
+
+
+def worker(mode: str, model_dir: str, names, n_features: int, barrier, results) -> None:
+    before = memory_kb()
+    t0 = time.perf_counter()
+    if mode == "pickle":
+        models = [pickle.loads((Path(model_dir) / f"{name}.pkl").read_bytes()) for name in names]
+    else:
+        models = [load_model_artifact(Path(model_dir), name) for name in names]
+    for model in models:
+        model.predict_proba(np.zeros((1, n_features)))  # warm-up
+    load_ms = (time.perf_counter() - t0) * 1000
+
+    barrier.wait()  # every worker holds its models before anyone measures
+    after = memory_kb()
+    results.put((before, after, load_ms))
+    barrier.wait()
+
+
+def run_mode(mode: str, model_dir: str, names, n_features: int, workers: int):
+    ctx = mp.get_context("fork")
+    barrier, results = ctx.Barrier(workers), ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(mode, model_dir, names, n_features, barrier, results))
+             for _ in range(workers)]
+    for p in procs:
+        p.start()
+    rows = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return rows
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Report per-worker memory for pickled vs mmap model artifacts")
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--trees", type=int, default=300, help="Random forest size (unbounded depth)")
+    ap.add_argument("--train-samples", type=int, default=20000)
+    ap.add_argument("--seed", type=int, default=7)
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.getLogger(RiskEngine.__module__).setLevel(logging.WARNING)
+
+    engine = RiskEngine()
+    engine.models["random_forest"].set_params(n_estimators=args.trees, max_depth=None, min_samples_split=2)
+    rng = np.random.default_rng(args.seed)
+    X = rng.random((args.train_samples, len(engine.feature_names)))
+    y = (X[:, :6].mean(axis=1) + 0.3 * rng.standard_normal(args.train_samples) > 0.5).astype(int)
+    for model in engine.models.values():
+        model.fit(X, y)
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        for name, model in engine.models.items():
+            (Path(model_dir) / f"{name}.pkl").write_bytes(pickle.dumps(model))
+        engine.export_models(model_dir)
+        size_mb = sum(p.stat().st_size for p in Path(model_dir).rglob("*.npy")) / 1e6
+        print(f"models: {', '.join(engine.models)}; flat artifact size {size_mb:.1f} MB")
+
+        names = list(engine.models)
+        for mode in ("pickle", "flat"):
+            rows = run_mode(mode, model_dir, names, len(engine.feature_names), args.workers)
+            print(f"\n[{mode}] {args.workers} workers (MB)")
+            print(f"{'worker':>6} {'rss before':>11} {'rss after':>10} {'pss after':>10} {'private':>8} {'load ms':>8}")
+            for i, (before, after, load_ms) in enumerate(rows):
+                print(f"{i:>6} {before['rss'] / 1024:>11.1f} {after['rss'] / 1024:>10.1f} "
+                      f"{after['pss'] / 1024:>10.1f} {after['private'] / 1024:>8.1f} {load_ms:>8.1f}")
+            growth = np.mean([(a["private"] - b["private"]) / 1024 for b, a, _ in rows])
+            total_pss = sum(a["pss"] for _, a, _ in rows) / 1024
+            print(f"avg private growth per worker: {growth:.1f} MB; total PSS: {total_pss:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Multi-Frame Selection Benchmark
+
+Simulates capture sequences (default 30 frames each) of a rendered card or
+a test photo with camera-shake motion blur, tilt drift, glare flashes and
+exposure changes, then runs CaptureQualityAnalyzer.process_multi_frame
+exhaustively and with pre-score ranking / top-K / early exit. Reports CPU
+time, wall time and whether both pick the same frame.
+
+Usage:
+  python3 scripts/bench_multi_frame.py
+  python3 scripts/bench_multi_frame.py --sequences 20 --frames 30 --long-side 1920
+"""
+
+import argparse
+import glob
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.capture.quality_analyzer import CaptureQualityAnalyzer
+
+
+def render_card(rng: np.random.Generator, long_side: int) -> np.ndarray:
+    """Sharp, high-contrast card filling most of the frame on a dark table"""
+    width, height = long_side, int(long_side * 0.75)
+    frame = np.full((height, width, 3), 30, dtype=np.uint8)
+    x0, y0 = width // 16, height // 12
+    cv2.rectangle(frame, (x0, y0), (width - x0, height - y0), (235, 235, 235), -1)
+    for _ in range(10):
+        w, h = int(rng.integers(width // 10, width // 4)), int(rng.integers(height // 10, height // 4))
+        x, y = int(rng.integers(x0, width - x0 - w)), int(rng.integers(y0, height - y0 - h))
+        cv2.rectangle(frame, (x, y), (x + w, y + h), (25, 25, 25), -1)
+    for i in range(8):
+        cv2.putText(frame, f"REPUBLIKA NG PILIPINAS {int(rng.integers(10 ** 8)):09d}",
+                    (width // 11, height // 7 + i * height // 11), cv2.FONT_HERSHEY_SIMPLEX,
+                    width / 900, (120, 120, 120), max(1, long_side // 400))
+    return frame
+
+
+def motion_blur(image: np.ndarray, length: int, angle: float) -> np.ndarray:
+    if length <= 1:
+        return image
+    kernel = np.zeros((length, length), np.float32)
+    kernel[length // 2, :] = 1.0 / length
+    rotation = cv2.getRotationMatrix2D((length / 2 - 0.5, length / 2 - 0.5), angle, 1.0)
+    kernel = cv2.warpAffine(kernel, rotation, (length, length))
+    return cv2.filter2D(image, -1, kernel / max(kernel.sum(), 1e-6))
+
+
+def capture_sequence(base: np.ndarray, count: int, rng: np.random.Generator) -> list:
+    """Frames of one hand-held capture: shake settles, tilt drifts, glare flickers"""
+    height, width = base.shape[:2]
+    frames = []
+    tilt = float(rng.uniform(-4, 4))
+    for i in range(count):
+        tilt += float(rng.normal(0, 0.8))
+        shake = int(max(0, rng.normal(14 * (1 - i / count), 6)))
+        frame = cv2.warpAffine(base, cv2.getRotationMatrix2D((width / 2, height / 2), tilt, 1.0),
+                               (width, height), borderValue=(30, 30, 30))
+        frame = motion_blur(frame, shake, float(rng.uniform(0, 180)))
+        if rng.random() < 0.2:
+            center = (int(rng.integers(width // 4, 3 * width // 4)), int(rng.integers(height // 4, 3 * height // 4)))
+            cv2.ellipse(frame, center, (width // 8, height // 12), 0, 0, 360, (255, 255, 255), -1)
+        frame = cv2.convertScaleAbs(frame, alpha=float(rng.uniform(0.85, 1.1)), beta=float(rng.uniform(-10, 10)))
+        frames.append(frame)
+    return frames
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark early-exit multi-frame selection")
+    ap.add_argument("--sequences", type=int, default=12)
+    ap.add_argument("--frames", type=int, default=30)
+    ap.add_argument("--long-side", type=int, default=1920)
+    ap.add_argument("--seed", type=int, default=5)
+    return ap.parse_args()
+
+
+def timed(analyzer: CaptureQualityAnalyzer, frames: list, exhaustive: bool) -> tuple:
+    cpu, wall = time.process_time(), time.perf_counter()
+    result = analyzer.process_multi_frame(frames, exhaustive=exhaustive)
+    return result, (time.process_time() - cpu) * 1000, (time.perf_counter() - wall) * 1000
+
+
+def main() -> None:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+    rng = np.random.default_rng(args.seed)
+    photos = [cv2.imread(path) for path in sorted(glob.glob(str(PKG_ROOT / "tests/*.jpg")))]
+
+    analyzer = CaptureQualityAnalyzer()
+    same, both_pass, cpu_full, cpu_fast, wall_full, wall_fast, analyzed, gaps = 0, 0, [], [], [], [], [], []
+    for n in range(args.sequences):
+        if photos and n % 3 == 2:
+            base = photos[n % len(photos)]
+            scale = args.long_side / max(base.shape[:2])
+            base = cv2.resize(base, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        else:
+            base = render_card(rng, args.long_side)
+        frames = capture_sequence(base, args.frames, rng)
+
+        full, cpu, wall = timed(analyzer, frames, exhaustive=True)
+        cpu_full.append(cpu)
+        wall_full.append(wall)
+        fast, cpu, wall = timed(analyzer, frames, exhaustive=False)
+        cpu_fast.append(cpu)
+        wall_fast.append(wall)
+
+        analyzed.append(fast["consensus"]["frames_analyzed"])
+        same += fast["consensus"]["best_frame_index"] == full["consensus"]["best_frame_index"]
+        passing = [r["consensus"]["best_score"] >= analyzer.pass_threshold for r in (full, fast)]
+        both_pass += passing[0] == passing[1]
+        gaps.append(full["consensus"]["best_score"] - fast["consensus"]["best_score"])
+    analyzer.close()
+
+    print(f"sequences:              {args.sequences} x {args.frames} frames, long side {args.long_side}")
+    print(f"same frame chosen:      {same}/{args.sequences}")
+    print(f"same pass/fail:         {both_pass}/{args.sequences}  max score gap {max(gaps):.4f}")
+    print(f"frames fully analyzed:  mean {statistics.fmean(analyzed):.1f}")
+    print(f"exhaustive              cpu={statistics.fmean(cpu_full):8.1f} ms  wall={statistics.fmean(wall_full):8.1f} ms")
+    print(f"ranked + early exit     cpu={statistics.fmean(cpu_fast):8.1f} ms  wall={statistics.fmean(wall_fast):8.1f} ms")
+    print(f"cpu reduction:          {1 - sum(cpu_fast) / sum(cpu_full):.1%}")
+
+
+if __name__ == "__main__":
+    main()
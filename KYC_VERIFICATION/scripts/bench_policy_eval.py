@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Risk Policy Evaluation Benchmark
+
+Generates synthetic policy sets of increasing size over a fixed vocabulary of
+verification fields, then times CompiledPolicySet.match against the previous
+evaluate-every-policy loop on the same requests. Compiled cost tracks the
+number of distinct dispatch fields rather than the number of policies.
+
+Usage:
+  python3 scripts/bench_policy_eval.py --sizes 10,50,100,250,500 --requests 5000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.risk.risk_engine import CompiledPolicySet, DecisionType, RiskPolicy
+
+SECTIONS = ["device", "aml", "document", "biometrics", "velocity", "network"]
+
+
+def field_vocabulary(size: int) -> List[str]:
+    return [f"{SECTIONS[i % len(SECTIONS)]}.flag_{i}" for i in range(size)]
+
+
+def make_policies(rng: random.Random, count: int, fields: List[str]) -> List[RiskPolicy]:
+    policies = []
+    for i in range(count):
+        primary, secondary = rng.sample(fields, 2)
+        conditions = {primary: True}
+        if rng.random() < 0.4:
+            conditions[secondary] = rng.choice([True, False, "high"])
+        policies.append(RiskPolicy(
+            name=f"policy_{i}", enabled=True, priority=rng.randint(1, 5),
+            conditions=conditions, action=rng.choice(list(DecisionType)), message=f"policy {i}",
+        ))
+    return policies
+
+
+def make_request(rng: random.Random, fields: List[str]) -> Dict[str, Any]:
+    data: Dict[str, Any] = {}
+    for field in fields:
+        section, flag = field.split(".")
+        # Mostly clean applicants: the common case scans every policy in a loop
+        data.setdefault(section, {})[flag] = rng.random() < 0.01
+    return data
+
+
+def loop_match(policies: List[RiskPolicy], data: Dict[str, Any]) -> Optional[RiskPolicy]:
+    """Previous _check_policies: every policy, dotted paths split per condition"""
+    for policy in policies:
+        matched = True
+        for path, expected in policy.conditions.items():
+            value: Any = data
+            for key in path.split("."):
+                value = value.get(key) if isinstance(value, dict) else None
+            if value != expected:
+                matched = False
+                break
+        if matched:
+            return policy
+    return None
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark compiled vs looped policy evaluation")
+    ap.add_argument("--sizes", default="10,50,100,250,500", help="Comma-separated policy counts")
+    ap.add_argument("--fields", type=int, default=60, help="Distinct condition fields")
+    ap.add_argument("--requests", type=int, default=5000)
+    ap.add_argument("--seed", type=int, default=7)
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    rng = random.Random(args.seed)
+    fields = field_vocabulary(args.fields)
+    requests = [make_request(rng, fields) for _ in range(args.requests)]
+
+    print(f"{'policies':>8} {'compile ms':>11} {'loop us':>9} {'compiled us':>12} {'speedup':>8} {'growth':>7}")
+    base = None
+    for size in [int(s) for s in args.sizes.split(",")]:
+        policies = sorted(make_policies(rng, size, fields), key=lambda p: p.priority)
+
+        t0 = time.perf_counter()
+        compiled = CompiledPolicySet(policies)
+        compile_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        expected = [loop_match(policies, data) for data in requests]
+        loop_us = (time.perf_counter() - t0) / len(requests) * 1e6
+
+        t0 = time.perf_counter()
+        actual = [compiled.match(data) for data in requests]
+        compiled_us = (time.perf_counter() - t0) / len(requests) * 1e6
+
+        if actual != expected:
+            raise SystemExit(f"compiled evaluator disagrees with loop at {size} policies")
+        base = base or compiled_us
+        print(f"{size:>8} {compile_ms:>11.2f} {loop_us:>9.1f} {compiled_us:>12.1f} "
+              f"{loop_us / compiled_us:>7.1f}x {compiled_us / base:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
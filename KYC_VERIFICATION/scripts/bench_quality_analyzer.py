@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Capture Quality Benchmark
+
+Runs CaptureQualityAnalyzer.analyze_frame over an evaluation set built from
+the test photos, synthetic cards (upscaled to phone-capture size) and
+rendered high-contrast cards that clear the pass threshold, each with blur,
+glare, tilt and exposure variants. Compares the configured analysis
+resolution against full-resolution analysis: per-frame latency, pass/fail
+agreement and agreement of coaching hints (issue + severity).
+
+Usage:
+  python3 scripts/bench_quality_analyzer.py
+  python3 scripts/bench_quality_analyzer.py --long-side 4000 --analysis-max-side 1280
+"""
+
+import argparse
+import glob
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.capture.quality_analyzer import CaptureQualityAnalyzer
+
+
+def variants(image: np.ndarray) -> list:
+    """Clean capture plus blurred, glared, tilted, dark and overexposed copies"""
+    height, width = image.shape[:2]
+    glare = image.copy()
+    cv2.ellipse(glare, (width // 2, height // 3), (width // 5, height // 8), 0, 0, 360, (255, 255, 255), -1)
+    rotation = cv2.getRotationMatrix2D((width / 2, height / 2), 12, 1.0)
+    return [
+        image,
+        cv2.GaussianBlur(image, (0, 0), 2),
+        cv2.GaussianBlur(image, (0, 0), 6),
+        glare,
+        cv2.warpAffine(image, rotation, (width, height), borderValue=(255, 255, 255)),
+        cv2.convertScaleAbs(image, alpha=0.4),
+        cv2.convertScaleAbs(image, alpha=1.5, beta=40),
+    ]
+
+
+def render_card(rng: np.random.Generator, long_side: int) -> np.ndarray:
+    """Sharp, high-contrast card filling most of the frame on a dark table"""
+    width, height = long_side, int(long_side * 0.75)
+    frame = np.full((height, width, 3), 30, dtype=np.uint8)
+    x0, y0 = width // 16, height // 12
+    x1, y1 = width - x0, height - y0
+    cv2.rectangle(frame, (x0, y0), (x1, y1), (235, 235, 235), -1)
+    for _ in range(10):
+        w, h = int(rng.integers(width // 10, width // 4)), int(rng.integers(height // 10, height // 4))
+        x, y = int(rng.integers(x0, x1 - w)), int(rng.integers(y0, y1 - h))
+        cv2.rectangle(frame, (x, y), (x + w, y + h), (25, 25, 25), -1)
+    scale = long_side / 800
+    for i in range(8):
+        cv2.putText(frame, f"REPUBLIKA NG PILIPINAS {int(rng.integers(10 ** 8)):09d}",
+                    (int(70 * scale), int((90 + i * 55) * scale)), cv2.FONT_HERSHEY_SIMPLEX,
+                    0.9 * scale, (120, 120, 120), max(1, int(2 * scale)))
+    return frame
+
+
+def load_frames(long_side: int, limit: int, rendered: int = 0) -> list:
+    paths = sorted(glob.glob(str(PKG_ROOT / "tests/*.jpg")))
+    paths += sorted(glob.glob(str(PKG_ROOT / "datasets/synthetic/*/*.ppm")))[:limit]
+    frames = []
+    for path in paths:
+        image = cv2.imread(path)
+        if image is None:
+            continue
+        scale = long_side / max(image.shape[:2])
+        image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+        frames.extend(variants(image))
+    rng = np.random.default_rng(11)
+    for _ in range(rendered):
+        card = render_card(rng, long_side)
+        frames.extend(variants(card))
+        height, width = card.shape[:2]
+        # Near-threshold variants: mild blur and small tilt
+        tilt = cv2.getRotationMatrix2D((width / 2, height / 2), 3, 1.0)
+        frames.append(cv2.GaussianBlur(card, (0, 0), 0.8))
+        frames.append(cv2.warpAffine(card, tilt, (width, height), borderValue=(255, 255, 255)))
+    return frames
+
+
+def outcome(analyzer: CaptureQualityAnalyzer, metrics, hints) -> tuple:
+    return (metrics.overall_score >= analyzer.pass_threshold,
+            tuple(sorted((h.issue.value, h.severity) for h in hints)))
+
+
+def run(analyzer: CaptureQualityAnalyzer, frames: list) -> tuple:
+    latencies, outcomes = [], []
+    for frame in frames:
+        t0 = time.perf_counter()
+        metrics, hints = analyzer.analyze_frame(frame)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        outcomes.append(outcome(analyzer, metrics, hints))
+    return latencies, outcomes
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark capture quality analysis resolution")
+    ap.add_argument("--long-side", type=int, default=2560, help="Resize sources to this long side")
+    ap.add_argument("--limit", type=int, default=6, help="Synthetic cards to include")
+    ap.add_argument("--rendered", type=int, default=6, help="Rendered high-contrast cards to include")
+    ap.add_argument("--analysis-max-side", type=int, default=None,
+                    help="Override the configured analysis_max_side")
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+    frames = load_frames(args.long_side, args.limit, args.rendered)
+
+    full = CaptureQualityAnalyzer()
+    full.config["analysis_max_side"] = None
+    fast = CaptureQualityAnalyzer()
+    if args.analysis_max_side:
+        fast.config["analysis_max_side"] = args.analysis_max_side
+
+    full_ms, expected = run(full, frames)
+    fast_ms, got = run(fast, frames)
+
+    height, width = frames[0].shape[:2]
+    print(f"frames:                 {len(frames)} ({width}x{height}), analysis_max_side={fast.config['analysis_max_side']}")
+    print(f"pass/fail agreement:    {sum(a[0] == b[0] for a, b in zip(expected, got))}/{len(frames)}")
+    print(f"hint agreement:         {sum(a == b for a, b in zip(expected, got))}/{len(frames)}")
+    print(f"frames passing:         {sum(o[0] for o in expected)} full / {sum(o[0] for o in got)} analysis")
+    for name, latencies in (("full_resolution", full_ms), ("analysis_level", fast_ms)):
+        print(f"{name:<22}  mean={statistics.fmean(latencies):8.2f} ms  p50={statistics.median(latencies):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
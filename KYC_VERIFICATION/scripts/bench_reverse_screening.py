@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Reverse-Match Monitoring Benchmark
+
+Builds a synthetic monitored customer base, applies a sanctions/PEP list
+delta through AMLScreener.apply_list_delta, and compares the wall time with
+an extrapolated full re-screen of the customer base against the same delta.
+Fails when a delta name returns more than --max-candidates customers from the
+blocking index, since the delta cost must not grow with the customer base.
+
+Usage:
+  python3 scripts/bench_reverse_screening.py --customers 1000000 --delta 200
+  python3 scripts/bench_reverse_screening.py --customers 100000 --max-candidates 50
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.screening.aml_screener import AMLScreener, PEPEntity, RiskLevel, SanctionedEntity
+
+SYLLABLES = ["ma", "ri", "an", "jo", "se", "lu", "ka", "to", "ne", "ba", "di", "go",
+             "ra", "mon", "li", "za", "te", "do", "ro", "qui", "no", "pe", "dro", "sa"]
+
+
+def make_name_pool(rng: random.Random, size: int, parts: int) -> list:
+    pool = set()
+    while len(pool) < size:
+        pool.add("".join(rng.choice(SYLLABLES) for _ in range(parts)).capitalize())
+    return sorted(pool)
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark reverse matching on list deltas")
+    ap.add_argument("--customers", type=int, default=1_000_000, help="Synthetic customer base size")
+    ap.add_argument("--delta", type=int, default=200, help="Number of new/changed list entries")
+    ap.add_argument("--sample", type=int, default=2000, help="Customers timed for the full re-screen estimate")
+    ap.add_argument("--max-candidates", type=int, default=100,
+                    help="Fail if any delta name returns more blocking candidates")
+    ap.add_argument("--seed", type=int, default=7)
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    rng = random.Random(args.seed)
+    logging.getLogger(AMLScreener.__module__).setLevel(logging.WARNING)
+
+    first_names = make_name_pool(rng, 3000, 3)
+    last_names = make_name_pool(rng, 8000, 4)
+
+    screener = AMLScreener()
+    customers = []
+    t0 = time.perf_counter()
+    for i in range(args.customers):
+        data = {
+            "name": f"{rng.choice(first_names)} {rng.choice(last_names)}",
+            "nationality": "PH",
+        }
+        customers.append(data)
+        screener.monitor_continuous(f"CUST-{i:07d}", data)
+    index_s = time.perf_counter() - t0
+
+    # Half of the delta names existing customers so the run produces alerts
+    sanctions, peps = [], []
+    for j in range(args.delta):
+        if j % 2 == 0:
+            name = customers[rng.randrange(len(customers))]["name"]
+        else:
+            name = f"{rng.choice(first_names)} {rng.choice(last_names)}"
+        if j % 4 == 3:
+            peps.append(PEPEntity(
+                entity_id=f"PEP-B{j:04d}", name=name, position="Councilor", country="PH",
+                risk_level=RiskLevel.MEDIUM, start_date="2025-01-01", end_date=None,
+                is_current=True, relationships=[],
+            ))
+        else:
+            sanctions.append(SanctionedEntity(
+                entity_id=f"OFAC-B{j:04d}", primary_name=name, aliases=[],
+                date_of_birth=None, nationality="PH", addresses=[], identifiers={},
+                sanction_programs=["SDN"], listing_date="2025-01-01", source="OFAC",
+            ))
+
+    t0 = time.perf_counter()
+    alerts = screener.apply_list_delta(sanctions=sanctions, peps=peps)
+    delta_s = time.perf_counter() - t0
+
+    delta_names = [e.primary_name for e in sanctions] + [p.name for p in peps]
+    candidate_counts = [len(screener.monitoring_index.candidates(name)) for name in delta_names]
+
+    sample = customers[: max(1, min(args.sample, len(customers)))]
+    t0 = time.perf_counter()
+    for data in sample:
+        screener._screen_sanctions(data["name"], None, data["nationality"], {}, entities=sanctions)
+        screener._screen_pep(data["name"], data["nationality"], peps=peps)
+    full_s = (time.perf_counter() - t0) / len(sample) * len(customers)
+
+    print(f"customers indexed:        {len(screener.monitoring_index):,} ({index_s:.1f}s)")
+    print(f"delta entries:            {len(sanctions)} sanctions, {len(peps)} PEP")
+    print(f"alerts emitted:           {len(alerts)}")
+    print(f"reverse match (delta):    {delta_s * 1000:.1f} ms")
+    print(f"full re-screen (est.):    {full_s:.1f} s")
+    print(f"candidates per name:      mean {sum(candidate_counts) / len(candidate_counts):.1f}, "
+          f"max {max(candidate_counts)}")
+    print(f"speedup:                  {full_s / max(delta_s, 1e-9):,.0f}x")
+
+    if max(candidate_counts) > args.max_candidates:
+        raise SystemExit(f"blocking returned {max(candidate_counts)} candidates for one name "
+                         f"(bound {args.max_candidates})")
+
+
+if __name__ == "__main__":
+    main()
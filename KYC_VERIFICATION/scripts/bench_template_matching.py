@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Template Matching Benchmark
+
+Loads DocumentClassifier with a synthetic template set (the built-in
+templates plus jittered copies, 200 by default) and compares:
+
+- template matching: the per-template Python loop that _match_templates
+  used before, against the vectorized TemplateIndex pass
+- feature extraction: every extractor preparing its own gray/resize/edge
+  views, against one shared PreprocessedImage per image
+
+Template scores and decisions must agree exactly.
+
+Usage:
+  python3 scripts/bench_template_matching.py
+  python3 scripts/bench_template_matching.py --templates 200 --long-side 4000
+"""
+
+import argparse
+import glob
+import logging
+import random
+import statistics
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.classification.document_classifier import DocumentClassifier, TemplateIndex
+
+
+def loop_match(templates: dict, features: dict) -> dict:
+    """Previous _match_templates: one Python pass per template"""
+    scores = {}
+    for template in templates.values():
+        score, weight_sum = 0.0, 0.0
+        if "aspect_ratio" in features:
+            score += max(0, 1 - abs(features["aspect_ratio"] - template.aspect_ratio) * 2) * 0.3
+            weight_sum += 0.3
+        if "dominant_colors" in features:
+            best = 0.0
+            for c1 in features["dominant_colors"]:
+                for c2 in template.color_scheme:
+                    dist = np.sqrt(sum((a - b) ** 2 for a, b in zip(c1, c2)))
+                    best = max(best, 1 - dist / 441.67)
+            score += best * 0.2
+            weight_sum += 0.2
+        if "detected_features" in features:
+            matches = sum(1 for f in features["detected_features"] if f in template.key_features)
+            score += matches / max(len(template.key_features), 1) * 0.3
+            weight_sum += 0.3
+        if template.mrz_format:
+            if features.get("has_mrz", False):
+                score += 0.2
+            weight_sum += 0.2
+        scores[template.type.value] = score / weight_sum if weight_sum > 0 else 0.0
+    return scores
+
+
+def jittered_templates(base: dict, count: int, rng: random.Random) -> dict:
+    templates = dict(base)
+    originals = list(base.values())
+    while len(templates) < count:
+        source = rng.choice(originals)
+        colors = [tuple(int(np.clip(v + rng.randint(-40, 40), 0, 255)) for v in color)
+                  for color in source.color_scheme]
+        template = replace(source, id=f"{source.id}_var{len(templates)}",
+                           aspect_ratio=source.aspect_ratio * rng.uniform(0.9, 1.1),
+                           color_scheme=colors)
+        templates[template.id] = template
+    return templates
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark vectorized template matching and shared preprocessing")
+    ap.add_argument("--templates", type=int, default=200)
+    ap.add_argument("--limit", type=int, default=40, help="Max images from the synthetic set")
+    ap.add_argument("--long-side", type=int, default=0, help="Resize images to this long side (0 = as is)")
+    ap.add_argument("--seed", type=int, default=7)
+    return ap.parse_args()
+
+
+def mean_ms(latencies: list) -> str:
+    return f"mean={statistics.fmean(latencies):8.3f} ms  p50={statistics.median(latencies):8.3f} ms"
+
+
+def main() -> None:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+    paths = sorted(glob.glob(str(PKG_ROOT / "datasets/synthetic/*/*.ppm")))[:args.limit]
+    images = [cv2.imread(path) for path in paths]
+    if args.long_side:
+        images = [cv2.resize(image, None, fx=args.long_side / max(image.shape[:2]),
+                             fy=args.long_side / max(image.shape[:2]), interpolation=cv2.INTER_CUBIC)
+                  for image in images]
+    if not images:
+        print("no images found")
+        return
+
+    classifier = DocumentClassifier()
+    classifier.templates = jittered_templates(classifier.templates, args.templates, random.Random(args.seed))
+    classifier.template_index = TemplateIndex.build(classifier.templates)
+    classifier._extract_features(images[0])
+
+    shared_ms, separate_ms, loop_ms, vector_ms = [], [], [], []
+    same, max_delta = 0, 0.0
+    for image in images:
+        t0 = time.perf_counter()
+        features = classifier._extract_features(image)
+        shared_ms.append((time.perf_counter() - t0) * 1000)
+
+        t0 = time.perf_counter()
+        separate = {}
+        for extractor in classifier.feature_extractors.values():
+            separate.update(extractor(image))
+        separate_ms.append((time.perf_counter() - t0) * 1000)
+
+        t0 = time.perf_counter()
+        expected = loop_match(classifier.templates, features)
+        loop_ms.append((time.perf_counter() - t0) * 1000)
+
+        t0 = time.perf_counter()
+        scores = classifier._match_templates(features)
+        vector_ms.append((time.perf_counter() - t0) * 1000)
+
+        same += max(expected, key=expected.get) == max(scores, key=scores.get)
+        max_delta = max(max_delta, max(abs(expected[k] - scores[k]) for k in expected))
+
+    height, width = images[0].shape[:2]
+    print(f"images:                 {len(images)} ({width}x{height}), templates: {len(classifier.templates)}")
+    print(f"decision agreement:     {same}/{len(images)}  max score diff {max_delta:.2e}")
+    print(f"features, separate      {mean_ms(separate_ms)}")
+    print(f"features, shared        {mean_ms(shared_ms)}")
+    print(f"match, per-template     {mean_ms(loop_ms)}")
+    print(f"match, vectorized       {mean_ms(vector_ms)}")
+
+
+if __name__ == "__main__":
+    main()
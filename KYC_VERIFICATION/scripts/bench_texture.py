@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Texture Analysis Benchmark
+
+Times AuthenticityVerifier.texture_analysis against the previous
+implementation (twelve full-resolution Gabor passes, filter2D box
+statistics) on captures built from the test photos, or a synthetic texture
+when the photos are missing. Reports mean latency, the speedup and the
+lowest correlation between the old and new local-variance maps.
+
+Usage:
+  python3 scripts/bench_texture.py
+  python3 scripts/bench_texture.py --sizes 0.5 2 12 --repeats 5
+"""
+
+import argparse
+import glob
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.forensics.authenticity_verifier import AuthenticityVerifier
+
+
+def legacy_texture_variance(gray: np.ndarray) -> np.ndarray:
+    """Previous texture_analysis map, including the per-call kernel construction"""
+    responses = []
+    for freq in [0.1, 0.2, 0.3]:
+        for theta in [0, 45, 90, 135]:
+            kernel = cv2.getGaborKernel((31, 31), 4.0, theta * np.pi / 180, 10.0, freq, 0)
+            responses.append(cv2.filter2D(gray, cv2.CV_32F, kernel))
+    texture_map = np.mean(responses, axis=0)
+    box = np.ones((15, 15)) / 225
+    local_mean = cv2.filter2D(texture_map, cv2.CV_32F, box)
+    return cv2.filter2D(texture_map ** 2, cv2.CV_32F, box) - local_mean ** 2
+
+
+def base_images() -> list:
+    photos = [cv2.imread(p) for p in sorted(glob.glob(str(PKG_ROOT / "tests" / "*.jpg")))]
+    photos = [p for p in photos if p is not None]
+    if photos:
+        return photos
+    noise = np.random.default_rng(0).normal(size=(1536, 2048)).astype(np.float32)
+    texture = cv2.normalize(cv2.GaussianBlur(noise, (0, 0), 2.0), None, 20, 235, cv2.NORM_MINMAX)
+    return [cv2.cvtColor(texture.astype(np.uint8), cv2.COLOR_GRAY2BGR)]
+
+
+def capture(photo: np.ndarray, megapixels: float) -> np.ndarray:
+    h, w = photo.shape[:2]
+    factor = np.sqrt(megapixels * 1e6 / (h * w))
+    size = (int(round(w * factor)), int(round(h * factor)))
+    return cv2.resize(photo, size, interpolation=cv2.INTER_AREA if factor < 1 else cv2.INTER_CUBIC)
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark Gabor texture analysis")
+    ap.add_argument("--sizes", type=float, nargs="+", default=[0.5, 2, 12], help="Capture sizes in megapixels")
+    ap.add_argument("--repeats", type=int, default=3, help="Timed runs per photo and size")
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.disable(logging.WARNING)
+    verifier = AuthenticityVerifier()
+    photos = base_images()
+
+    for megapixels in args.sizes:
+        legacy_ms, new_ms, correlations = [], [], []
+        for photo in photos:
+            image = capture(photo, megapixels)
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            verifier.texture_analysis(image)  # build the kernel for this scale
+            for _ in range(args.repeats):
+                t0 = time.perf_counter()
+                verifier.texture_analysis(image)
+                new_ms.append((time.perf_counter() - t0) * 1000)
+            t0 = time.perf_counter()
+            reference = legacy_texture_variance(gray)
+            legacy_ms.append((time.perf_counter() - t0) * 1000)
+            current = verifier._texture_variance(gray)
+            correlations.append(float(np.corrcoef(reference.ravel(), current.ravel())[0, 1]))
+
+        print(f"{megapixels:>5.1f} MP  mean={statistics.fmean(new_ms):8.1f} ms  "
+              f"p50={statistics.median(new_ms):8.1f} ms  legacy map={statistics.fmean(legacy_ms):8.1f} ms  "
+              f"speedup x{statistics.fmean(legacy_ms) / statistics.fmean(new_ms):5.1f}  "
+              f"min r={min(correlations):.4f}")
+
+
+if __name__ == "__main__":
+    main()
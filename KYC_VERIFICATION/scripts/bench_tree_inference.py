@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tree Ensemble Inference Benchmark
+
+Trains the risk engine's random forest and gradient boosting models with
+their configured hyperparameters, flattens them with flatten_model, and
+compares sklearn predict_proba against the flat-array evaluator at several
+batch sizes. Reports median latency per call and the largest probability
+difference.
+
+Usage:
+  python3 scripts/bench_tree_inference.py --batch-sizes 1,10,1000 --repeats 200
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.risk.model_artifacts import flatten_model
+from src.risk.risk_engine import RiskEngine
+
+
+def median_ms(fn, X, repeats: int) -> float:
+    fn(X)  # warm-up
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn(X)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Compare sklearn and flat-array tree inference latency")
+    ap.add_argument("--batch-sizes", default="1,10,1000")
+    ap.add_argument("--repeats", type=int, default=200, help="Timed calls per batch size (fewer for large batches)")
+    ap.add_argument("--train-samples", type=int, default=5000)
+    ap.add_argument("--seed", type=int, default=7)
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.getLogger(RiskEngine.__module__).setLevel(logging.WARNING)
+    engine = RiskEngine()
+    rng = np.random.default_rng(args.seed)
+    n_features = len(engine.feature_names)
+    X = rng.random((args.train_samples, n_features))
+    y = (X[:, :6].mean(axis=1) + 0.15 * rng.standard_normal(args.train_samples) > 0.5).astype(int)
+    X_eval = rng.random((max(int(b) for b in args.batch_sizes.split(",")), n_features))
+
+    print(f"{'model':<16} {'batch':>6} {'sklearn ms':>11} {'flat ms':>9} {'speedup':>8} {'max |diff|':>11}")
+    for name, model in engine.models.items():
+        model.fit(X, y)
+        flat = flatten_model(model)
+        for batch in [int(b) for b in args.batch_sizes.split(",")]:
+            Xb = X_eval[:batch]
+            repeats = max(5, args.repeats // max(1, batch // 10))
+            sk_ms = median_ms(model.predict_proba, Xb, repeats)
+            flat_ms = median_ms(flat.predict_proba, Xb, repeats)
+            diff = float(np.abs(model.predict_proba(Xb) - flat.predict_proba(Xb)).max())
+            print(f"{name:<16} {batch:>6} {sk_ms:>11.3f} {flat_ms:>9.3f} {sk_ms / flat_ms:>7.1f}x {diff:>11.1e}")
+
+
+if __name__ == "__main__":
+    main()
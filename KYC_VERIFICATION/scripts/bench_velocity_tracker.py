@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Velocity Tracker Benchmark
+
+Streams a synthetic high-rate transaction feed (default 100k transactions per
+simulated second, spread over a customer pool) through VelocityTracker and
+reports the achieved add + check throughput and per-call latency.
+
+Usage:
+  python3 scripts/bench_velocity_tracker.py --transactions 1000000 --rate 100000 --customers 5000
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.monitoring.transaction_monitor import MANILA_TZ, Transaction, TransactionType, VelocityTracker
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark sliding-window velocity checks")
+    ap.add_argument("--transactions", type=int, default=1_000_000, help="Transactions to stream")
+    ap.add_argument("--rate", type=int, default=100_000, help="Simulated transactions per second")
+    ap.add_argument("--customers", type=int, default=5000, help="Customer pool size")
+    ap.add_argument("--seed", type=int, default=7)
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    rng = random.Random(args.seed)
+    tracker = VelocityTracker()
+    step = timedelta(seconds=1 / args.rate)
+    now = datetime(2025, 1, 1, tzinfo=MANILA_TZ)
+
+    # Build the feed up front so only tracker work is timed
+    feed = []
+    for i in range(args.transactions):
+        now += step
+        feed.append((now, Transaction(
+            transaction_id=f"TX{i:08d}",
+            customer_id=f"C{rng.randrange(args.customers):06d}",
+            amount=round(rng.uniform(100, 200000), 2),
+            currency="PHP",
+            transaction_type=TransactionType.PAYMENT,
+            timestamp=now.isoformat(),
+        )))
+
+    exceeded = 0
+    t0 = time.perf_counter()
+    for when, txn in feed:
+        tracker.add_transaction(txn, now=when)
+        if tracker.check_velocity(txn.customer_id, now=when)[0]:
+            exceeded += 1
+    elapsed = time.perf_counter() - t0
+
+    simulated = (feed[-1][0] - feed[0][0]).total_seconds() if feed else 0.0
+    print(f"transactions:        {len(feed):,} ({simulated:.1f}s simulated at {args.rate:,}/s)")
+    print(f"customers:           {len(tracker.transactions):,}")
+    print(f"elapsed:             {elapsed:.2f}s")
+    print(f"add+check rate:      {len(feed) / max(elapsed, 1e-9):,.0f} txn/s")
+    print(f"avg per transaction: {elapsed / max(len(feed), 1) * 1e6:.1f} us")
+    print(f"velocity exceeded:   {exceeded:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Alert File Migration
+
+Imports legacy one-file-per-alert JSON files (alerts/<alert_id>.json) into the
+indexed SQLite alert store used by AlertStorage.
+
+Usage:
+  python3 scripts/migrate_alert_files.py --source alerts --store alerts [--delete]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Ensure package root is on sys.path so `src` can be imported when running from repo root
+PKG_ROOT = Path(__file__).resolve().parents[1]  # .../KYC VERIFICATION
+if str(PKG_ROOT) not in sys.path:
+    sys.path.append(str(PKG_ROOT))
+
+from src.monitoring.transaction_monitor import AlertStorage
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Migrate per-file alerts into the indexed alert store")
+    ap.add_argument("--source", required=True, help="Directory containing <alert_id>.json files")
+    ap.add_argument("--store", help="Alert store directory (defaults to --source)")
+    ap.add_argument("--batch-size", type=int, default=5000, help="Alerts per insert transaction")
+    ap.add_argument("--delete", action="store_true", help="Delete files after they are committed")
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    source = Path(args.source).resolve()
+    storage = AlertStorage(Path(args.store).resolve() if args.store else source)
+    try:
+        result = storage.migrate_json_files(source, batch_size=args.batch_size,
+                                            delete_migrated=args.delete)
+        print(f"✅ Migrated {result['migrated']} alert(s) into {storage.db_path} "
+              f"({result['failed']} failed)")
+    finally:
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -31,9 +31,13 @@ from .metrics import (
     RISK_DRIFT_SCORE,
     FAIRNESS_AUDIT_DUE,
     update_vendor_metrics,
+    update_pool_metrics,
+    update_extraction_cache_metrics,
 )
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 from src.observability.otel import setup_tracing
+from src.extraction.extractor_pool import PoolTimeoutError
+from starlette.concurrency import run_in_threadpool
 import asyncio
 from collections import deque
 
@@ -143,6 +147,9 @@ def get_component(component_name: str):
         elif component_name == "review_console":
             from src.review.review_console import ReviewConsole
             _components[component_name] = ReviewConsole()
+        elif component_name == "evidence_extractor_pool":
+            from src.extraction.extractor_pool import create_extractor_pool
+            _components[component_name] = create_extractor_pool()
     return _components.get(component_name)
 
 
@@ -251,6 +258,22 @@ def get_application() -> FastAPI:
             setup_tracing(app)
         except Exception:
             pass
+        # SIGHUP refreshes the shared threshold snapshot without a restart
+        try:
+            from src.config.threshold_manager import install_reload_signal_handler
+            install_reload_signal_handler()
+        except Exception:
+            pass
+        # Build the extractor pool before the first /extract request
+        try:
+            get_component("evidence_extractor_pool")
+        except Exception as e:
+            logger.warning(f"Extractor pool warm-up failed: {e}")
+        # Load the risk models and run a dummy prediction before the first /score request
+        try:
+            get_component("risk_scorer").warm_up()
+        except Exception as e:
+            logger.warning(f"Risk model warm-up failed: {e}")
         # Disable background TaskGroup loop to avoid TaskGroup exceptions in /metrics
         # Drift and fairness gauges will be updated lazily elsewhere if needed.
      
@@ -456,10 +479,28 @@ async def extract_data(request: ExtractRequest):
             api_doc_type_str = _map.get(str(classification.document_type.value), "UNKNOWN")
             doc_type = DocumentType(api_doc_type_str)
 
-        # Use unified extractor
-        from src.extraction.evidence_extractor import EvidenceExtractor
-        extractor = EvidenceExtractor()
-        result = extractor.extract_all(image, doc_type.value)
+        # Use unified extractor from the pre-initialized pool; extraction is
+        # CPU-bound, so run it off the event loop
+        extractor_pool = get_component("evidence_extractor_pool")
+        extractors = ["ocr", "nfc"]
+        if request.extract_mrz:
+            extractors.append("mrz")
+        if request.extract_barcode:
+            extractors.append("barcode")
+        if request.extract_face:
+            extractors.append("face")
+
+        def _extract():
+            with extractor_pool.acquire() as extractor:
+                return extractor.extract_all(image, doc_type.value, extractors=extractors)
+
+        try:
+            result = await run_in_threadpool(_extract)
+        except PoolTimeoutError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={"error": str(e), "error_code": "EXTRACTOR_POOL_EXHAUSTED"}
+            )
 
         # Summarize OCR
         ocr_text = {}
@@ -503,12 +544,17 @@ async def extract_data(request: ExtractRequest):
             metadata={
                 "processing_time_ms": int((time.time() - start_time) * 1000),
                 "ocr_engine": "tesseract",
-                "extraction_timestamp": get_timestamp()
+                "extraction_timestamp": get_timestamp(),
+                "extractors": result.metadata.get("extractors", {}),
+                "partial": result.metadata.get("partial", False),
+                "cache_hit": result.metadata.get("cache_hit", False)
             }
         )
 
         return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1072,6 +1118,11 @@ async def get_metrics():
             "risk_scorer": True
         }
     }
+    extractor_pool = _components.get("evidence_extractor_pool")
+    if extractor_pool is not None:
+        metrics["pools"] = extractor_pool.get_metrics()
+        if extractor_pool.result_cache is not None:
+            metrics["extraction_cache"] = extractor_pool.result_cache.get_metrics()
     
     try:
         return {
@@ -1095,6 +1146,12 @@ async def prometheus_metrics():
     except Exception:
         # Best-effort; avoid blocking scrape
         pass
+    try:
+        extractor_pool = _components.get("evidence_extractor_pool")
+        update_pool_metrics(extractor_pool)
+        update_extraction_cache_metrics(getattr(extractor_pool, "result_cache", None))
+    except Exception:
+        pass
     data = generate_latest()
     return Response(content=data, media_type=CONTENT_TYPE_LATEST)
 
@@ -53,6 +53,11 @@ issuer_registry = IssuerRegistry()
 risk_engine = RiskEngine()
 aml_screener = AMLScreener()
 
+@app.on_event("startup")
+async def warm_up_models():
+    # Map model artifacts and run a dummy prediction before the first request
+    risk_engine.warm_up()
+
 # ------------------------------ Models ---------------------------------------
 
 class QualityResponse(BaseModel):
@@ -59,6 +59,48 @@ VENDOR_P95_LATENCY_MS = Gauge(
     labelnames=("vendor",),
 )
 
+# Pre-initialized component pools (evidence extractors, tesseract workers)
+POOL_SIZE = Gauge(
+    "kyc_pool_size",
+    "Configured instances per pool",
+    labelnames=("pool",),
+)
+
+POOL_IN_USE = Gauge(
+    "kyc_pool_in_use",
+    "Instances currently checked out per pool",
+    labelnames=("pool",),
+)
+
+POOL_UTILIZATION = Gauge(
+    "kyc_pool_utilization",
+    "Fraction of pool instances in use (0..1)",
+    labelnames=("pool",),
+)
+
+POOL_WAITS = Gauge(
+    "kyc_pool_waits",
+    "Acquisitions that had to wait for a free instance",
+    labelnames=("pool",),
+)
+
+POOL_TIMEOUTS = Gauge(
+    "kyc_pool_timeouts",
+    "Acquisitions that timed out waiting for a free instance",
+    labelnames=("pool",),
+)
+
+# Extraction result cache (content-hash keyed /extract results)
+EXTRACTION_CACHE_HIT_RATIO = Gauge(
+    "kyc_extraction_cache_hit_ratio",
+    "Extraction result cache hit ratio (0..1)",
+)
+
+EXTRACTION_CACHE_ENTRIES = Gauge(
+    "kyc_extraction_cache_entries",
+    "Extraction results held in the in-memory cache",
+)
+
 
 def _status_to_code(state: str) -> int:
     table = {
@@ -91,16 +133,49 @@ def update_vendor_metrics(orchestrator: Optional[object]) -> None:
         VENDOR_P95_LATENCY_MS.labels(vendor=vendor_id).set(p95)
 
 
+def update_pool_metrics(pool: Optional[object]) -> None:
+    """Update pool gauges from an ExtractorPool-style get_metrics() snapshot."""
+    if pool is None:
+        return
+    for snapshot in pool.get_metrics().values():
+        if not snapshot:
+            continue
+        name = snapshot["name"]
+        POOL_SIZE.labels(pool=name).set(snapshot["size"])
+        POOL_IN_USE.labels(pool=name).set(snapshot["in_use"])
+        POOL_UTILIZATION.labels(pool=name).set(snapshot["utilization"])
+        POOL_WAITS.labels(pool=name).set(snapshot["waits"])
+        POOL_TIMEOUTS.labels(pool=name).set(snapshot["timeouts"])
+
+
+def update_extraction_cache_metrics(cache: Optional[object]) -> None:
+    """Update extraction cache gauges from an ExtractionResultCache if available."""
+    if cache is None:
+        return
+    snapshot = cache.get_metrics()
+    EXTRACTION_CACHE_HIT_RATIO.set(snapshot["hit_ratio"])
+    EXTRACTION_CACHE_ENTRIES.set(snapshot["size"])
+
+
 __all__ = [
     "REQUEST_COUNTER",
     "REQUEST_LATENCY",
     "VENDOR_BREAKER_STATE",
     "VENDOR_SUCCESS_RATE",
     "VENDOR_P95_LATENCY_MS",
+    "POOL_SIZE",
+    "POOL_IN_USE",
+    "POOL_UTILIZATION",
+    "POOL_WAITS",
+    "POOL_TIMEOUTS",
+    "EXTRACTION_CACHE_HIT_RATIO",
+    "EXTRACTION_CACHE_ENTRIES",
     "DECISION_COUNTER",
     "RISK_SCORE_HIST",
     "RISK_DRIFT_SCORE",
     "FAIRNESS_AUDIT_DUE",
     "update_vendor_metrics",
+    "update_pool_metrics",
+    "update_extraction_cache_metrics",
     "REGISTRY",
 ]
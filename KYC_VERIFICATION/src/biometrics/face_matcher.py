@@ -18,6 +18,7 @@ import time
 from scipy import signal
 from scipy.spatial import distance
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 
 # Configure logging
@@ -75,6 +76,63 @@ class BiometricResult:
     processing_time_ms: float
     metadata: Dict[str, Any]
 
+_UNSET = object()
+
+class LivenessFrame:
+    """Per-frame intermediates shared by the liveness checks
+
+    Grayscale, brightness channel, face detection and landmarks are
+    computed on first access and kept, so the passive and challenge checks
+    no longer convert and detect separately. Plain lazy attributes are used
+    instead of functools.cached_property, whose lock (Python < 3.12) is
+    shared by all instances and would serialize detection across frames.
+    """
+
+    def __init__(self, frame: np.ndarray, face_detector, shape_predictor=None):
+        self.frame = frame
+        self.face_detector = face_detector
+        self.shape_predictor = shape_predictor
+        self._gray = None
+        self._value = None
+        self._face = _UNSET
+        self._landmarks = _UNSET
+
+    @property
+    def gray(self) -> np.ndarray:
+        if self._gray is None:
+            frame = self.frame
+            self._gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
+        return self._gray
+
+    @property
+    def value(self) -> np.ndarray:
+        """HSV value channel: the per-pixel maximum of B, G and R"""
+        if self._value is None:
+            if len(self.frame.shape) == 3:
+                b, g, r = cv2.split(self.frame)
+                self._value = cv2.max(cv2.max(b, g), r)
+            else:
+                self._value = self.frame
+        return self._value
+
+    @property
+    def face(self) -> Optional[dlib.rectangle]:
+        """First detected face, if any"""
+        if self._face is _UNSET:
+            faces = self.face_detector(self.gray)
+            self._face = faces[0] if faces else None
+        return self._face
+
+    @property
+    def landmarks(self):
+        """68-point landmarks of the first face (None without a predictor or face)"""
+        if self._landmarks is _UNSET:
+            if self.shape_predictor is None or self.face is None:
+                self._landmarks = None
+            else:
+                self._landmarks = self.shape_predictor(self.gray, self.face)
+        return self._landmarks
+
 class FaceMatcher:
     """Face matching and biometric verification"""
     
@@ -89,6 +147,7 @@ class FaceMatcher:
         self.match_threshold = self.config["match_threshold"]  # 0.98 for TAR@FAR1%
         self.liveness_fmr = self.config["liveness_fmr"]  # 0.01 (1%)
         self.liveness_fnmr = self.config["liveness_fnmr"]  # 0.03 (3%)
+        self._executor: Optional[ThreadPoolExecutor] = None
         
         # Frame buffers for multi-frame analysis
         self.frame_buffer = deque(maxlen=30)
@@ -117,7 +176,9 @@ class FaceMatcher:
                     "blink_threshold": 0.3,
                     "smile_threshold": 0.4,
                     "head_turn_threshold": 15  # degrees
-                }
+                },
+                # Passive checks and per-frame face detection share this pool
+                "max_workers": 4
             },
             "anti_spoofing": {
                 "check_texture": True,
@@ -352,42 +413,62 @@ class FaceMatcher:
         """
         Perform liveness detection on frames
         
+        Each frame's grayscale, face detection and landmarks are computed
+        once and shared by the checks. The passive checks run on the thread
+        pool while the challenge checks detect faces across frames on it
+        too; OpenCV, numpy and dlib release the GIL while they work.
+        
         Args:
             frames: List of video frames
             
         Returns:
             List of liveness detection results
         """
-        results = []
+        shared = [LivenessFrame(frame, self.face_detector, self.shape_predictor) for frame in frames]
+        passive = []
         
         # Passive liveness detection
         if self.config["anti_spoofing"]["check_texture"]:
-            texture_result = self._detect_texture_liveness(frames)
-            results.append(texture_result)
+            passive.append(self._detect_texture_liveness)
         
         if self.config["anti_spoofing"]["check_frequency"]:
-            frequency_result = self._detect_frequency_liveness(frames)
-            results.append(frequency_result)
+            passive.append(self._detect_frequency_liveness)
         
         if self.config["anti_spoofing"]["check_reflection"]:
-            reflection_result = self._detect_reflection_liveness(frames)
-            results.append(reflection_result)
+            passive.append(self._detect_reflection_liveness)
+        
+        futures = [self._get_executor().submit(check, shared) for check in passive]
         
         # Challenge-based liveness (if multiple frames)
+        challenge = []
         if len(frames) > 1:
-            # Detect blink
-            blink_result = self._detect_blink(frames)
-            if blink_result:
-                results.append(blink_result)
-            
-            # Detect head movement
-            head_movement_result = self._detect_head_movement(frames)
-            if head_movement_result:
-                results.append(head_movement_result)
+            challenge = [self._detect_blink(shared), self._detect_head_movement(shared)]
         
+        results = [future.result() for future in futures]
+        results.extend(result for result in challenge if result)
         return results
     
-    def _detect_texture_liveness(self, frames: List[np.ndarray]) -> LivenessResult:
+    def _detect_faces(self, frames: List[LivenessFrame]) -> None:
+        """Detect the face of every frame, frames in parallel"""
+        if len(frames) > 1:
+            list(self._get_executor().map(lambda frame: frame.face, frames))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for concurrent liveness checks, created on first use"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config["liveness"].get("max_workers", 4),
+                thread_name_prefix="liveness",
+            )
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down the liveness thread pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def _detect_texture_liveness(self, frames: List[LivenessFrame]) -> LivenessResult:
         """
         Detect liveness using texture analysis
         Real faces have different texture than printed/screen faces
@@ -395,14 +476,11 @@ class FaceMatcher:
         frame_scores = []
         
         for frame in frames[:5]:  # Analyze first 5 frames
-            # Convert to grayscale
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
-            
             # Calculate Local Binary Patterns
-            lbp = self._calculate_lbp(gray)
+            lbp = self._calculate_lbp(frame.gray)
             
             # Calculate histogram
-            hist, _ = np.histogram(lbp.ravel(), bins=256, range=(0, 256))
+            hist = np.bincount(lbp.ravel().astype(np.intp), minlength=256)
             hist = hist.astype("float")
             hist /= (hist.sum() + 1e-6)
             
@@ -428,7 +506,7 @@ class FaceMatcher:
             consensus_score=consensus_score
         )
     
-    def _detect_frequency_liveness(self, frames: List[np.ndarray]) -> LivenessResult:
+    def _detect_frequency_liveness(self, frames: List[LivenessFrame]) -> LivenessResult:
         """
         Detect liveness using frequency analysis
         Printed/screen faces have different frequency characteristics
@@ -436,7 +514,7 @@ class FaceMatcher:
         frame_scores = []
         
         for frame in frames[:5]:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
+            gray = frame.gray
             
             # Apply FFT
             f_transform = np.fft.fft2(gray)
@@ -475,18 +553,15 @@ class FaceMatcher:
             consensus_score=consensus_score
         )
     
-    def _detect_reflection_liveness(self, frames: List[np.ndarray]) -> LivenessResult:
+    def _detect_reflection_liveness(self, frames: List[LivenessFrame]) -> LivenessResult:
         """
         Detect liveness by checking for screen reflections
         """
         frame_scores = []
         
         for frame in frames[:5]:
-            # Convert to HSV for better reflection detection
-            hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-            
             # Check for uniform bright regions (screen reflection)
-            _, _, v = cv2.split(hsv)
+            v = frame.value
             
             # Find bright spots
             bright_mask = v > 240
@@ -519,26 +594,22 @@ class FaceMatcher:
             consensus_score=consensus_score
         )
     
-    def _detect_blink(self, frames: List[np.ndarray]) -> Optional[LivenessResult]:
+    def _detect_blink(self, frames: List[LivenessFrame]) -> Optional[LivenessResult]:
         """
         Detect eye blink for liveness
         """
-        if len(frames) < 10:
+        # Without a landmark predictor no eye aspect ratio can be measured
+        if len(frames) < 10 or self.shape_predictor is None:
             return None
         
+        self._detect_faces(frames)
         eye_aspect_ratios = []
         
         for frame in frames:
-            # Detect face and landmarks
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
-            faces = self.face_detector(gray)
-            
-            if faces and self.shape_predictor:
-                face = faces[0]
-                landmarks = self.shape_predictor(gray, face)
-                
+            # Landmarks of the detected face
+            if frame.landmarks is not None:
                 # Calculate eye aspect ratio
-                ear = self._calculate_eye_aspect_ratio(landmarks)
+                ear = self._calculate_eye_aspect_ratio(frame.landmarks)
                 eye_aspect_ratios.append(ear)
         
         if len(eye_aspect_ratios) < 5:
@@ -566,21 +637,19 @@ class FaceMatcher:
             consensus_score=confidence
         )
     
-    def _detect_head_movement(self, frames: List[np.ndarray]) -> Optional[LivenessResult]:
+    def _detect_head_movement(self, frames: List[LivenessFrame]) -> Optional[LivenessResult]:
         """
         Detect head movement for liveness
         """
         if len(frames) < 5:
             return None
         
+        self._detect_faces(frames)
         face_positions = []
         
         for frame in frames:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
-            faces = self.face_detector(gray)
-            
-            if faces:
-                face = faces[0]
+            face = frame.face
+            if face is not None:
                 center_x = face.left() + face.width() // 2
                 center_y = face.top() + face.height() // 2
                 face_positions.append((center_x, center_y))
@@ -614,28 +683,19 @@ class FaceMatcher:
         )
     
     def _calculate_lbp(self, gray: np.ndarray) -> np.ndarray:
-        """Calculate Local Binary Patterns"""
+        """Calculate Local Binary Patterns (border pixels stay 0)"""
         rows, cols = gray.shape
         lbp = np.zeros_like(gray)
+        center = gray[1:rows - 1, 1:cols - 1]
+        code = np.zeros(center.shape, dtype=np.uint8)
         
-        for i in range(1, rows - 1):
-            for j in range(1, cols - 1):
-                center = gray[i, j]
-                code = 0
-                
-                # 8 neighbors
-                neighbors = [
-                    gray[i-1, j-1], gray[i-1, j], gray[i-1, j+1],
-                    gray[i, j+1], gray[i+1, j+1], gray[i+1, j],
-                    gray[i+1, j-1], gray[i, j-1]
-                ]
-                
-                for k, neighbor in enumerate(neighbors):
-                    if neighbor >= center:
-                        code |= (1 << k)
-                
-                lbp[i, j] = code
+        # 8 neighbors, clockwise from top-left; bit k is set when neighbor k >= center
+        offsets = [(-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1)]
+        for k, (dy, dx) in enumerate(offsets):
+            neighbor = gray[1 + dy:rows - 1 + dy, 1 + dx:cols - 1 + dx]
+            code |= (neighbor >= center).view(np.uint8) << np.uint8(k)
         
+        lbp[1:rows - 1, 1:cols - 1] = code
         return lbp
     
     def _calculate_eye_aspect_ratio(self, landmarks) -> float:
@@ -795,6 +855,7 @@ class FaceMatcher:
 # Export main components
 __all__ = [
     "FaceMatcher",
+    "LivenessFrame",
     "BiometricResult",
     "LivenessResult",
     "FaceEncoding",
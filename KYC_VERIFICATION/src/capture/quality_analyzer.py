@@ -7,8 +7,10 @@ Phase 1: Capture Quality & Coaching
 import cv2
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 import logging
 from pathlib import Path
 import json
@@ -51,6 +53,65 @@ class CoachingHint:
     suggestion: str
     priority: int  # Lower number = higher priority
 
+class FrameAnalysis:
+    """Per-frame intermediates shared by the quality metrics
+
+    Views are computed on first access and cached, so each metric reuses the
+    same grayscale, pyramid level, edge map and brightness channel instead of
+    redoing its own conversion.
+    """
+
+    def __init__(self, image: np.ndarray, analysis_max_side: Optional[int] = None):
+        self.image = image
+        self.height, self.width = image.shape[:2]
+        self.analysis_max_side = analysis_max_side
+
+    @cached_property
+    def full_gray(self) -> np.ndarray:
+        """Full-resolution grayscale"""
+        return cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY)
+
+    @cached_property
+    def level(self) -> np.ndarray:
+        """BGR copy downscaled so the long side fits analysis_max_side"""
+        max_side = self.analysis_max_side
+        if not max_side or max(self.height, self.width) <= max_side:
+            return self.image
+        # Gaussian pyramid halving while at least 2x too large, then one
+        # bilinear step of under 2x (much cheaper than INTER_AREA)
+        level = self.image
+        while max(level.shape[:2]) >= 2 * max_side:
+            level = cv2.pyrDown(level)
+        scale = max_side / max(level.shape[:2])
+        if scale < 1:
+            size = (max(1, round(level.shape[1] * scale)), max(1, round(level.shape[0] * scale)))
+            level = cv2.resize(level, size, interpolation=cv2.INTER_LINEAR)
+        return level
+
+    @property
+    def scale(self) -> float:
+        """Analysis level size relative to the full frame"""
+        return self.level.shape[1] / self.width
+
+    @cached_property
+    def gray(self) -> np.ndarray:
+        """Grayscale at the analysis level"""
+        if self.level is self.image:
+            return self.full_gray
+        return cv2.cvtColor(self.level, cv2.COLOR_BGR2GRAY)
+
+    @cached_property
+    def value(self) -> np.ndarray:
+        """HSV V channel at the analysis level (per-pixel max of B, G, R)"""
+        b, g, r = cv2.split(self.level)
+        return cv2.max(cv2.max(b, g), r)
+
+    @cached_property
+    def edges(self) -> np.ndarray:
+        """Canny edges at the analysis level"""
+        return cv2.Canny(self.gray, 50, 150)
+
+
 class CaptureQualityAnalyzer:
     """Analyzes capture quality and provides coaching hints"""
     
@@ -61,6 +122,7 @@ class CaptureQualityAnalyzer:
         self.blur_threshold = self.config.get("blur_threshold", 0.3)
         self.glare_threshold = self.config.get("glare_threshold", 0.2)
         self.pass_threshold = self.config.get("pass_threshold", 0.95)
+        self._executor: Optional[ThreadPoolExecutor] = None
         
     def _load_config(self, config_path: Optional[str]) -> Dict:
         """Load configuration from file or use defaults"""
@@ -71,6 +133,20 @@ class CaptureQualityAnalyzer:
             "brightness_range": [0.3, 0.7],
             "contrast_threshold": 0.4,
             "pass_threshold": 0.95,
+            # Long side of the pyramid level most metrics run on (None = full
+            # resolution). Blur always uses the full frame: Laplacian variance
+            # depends on scale and gates the capture.
+            "analysis_max_side": 1280,
+            "multi_frame": {
+                # Frames are ranked by Laplacian variance at this long side
+                "prescore_max_side": 256,
+                # Only the best-ranked frames get a full analysis
+                "top_k": 6,
+                "max_workers": 3,
+                # Stop once a frame clears pass_threshold by this much with
+                # no critical hints
+                "early_exit_margin": 0.02
+            },
             "weights": {
                 "blur": 0.25,
                 "glare": 0.20,
@@ -113,17 +189,17 @@ class CaptureQualityAnalyzer:
         height, width = image.shape[:2]
         resolution = (width, height)
         
-        # Convert to grayscale for analysis
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # One set of shared intermediates per frame
+        frame = FrameAnalysis(image, self.config.get("analysis_max_side"))
         
         # Calculate individual metrics
-        blur_score = self._calculate_blur(gray)
-        glare_score = self._detect_glare(image)
-        brightness_score = self._calculate_brightness(gray)
-        contrast_score = self._calculate_contrast(gray)
-        orientation_angle = self._detect_orientation(gray)
-        document_coverage = self._estimate_document_coverage(gray)
-        edge_clarity = self._calculate_edge_clarity(gray)
+        blur_score = self._calculate_blur(frame.full_gray)
+        glare_score = self._detect_glare(frame.level, frame.value, frame.scale)
+        brightness_score = self._calculate_brightness(frame.gray)
+        contrast_score = self._calculate_contrast(frame.gray)
+        orientation_angle = self._detect_orientation(frame.gray, frame.edges, frame.scale)
+        document_coverage = self._estimate_document_coverage(frame.gray, frame.edges)
+        edge_clarity = self._calculate_edge_clarity(frame.gray)
         
         # Calculate weighted overall score
         weights = self.config["weights"]
@@ -153,8 +229,9 @@ class CaptureQualityAnalyzer:
         Calculate blur score using Laplacian variance
         Lower variance indicates more blur
         """
-        laplacian = cv2.Laplacian(gray, cv2.CV_64F)
-        variance = laplacian.var()
+        # 16-bit output holds the 3x3 Laplacian of uint8 exactly
+        laplacian = cv2.Laplacian(gray, cv2.CV_16S)
+        variance = cv2.meanStdDev(laplacian)[1][0, 0] ** 2
         
         # Normalize to 0-1 range (inverse, as higher variance means less blur)
         # Typical variance ranges from 0 (very blurry) to 1000+ (very sharp)
@@ -162,27 +239,31 @@ class CaptureQualityAnalyzer:
         
         return blur_score
     
-    def _detect_glare(self, image: np.ndarray) -> float:
+    def _detect_glare(self, image: np.ndarray, value: Optional[np.ndarray] = None,
+                      scale: float = 1.0) -> float:
         """
         Detect glare/hotspots in the image
         Returns score 0-1, higher means more glare
+        
+        scale is the size of image relative to the full frame.
         """
-        # Convert to HSV for better brightness detection
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-        _, _, v = cv2.split(hsv)
+        # HSV value channel for brightness detection
+        v = value if value is not None else cv2.cvtColor(image, cv2.COLOR_BGR2HSV)[:, :, 2]
         
         # Find bright spots (potential glare)
         threshold = 250  # Very bright pixels
-        glare_mask = v > threshold
-        glare_pixels = np.sum(glare_mask)
+        _, glare_mask = cv2.threshold(v, threshold, 1, cv2.THRESH_BINARY)
+        glare_pixels = cv2.countNonZero(glare_mask)
         total_pixels = v.shape[0] * v.shape[1]
         
         # Calculate glare percentage
         glare_score = glare_pixels / total_pixels
         
-        # Also check for large continuous bright regions
-        kernel = np.ones((5, 5), np.uint8)
-        glare_dilated = cv2.dilate(glare_mask.astype(np.uint8), kernel, iterations=2)
+        # Also check for large continuous bright regions; merge hotspots within
+        # 4 full-frame pixels (a 5x5 kernel applied twice at full resolution)
+        radius = max(1, int(round(4 * scale)))
+        kernel = np.ones((2 * radius + 1, 2 * radius + 1), np.uint8)
+        glare_dilated = cv2.dilate(glare_mask, kernel)
         contours, _ = cv2.findContours(glare_dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
         if contours:
@@ -194,56 +275,53 @@ class CaptureQualityAnalyzer:
     
     def _calculate_brightness(self, gray: np.ndarray) -> float:
         """Calculate average brightness (0-1)"""
-        return np.mean(gray) / 255.0
+        return cv2.mean(gray)[0] / 255.0
     
     def _calculate_contrast(self, gray: np.ndarray) -> float:
         """Calculate image contrast using standard deviation"""
-        std_dev = np.std(gray)
+        std_dev = cv2.meanStdDev(gray)[1][0, 0]
         # Normalize to 0-1 range
         contrast_score = min(1.0, std_dev / 127.5)
         return contrast_score
     
-    def _detect_orientation(self, gray: np.ndarray) -> float:
+    def _detect_orientation(self, gray: np.ndarray, edges: Optional[np.ndarray] = None,
+                            scale: float = 1.0) -> float:
         """
         Detect document orientation angle
         Returns angle in degrees (-90 to 90)
+        
+        scale is the size of gray relative to the full frame; line length,
+        gap and vote thresholds are given in full-frame pixels.
         """
         # Detect edges
-        edges = cv2.Canny(gray, 50, 150)
+        if edges is None:
+            edges = cv2.Canny(gray, 50, 150)
         
         # Detect lines using Hough transform
-        lines = cv2.HoughLinesP(edges, 1, np.pi/180, 100, minLineLength=100, maxLineGap=10)
+        lines = cv2.HoughLinesP(edges, 1, np.pi/180, max(1, int(round(100 * scale))),
+                                minLineLength=100 * scale, maxLineGap=max(1.0, 10 * scale))
         
         if lines is None:
             return 0.0
         
         # Calculate angles of detected lines
-        angles = []
-        for line in lines:
-            x1, y1, x2, y2 = line[0]
-            angle = np.degrees(np.arctan2(y2 - y1, x2 - x1))
-            # Normalize to -90 to 90 range
-            if angle < -45:
-                angle += 90
-            elif angle > 45:
-                angle -= 90
-            angles.append(angle)
-        
-        if angles:
-            # Use median angle to avoid outliers
-            orientation_angle = np.median(angles)
-        else:
-            orientation_angle = 0.0
+        x1, y1, x2, y2 = lines[:, 0].T.astype(float)
+        angles = np.degrees(np.arctan2(y2 - y1, x2 - x1))
+        # Normalize to -90 to 90 range
+        angles = np.where(angles < -45, angles + 90, np.where(angles > 45, angles - 90, angles))
         
-        return orientation_angle
+        # Use median angle to avoid outliers
+        return float(np.median(angles))
     
-    def _estimate_document_coverage(self, gray: np.ndarray) -> float:
+    def _estimate_document_coverage(self, gray: np.ndarray,
+                                    edges: Optional[np.ndarray] = None) -> float:
         """
         Estimate how much of the frame is covered by the document
         Returns coverage ratio (0-1)
         """
         # Simple edge detection to find document boundaries
-        edges = cv2.Canny(gray, 50, 150)
+        if edges is None:
+            edges = cv2.Canny(gray, 50, 150)
         
         # Find contours
         contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -264,18 +342,24 @@ class CaptureQualityAnalyzer:
         Calculate edge clarity score
         Clear edges indicate good focus and quality
         """
-        # Apply Sobel operator
-        sobelx = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-        sobely = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
+        # Apply Sobel operator (3x3 responses of uint8 are exact in float32)
+        sobelx = cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=3)
+        sobely = cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=3)
         
         # Calculate gradient magnitude
-        magnitude = np.sqrt(sobelx**2 + sobely**2)
+        magnitude = cv2.magnitude(sobelx, sobely).ravel()
+        
+        # 90th percentile (linear interpolation) by partial sort
+        rank = 0.9 * (magnitude.size - 1)
+        lo, hi = int(np.floor(rank)), int(np.ceil(rank))
+        partitioned = np.partition(magnitude, [lo, hi])
+        cutoff = partitioned[lo] + (partitioned[hi] - partitioned[lo]) * (rank - lo)
         
         # Calculate edge clarity as mean of strong edges
-        strong_edges = magnitude[magnitude > np.percentile(magnitude, 90)]
+        strong_edges = magnitude[magnitude > cutoff]
         
         if len(strong_edges) > 0:
-            clarity = np.mean(strong_edges) / 255.0
+            clarity = float(np.mean(strong_edges, dtype=np.float64)) / 255.0
         else:
             clarity = 0.0
         
@@ -420,26 +504,89 @@ class CaptureQualityAnalyzer:
         
         return passed, score, reasons
     
-    def process_multi_frame(self, frames: List[np.ndarray]) -> Dict[str, Any]:
+    def _prescore_frame(self, image: np.ndarray) -> float:
+        """
+        Cheap ranking score: Laplacian variance of a small grayscale copy,
+        discounted by the saturated-pixel fraction so sharp but glared
+        frames do not crowd out clean ones
+        """
+        max_side = self.config["multi_frame"].get("prescore_max_side", 256)
+        # Integer-factor INTER_AREA takes OpenCV's fast block-averaging path
+        factor = max(1, -(-max(image.shape[:2]) // max_side))
+        small = image
+        if factor > 1:
+            small = cv2.resize(image, None, fx=1 / factor, fy=1 / factor, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        sharpness = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_16S))[1][0, 0] ** 2
+        b, g, r = cv2.split(small)
+        saturated = cv2.countNonZero(cv2.threshold(cv2.max(cv2.max(b, g), r), 250, 1, cv2.THRESH_BINARY)[1])
+        return float(sharpness * max(0.0, 1 - 2 * saturated / gray.size))
+    
+    def _passes_with_margin(self, metrics: QualityMetrics, hints: List[CoachingHint]) -> bool:
+        margin = self.config["multi_frame"].get("early_exit_margin", 0.02)
+        return (metrics.overall_score >= self.pass_threshold + margin and
+                not any(h.severity == "critical" for h in hints))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for multi-frame analysis, created on first use"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config["multi_frame"].get("max_workers", 3),
+                thread_name_prefix="quality-analyzer",
+            )
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down the multi-frame thread pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def process_multi_frame(self, frames: List[np.ndarray], exhaustive: bool = False) -> Dict[str, Any]:
         """
         Process multiple frames and return best one with consensus scoring
         
+        Frames are ranked by a cheap sharpness pre-score; only the top_k
+        candidates are fully analyzed, in parallel waves of max_workers, and
+        analysis stops after the first wave in which a frame passes with
+        early_exit_margin. Consensus statistics cover analyzed frames only.
+        
         Args:
             frames: List of image frames
+            exhaustive: Fully analyze every frame (previous behaviour)
             
         Returns:
             Dictionary with best frame index, metrics, and consensus data
         """
-        frame_metrics = []
-        
-        for i, frame in enumerate(frames):
-            metrics, hints = self.analyze_frame(frame)
-            frame_metrics.append({
+        settings = self.config["multi_frame"]
+        prescores = [self._prescore_frame(frame) for frame in frames]
+        order = sorted(range(len(frames)), key=lambda i: prescores[i], reverse=True)
+        if not exhaustive:
+            order = order[:max(1, settings.get("top_k", 6))]
+        
+        def analyze(i: int) -> Dict[str, Any]:
+            metrics, hints = self.analyze_frame(frames[i])
+            return {
                 "index": i,
                 "metrics": metrics,
                 "hints": hints,
-                "score": metrics.overall_score
-            })
+                "score": metrics.overall_score,
+                "prescore": prescores[i]
+            }
+        
+        frame_metrics = []
+        early_exit = False
+        wave_size = max(1, settings.get("max_workers", 3))
+        for start in range(0, len(order), wave_size):
+            wave = order[start:start + wave_size]
+            if len(wave) > 1:
+                frame_metrics.extend(self._get_executor().map(analyze, wave))
+            else:
+                frame_metrics.append(analyze(wave[0]))
+            if not exhaustive and any(self._passes_with_margin(fm["metrics"], fm["hints"])
+                                      for fm in frame_metrics):
+                early_exit = start + wave_size < len(order)
+                break
         
         # Sort by overall score
         frame_metrics.sort(key=lambda x: x["score"], reverse=True)
@@ -453,6 +600,8 @@ class CaptureQualityAnalyzer:
             "worst_score": frame_metrics[-1]["score"],
             "best_frame_index": frame_metrics[0]["index"],
             "frames_passing": sum(1 for s in scores if s >= self.pass_threshold),
+            "frames_analyzed": len(frame_metrics),
+            "early_exit": early_exit,
             "total_frames": len(frames)
         }
         
@@ -463,4 +612,4 @@ class CaptureQualityAnalyzer:
         }
 
 # Export main class
-__all__ = ["CaptureQualityAnalyzer", "QualityMetrics", "CoachingHint", "QualityIssue"]
\ No newline at end of file
+__all__ = ["CaptureQualityAnalyzer", "QualityMetrics", "CoachingHint", "QualityIssue", "FrameAnalysis"]
\ No newline at end of file
@@ -9,8 +9,10 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 import json
 import logging
+import threading
 from pathlib import Path
 try:
     import torch  # type: ignore
@@ -34,6 +36,8 @@ except Exception:
     Image = None  # type: ignore
 import re
 
+from .micro_batcher import MicroBatcher
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -74,21 +78,137 @@ class DocumentTemplate:
     mrz_format: Optional[str]  # MRZ format if applicable
     barcode_types: List[str]  # Supported barcode types
 
+class PreprocessedImage:
+    """Per-image views shared by all feature extractors
+
+    Each view is computed on first access and reused, so one classify call
+    converts and resizes the input at most once per view.
+    """
+
+    # Long side of the standard-size view
+    STANDARD_MAX_SIDE = 256
+
+    def __init__(self, image: np.ndarray):
+        self.image = image
+        self.height, self.width = image.shape[:2]
+
+    @cached_property
+    def gray(self) -> np.ndarray:
+        return cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY)
+
+    @cached_property
+    def hsv(self) -> np.ndarray:
+        return cv2.cvtColor(self.image, cv2.COLOR_BGR2HSV)
+
+    @cached_property
+    def standard(self) -> np.ndarray:
+        """BGR copy downscaled so the long side is at most STANDARD_MAX_SIDE"""
+        scale = self.STANDARD_MAX_SIDE / max(self.height, self.width)
+        if scale >= 1:
+            return self.image
+        # INTER_AREA averages source pixels, so small color regions survive
+        size = (max(1, round(self.width * scale)), max(1, round(self.height * scale)))
+        return cv2.resize(self.image, size, interpolation=cv2.INTER_AREA)
+
+    @cached_property
+    def edges(self) -> np.ndarray:
+        return cv2.Canny(self.gray, 50, 150)
+
+
+@dataclass
+class TemplateIndex:
+    """Template descriptors stacked into arrays for vectorized matching"""
+    ids: List[str]
+    types: List[str]
+    aspect_ratios: np.ndarray  # (T,)
+    colors: np.ndarray  # (T, C, 3) color schemes, zero-padded
+    color_mask: np.ndarray  # (T, C) True where colors holds a real entry
+    vocabulary: Dict[str, int]  # key feature name -> column
+    key_features: np.ndarray  # (T, V) 1 where the template lists the feature
+    key_feature_counts: np.ndarray  # (T,)
+    has_mrz: np.ndarray  # (T,)
+
+    @classmethod
+    def build(cls, templates: Dict[str, DocumentTemplate]) -> "TemplateIndex":
+        items = list(templates.values())
+        vocabulary: Dict[str, int] = {}
+        for template in items:
+            for name in template.key_features:
+                vocabulary.setdefault(name, len(vocabulary))
+
+        max_colors = max((len(t.color_scheme) for t in items), default=0)
+        colors = np.zeros((len(items), max_colors, 3))
+        color_mask = np.zeros((len(items), max_colors), dtype=bool)
+        key_features = np.zeros((len(items), len(vocabulary)))
+        for i, template in enumerate(items):
+            if template.color_scheme:
+                colors[i, :len(template.color_scheme)] = template.color_scheme
+                color_mask[i, :len(template.color_scheme)] = True
+            for name in template.key_features:
+                key_features[i, vocabulary[name]] = 1
+
+        return cls(
+            ids=[t.id for t in items],
+            types=[t.type.value for t in items],
+            aspect_ratios=np.array([t.aspect_ratio for t in items], dtype=float),
+            colors=colors,
+            color_mask=color_mask,
+            vocabulary=vocabulary,
+            key_features=key_features,
+            key_feature_counts=np.array([max(len(t.key_features), 1) for t in items], dtype=float),
+            has_mrz=np.array([bool(t.mrz_format) for t in items]),
+        )
+
+
 class DocumentClassifier:
     """Multi-document classifier for Philippine IDs"""
+
+    # Dominant colors are clustered on a fixed-size pixel sample of the
+    # standard-size view so cost does not grow with capture resolution
+    COLOR_SAMPLE_PIXELS = 10_000
     
-    def __init__(self, templates_path: Optional[str] = None, model_path: Optional[str] = None):
+    def __init__(self, templates_path: Optional[str] = None, model_path: Optional[str] = None,
+                 config_path: Optional[str] = None):
         """
         Initialize document classifier
         
         Args:
             templates_path: Path to document templates directory
             model_path: Path to pre-trained classification model
+            config_path: Path to JSON config (CNN inference settings)
         """
+        self.config = self._load_config(config_path)
         self.templates = self._load_templates(templates_path)
+        self.template_index = TemplateIndex.build(self.templates)
         self.model = self._load_model(model_path)
+        self.inference_model = self._prepare_inference_model(self.model)
         self.transform = self._setup_transforms()
         self.feature_extractors = self._initialize_extractors()
+        self._batcher: Optional[MicroBatcher] = None
+        self._batcher_lock = threading.Lock()
+    
+    def _load_config(self, config_path: Optional[str]) -> Dict:
+        """Load classifier configuration"""
+        default_config = {
+            "inference": {
+                # torch intra-op threads; None keeps torch's default (one per core).
+                # With several API workers per host, set cores // workers.
+                "num_threads": None,
+                # Concurrent classify calls are coalesced into one forward pass
+                "micro_batching": True,
+                "max_batch_size": 8,
+                "max_wait_ms": 2.0,
+                # Trace and freeze the CNN with TorchScript for CPU inference
+                "torchscript": False
+            }
+        }
+        
+        if config_path and Path(config_path).exists():
+            with open(config_path, 'r') as f:
+                user_config = json.load(f)
+                default_config.update(user_config)
+        
+        return default_config
         
     def _load_templates(self, templates_path: Optional[str]) -> Dict[str, DocumentTemplate]:
         """Load document templates from configuration"""
@@ -266,13 +386,32 @@ class DocumentClassifier:
         if model_path and Path(model_path).exists():
             try:
                 model.load_state_dict(torch.load(model_path, map_location='cpu'))
-                model.eval()
                 logger.info(f"Loaded pre-trained model from {model_path}")
             except Exception as e:
                 logger.warning(f"Failed to load model weights: {e}")
         
+        # Inference only: disable dropout
+        model.eval()
         return model
     
+    def _prepare_inference_model(self, model):
+        """Apply thread settings and optionally trace the model with TorchScript"""
+        if model is None:
+            return None
+        settings = self.config["inference"]
+        if settings.get("num_threads"):
+            # Process-wide: keeps concurrent workers from oversubscribing cores
+            torch.set_num_threads(int(settings["num_threads"]))
+        if not settings.get("torchscript"):
+            return model
+        try:
+            with torch.inference_mode():
+                traced = torch.jit.trace(model, torch.zeros(1, 3, 224, 224), check_trace=False)
+            return torch.jit.freeze(traced)
+        except Exception as e:
+            logger.warning(f"TorchScript tracing failed, using eager model: {e}")
+            return model
+    
     def _setup_transforms(self):
         """Setup image transforms for model input (or None if unavailable)."""
         if not TRANSFORMS_AVAILABLE:
@@ -343,30 +482,24 @@ class DocumentClassifier:
     def _extract_features(self, image: np.ndarray) -> Dict[str, Any]:
         """Extract various features from document image"""
         features = {}
+        prep = PreprocessedImage(image)
         
-        # Extract text features
-        features.update(self._extract_text_features(image))
-        
-        # Extract color features
-        features.update(self._extract_color_features(image))
-        
-        # Extract shape features
-        features.update(self._extract_shape_features(image))
-        
-        # Extract pattern features
-        features.update(self._extract_pattern_features(image))
+        # Extract text, color, shape and pattern features from shared views
+        for extractor in self.feature_extractors.values():
+            features.update(extractor(image, prep))
         
         return features
     
-    def _extract_text_features(self, image: np.ndarray) -> Dict[str, Any]:
+    def _extract_text_features(self, image: np.ndarray,
+                               prep: Optional[PreprocessedImage] = None) -> Dict[str, Any]:
         """Extract text-based features"""
+        prep = prep or PreprocessedImage(image)
         features = {
             "detected_features": [],
             "text_regions": []
         }
         
-        # Convert to grayscale for text detection
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = prep.gray
         
         # Detect text regions using morphological operations
         kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (20, 3))
@@ -385,10 +518,9 @@ class DocumentClassifier:
         
         # Check for MRZ pattern (bottom of document, specific aspect ratio)
         height, width = image.shape[:2]
-        bottom_region = gray[int(height * 0.7):, :]
         
         # Simple MRZ detection based on pattern
-        edges = cv2.Canny(bottom_region, 50, 150)
+        edges = prep.edges[int(height * 0.7):, :]
         horizontal_proj = np.sum(edges, axis=1)
         
         if np.max(horizontal_proj) > width * 0.3:  # Significant horizontal lines
@@ -397,15 +529,14 @@ class DocumentClassifier:
         
         return features
     
-    def _extract_color_features(self, image: np.ndarray) -> Dict[str, Any]:
+    def _extract_color_features(self, image: np.ndarray,
+                                prep: Optional[PreprocessedImage] = None) -> Dict[str, Any]:
         """Extract color-based features"""
+        prep = prep or PreprocessedImage(image)
         features = {}
         
-        # Convert to RGB for color analysis
-        rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        
         # Calculate dominant colors using k-means when available
-        pixels = rgb.reshape(-1, 3)
+        pixels = self._color_sample(prep.standard)
         try:
             from sklearn.cluster import MiniBatchKMeans  # type: ignore
             n_colors = 5
@@ -418,10 +549,10 @@ class DocumentClassifier:
             step = max(1, len(pixels)//1000)
             features["dominant_colors"] = [tuple(map(int, p)) for p in pixels[::step][:5]]
         
-        # Calculate color histogram
-        hist_r = cv2.calcHist([rgb], [0], None, [256], [0, 256])
-        hist_g = cv2.calcHist([rgb], [1], None, [256], [0, 256])
-        hist_b = cv2.calcHist([rgb], [2], None, [256], [0, 256])
+        # Calculate color histogram (full resolution; BGR channel order)
+        hist_r = cv2.calcHist([image], [2], None, [256], [0, 256])
+        hist_g = cv2.calcHist([image], [1], None, [256], [0, 256])
+        hist_b = cv2.calcHist([image], [0], None, [256], [0, 256])
         
         features["color_histogram"] = {
             "red": hist_r.flatten().tolist()[:50],  # Store only first 50 bins
@@ -431,8 +562,19 @@ class DocumentClassifier:
         
         return features
     
-    def _extract_shape_features(self, image: np.ndarray) -> Dict[str, Any]:
+    def _color_sample(self, image: np.ndarray) -> np.ndarray:
+        """Fixed-size RGB pixel sample from a (standard-size) BGR image"""
+        pixels = cv2.cvtColor(image, cv2.COLOR_BGR2RGB).reshape(-1, 3)
+        if len(pixels) > self.COLOR_SAMPLE_PIXELS:
+            # Fixed seed keeps dominant colors reproducible for the same image
+            rng = np.random.default_rng(0)
+            pixels = pixels[rng.choice(len(pixels), self.COLOR_SAMPLE_PIXELS, replace=False)]
+        return pixels
+    
+    def _extract_shape_features(self, image: np.ndarray,
+                                prep: Optional[PreprocessedImage] = None) -> Dict[str, Any]:
         """Extract shape-based features"""
+        prep = prep or PreprocessedImage(image)
         features = {}
         
         height, width = image.shape[:2]
@@ -440,8 +582,7 @@ class DocumentClassifier:
         features["dimensions"] = (width, height)
         
         # Detect document corners
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        corners = cv2.goodFeaturesToTrack(gray, 4, 0.01, 100)
+        corners = cv2.goodFeaturesToTrack(prep.gray, 4, 0.01, 100)
         
         if corners is not None and len(corners) >= 4:
             features["has_clear_corners"] = True
@@ -450,12 +591,14 @@ class DocumentClassifier:
         
         return features
     
-    def _extract_pattern_features(self, image: np.ndarray) -> Dict[str, Any]:
+    def _extract_pattern_features(self, image: np.ndarray,
+                                  prep: Optional[PreprocessedImage] = None) -> Dict[str, Any]:
         """Extract pattern-based features (barcodes, QR codes, etc.)"""
+        prep = prep or PreprocessedImage(image)
         features = {}
         
         # Detect barcodes
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = prep.gray
         
         # Simple barcode detection using gradients
         gradX = cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=1)
@@ -497,11 +640,11 @@ class DocumentClassifier:
             return {}
         pil_image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))  # type: ignore
         input_tensor = self.transform(pil_image)  # type: ignore
-        input_batch = input_tensor.unsqueeze(0)
-        with torch.no_grad():  # type: ignore
-            output = self.model(input_batch)
-            probabilities = torch.nn.functional.softmax(output, dim=1)  # type: ignore
-        probs = probabilities[0].numpy()
+        batcher = self._get_batcher()
+        if batcher is not None:
+            probs = batcher.submit(input_tensor)
+        else:
+            probs = self._predict_batch([input_tensor])[0]
         doc_types = list(DocumentType)
         predictions = {}
         for i, doc_type in enumerate(doc_types):
@@ -509,70 +652,88 @@ class DocumentClassifier:
                 predictions[doc_type.value] = float(probs[i])
         return predictions
     
+    def _predict_batch(self, input_tensors: List[Any]) -> List[np.ndarray]:
+        """One forward pass over a batch of transformed images"""
+        with torch.inference_mode():  # type: ignore
+            output = self.inference_model(torch.stack(input_tensors))  # type: ignore
+            probabilities = torch.nn.functional.softmax(output, dim=1)  # type: ignore
+        return list(probabilities.numpy())
+    
+    def _get_batcher(self) -> Optional[MicroBatcher]:
+        """Shared micro-batcher for CNN inference, started on first use"""
+        settings = self.config["inference"]
+        if not settings.get("micro_batching") or settings.get("max_batch_size", 1) <= 1:
+            return None
+        if self._batcher is None:
+            with self._batcher_lock:
+                if self._batcher is None:
+                    self._batcher = MicroBatcher(
+                        self._predict_batch,
+                        max_batch_size=int(settings["max_batch_size"]),
+                        max_wait_ms=float(settings.get("max_wait_ms", 2.0)),
+                        name="document-classifier-cnn",
+                    )
+        return self._batcher
+    
+    def get_inference_metrics(self) -> Optional[Dict[str, Any]]:
+        """Micro-batching metrics, or None before the first batched call"""
+        return self._batcher.get_metrics() if self._batcher else None
+    
+    def close(self) -> None:
+        """Stop the inference batching thread"""
+        if self._batcher is not None:
+            self._batcher.close()
+            self._batcher = None
+    
     def _match_templates(self, features: Dict[str, Any]) -> Dict[str, float]:
-        """Match features against templates"""
-        scores = {}
-        
-        for template_id, template in self.templates.items():
-            score = 0.0
-            weight_sum = 0.0
-            
-            # Match aspect ratio
-            if "aspect_ratio" in features:
-                ar_diff = abs(features["aspect_ratio"] - template.aspect_ratio)
-                ar_score = max(0, 1 - ar_diff * 2)
-                score += ar_score * 0.3
-                weight_sum += 0.3
-            
-            # Match color scheme
-            if "dominant_colors" in features:
-                color_score = self._compare_colors(
-                    features["dominant_colors"],
-                    template.color_scheme
-                )
-                score += color_score * 0.2
-                weight_sum += 0.2
-            
-            # Match detected features
-            if "detected_features" in features:
-                feature_matches = sum(
-                    1 for f in features["detected_features"]
-                    if f in template.key_features
-                )
-                feature_score = feature_matches / max(len(template.key_features), 1)
-                score += feature_score * 0.3
-                weight_sum += 0.3
-            
-            # Match MRZ presence
-            if template.mrz_format:
-                if features.get("has_mrz", False):
-                    score += 0.2
-                weight_sum += 0.2
-            
-            # Normalize score
-            if weight_sum > 0:
-                scores[template.type.value] = score / weight_sum
-            else:
-                scores[template.type.value] = 0.0
-        
-        return scores
+        """Match features against all templates in one vectorized pass"""
+        index = self.template_index
+        score = np.zeros(len(index.ids))
+        weight_sum = 0.0
+        
+        # Match aspect ratio
+        if "aspect_ratio" in features:
+            ar_diff = np.abs(features["aspect_ratio"] - index.aspect_ratios)
+            score += np.maximum(0, 1 - ar_diff * 2) * 0.3
+            weight_sum += 0.3
+        
+        # Match color scheme
+        if "dominant_colors" in features:
+            score += self._compare_colors(features["dominant_colors"], index) * 0.2
+            weight_sum += 0.2
+        
+        # Match detected features (repeated detections count repeatedly)
+        if "detected_features" in features:
+            counts = np.zeros(len(index.vocabulary))
+            for name in features["detected_features"]:
+                column = index.vocabulary.get(name)
+                if column is not None:
+                    counts[column] += 1
+            score += (index.key_features @ counts) / index.key_feature_counts * 0.3
+            weight_sum += 0.3
+        
+        # Match MRZ presence (only templates with an MRZ format are weighted)
+        mrz_weight = np.where(index.has_mrz, 0.2, 0.0)
+        if features.get("has_mrz", False):
+            score += mrz_weight
+        total_weight = weight_sum + mrz_weight
+        
+        # Normalize score
+        normalized = np.divide(score, total_weight, out=np.zeros_like(score), where=total_weight > 0)
+        
+        # Templates sharing a document type: the last one loaded wins
+        return dict(zip(index.types, normalized.tolist()))
     
-    def _compare_colors(self, colors1: List[Tuple], colors2: List[Tuple]) -> float:
-        """Compare two sets of colors"""
-        if not colors1 or not colors2:
-            return 0.0
-        
-        max_score = 0.0
-        
-        for c1 in colors1:
-            for c2 in colors2:
-                # Calculate color distance
-                dist = np.sqrt(sum((a - b) ** 2 for a, b in zip(c1, c2)))
-                # Normalize to 0-1 (max distance is sqrt(3 * 255^2))
-                similarity = 1 - (dist / 441.67)
-                max_score = max(max_score, similarity)
-        
-        return max_score
+    def _compare_colors(self, colors: List[Tuple], index: TemplateIndex) -> np.ndarray:
+        """Best color similarity of each template's scheme to the given colors"""
+        if not len(colors) or not index.colors.size:
+            return np.zeros(len(index.ids))
+        
+        # (T, C, K) distances; normalize by the max distance sqrt(3 * 255^2)
+        colors = np.asarray(colors, dtype=float)
+        dist = np.linalg.norm(index.colors[:, :, None, :] - colors[None, None, :, :], axis=-1)
+        similarity = np.where(index.color_mask[:, :, None], 1 - dist / 441.67, 0.0)
+        return np.maximum(similarity.max(axis=(1, 2)), 0.0)
     
     def _combine_scores(self, model_scores: Dict[str, float], 
                        template_scores: Dict[str, float]) -> Dict[str, float]:
@@ -612,23 +773,15 @@ class DocumentClassifier:
     def _find_best_template(self, doc_type: DocumentType, 
                            features: Dict[str, Any]) -> str:
         """Find best matching template for document type"""
-        best_template_id = None
-        best_score = 0.0
-        
-        for template_id, template in self.templates.items():
-            if template.type == doc_type:
-                # Simple scoring based on feature matches
-                score = 0.0
-                
-                if "aspect_ratio" in features:
-                    ar_diff = abs(features["aspect_ratio"] - template.aspect_ratio)
-                    score += max(0, 1 - ar_diff)
-                
-                if score > best_score:
-                    best_score = score
-                    best_template_id = template_id
-        
-        return best_template_id or "unknown"
+        index = self.template_index
+        if "aspect_ratio" not in features or not index.ids:
+            return "unknown"
+        
+        # Simple scoring based on aspect ratio; first template wins ties
+        score = np.maximum(0, 1 - np.abs(features["aspect_ratio"] - index.aspect_ratios))
+        score[np.array(index.types) != doc_type.value] = 0.0
+        best = int(np.argmax(score))
+        return index.ids[best] if score[best] > 0 else "unknown"
     
     def get_template(self, template_id: str) -> Optional[DocumentTemplate]:
         """Get template by ID"""
@@ -689,4 +842,5 @@ class DocumentClassifier:
         return validation_results
 
 # Export main components
-__all__ = ["DocumentClassifier", "DocumentType", "ClassificationResult", "DocumentTemplate"]
\ No newline at end of file
+__all__ = ["DocumentClassifier", "DocumentType", "ClassificationResult", "DocumentTemplate",
+           "PreprocessedImage", "TemplateIndex"]
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Micro-Batching
+Coalesces concurrent single-item inference calls into batched forward passes
+
+Request threads call submit() with one input and block on the result. A
+single worker thread takes the first queued input, keeps collecting for up
+to max_wait_ms or max_batch_size inputs, runs one batched call and hands
+each caller its own output. Under load the weights are read once per batch
+instead of once per image, and only one thread drives torch's intra-op pool.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """Background worker that runs fn over small batches of submitted items"""
+
+    def __init__(self, fn: Callable[[List[Any]], List[Any]], max_batch_size: int = 8,
+                 max_wait_ms: float = 2.0, name: str = "micro-batcher"):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.fn = fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max(0.0, max_wait_ms) / 1000
+        self.name = name
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.batches = 0
+        self.items = 0
+        self.largest_batch = 0
+        self.errors = 0
+        self.total_queue_ms = 0.0
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, item: Any, timeout: Optional[float] = None) -> Any:
+        """Queue one item and block until its batched result is ready"""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"Batcher '{self.name}' is closed")
+            self._queue.put((item, future, time.perf_counter()))
+        return future.result(timeout)
+
+    def _collect(self, first: Any) -> List[Any]:
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait_s
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                entry = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is _STOP:
+                # Finish this batch, then stop
+                self._queue.put(_STOP)
+                break
+            batch.append(entry)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch = self._collect(first)
+            started = time.perf_counter()
+            try:
+                outputs = self.fn([item for item, _, _ in batch])
+                if len(outputs) != len(batch):
+                    raise RuntimeError(f"Batch function returned {len(outputs)} results for {len(batch)} inputs")
+                for (_, future, _), output in zip(batch, outputs):
+                    future.set_result(output)
+            except Exception as e:
+                logger.warning(f"Batch of {len(batch)} failed in '{self.name}': {e}")
+                self.errors += 1
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            self.batches += 1
+            self.items += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+            self.total_queue_ms += sum((started - queued) * 1000 for _, _, queued in batch)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Batch size and queueing snapshot"""
+        return {
+            "name": self.name,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_s * 1000,
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": round(self.items / self.batches, 3) if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "avg_queue_ms": round(self.total_queue_ms / self.items, 3) if self.items else 0.0,
+            "errors": self.errors,
+            "pending": self._queue.qsize(),
+        }
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop accepting work; queued items are still processed"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+
+__all__ = ["MicroBatcher"]
@@ -7,11 +7,15 @@ This module provides centralized threshold management with:
 - Dynamic threshold updates
 - Validation and bounds checking
 - Audit logging of changes
+- Shared, hot-reloading snapshot via get_threshold_manager()
 """
 
 import os
 import json
 import logging
+import signal
+import threading
+import time
 from typing import Dict, Any, Optional, Union, Tuple
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field, asdict
@@ -84,11 +88,24 @@ class ThresholdManager:
         """
         self.config_path = config_path or Path("/workspace/KYC VERIFICATION/configs/thresholds.json")
         self.thresholds: Dict[str, ThresholdConfig] = {}
+        self.version = 1
+        self.source_mtime = self._config_mtime()
         self._load_defaults()
         self._load_from_env()
         if self.config_path.exists():
             self._load_from_file()
     
+    def _config_mtime(self) -> Optional[int]:
+        """Modification time of the config file (None if it does not exist)"""
+        try:
+            return self.config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def is_stale(self) -> bool:
+        """Whether the config file changed since this instance was loaded"""
+        return self._config_mtime() != self.source_mtime
+    
     def _load_defaults(self):
         """Load default threshold configurations"""
         defaults = [
@@ -584,16 +601,76 @@ class ThresholdManager:
         return summary
 
 
-# Singleton instance
-_threshold_manager = None
+# Shared snapshot served to request paths. A snapshot is never mutated by a
+# reload: a fresh ThresholdManager is built and the reference swapped, so a
+# request keeps a consistent view for as long as it holds its instance.
+RELOAD_CHECK_INTERVAL_SECONDS = float(os.environ.get("THRESHOLD_RELOAD_CHECK_SECONDS", "5"))
+
+_threshold_manager: Optional[ThresholdManager] = None
+_threshold_config_path: Optional[Path] = None
+_last_reload_check = 0.0
+_reload_requested = False
+_reload_lock = threading.Lock()
 
 
 def get_threshold_manager() -> ThresholdManager:
-    """Get or create the singleton threshold manager instance"""
-    global _threshold_manager
-    if _threshold_manager is None:
-        _threshold_manager = ThresholdManager()
-    return _threshold_manager
+    """
+    Get the shared threshold snapshot
+    
+    The config file's mtime is checked at most every
+    RELOAD_CHECK_INTERVAL_SECONDS; a change (or a pending SIGHUP) rebuilds
+    the snapshot with an incremented version. Between checks this is a
+    plain attribute read with no file access.
+    """
+    global _threshold_manager, _last_reload_check, _reload_requested
+    
+    manager = _threshold_manager
+    now = time.monotonic()
+    if (manager is not None and not _reload_requested
+            and now - _last_reload_check < RELOAD_CHECK_INTERVAL_SECONDS):
+        return manager
+    
+    with _reload_lock:
+        manager = _threshold_manager
+        if manager is None:
+            _threshold_manager = ThresholdManager(_threshold_config_path)
+        elif _reload_requested or now - _last_reload_check >= RELOAD_CHECK_INTERVAL_SECONDS:
+            if _reload_requested or manager.is_stale():
+                refreshed = ThresholdManager(manager.config_path)
+                refreshed.version = manager.version + 1
+                _threshold_manager = refreshed
+                logger.info(f"Thresholds reloaded from {refreshed.config_path} (version {refreshed.version})")
+        _reload_requested = False
+        _last_reload_check = now
+        return _threshold_manager
+
+
+def request_threshold_reload(*_args) -> None:
+    """Force a rebuild on the next get_threshold_manager() call (signal-safe)"""
+    global _reload_requested
+    _reload_requested = True
+
+
+def install_reload_signal_handler() -> bool:
+    """
+    Reload thresholds on SIGHUP
+    
+    Returns:
+        True if the handler was installed (requires SIGHUP and the main thread)
+    """
+    if not hasattr(signal, "SIGHUP") or threading.current_thread() is not threading.main_thread():
+        return False
+    signal.signal(signal.SIGHUP, request_threshold_reload)
+    return True
+
+
+def reset_threshold_manager(config_path: Optional[Path] = None) -> None:
+    """Drop the shared snapshot; the next call loads from config_path (or the default)"""
+    global _threshold_manager, _threshold_config_path, _reload_requested
+    with _reload_lock:
+        _threshold_manager = None
+        _threshold_config_path = Path(config_path) if config_path else None
+        _reload_requested = False
 
 
 if __name__ == "__main__":
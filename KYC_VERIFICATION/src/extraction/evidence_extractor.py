@@ -4,11 +4,13 @@ Phase 3: OCR/MRZ/Barcode/NFC extraction with ROIs and confidences
 Includes face detection/crops for downstream biometrics (≥112×112)
 """
 
+import copy
 import cv2
 import numpy as np
 import pytesseract
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass, replace
 from enum import Enum
 import re
 import logging
@@ -16,6 +18,8 @@ from pathlib import Path
 import json
 import hashlib
 
+from .result_cache import image_cache_key
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -41,6 +45,23 @@ except Exception as e:
     ZBAR_AVAILABLE = False
     logger.warning(f"ZBar/pyzbar not available; barcode decoding will be skipped. Details: {e}")
 
+# Sub-extractors run by extract_all, in result order
+SUB_EXTRACTORS = ("ocr", "mrz", "barcode", "face", "nfc")
+
+# MRZData attributes reported as extracted fields
+MRZ_FIELDS = ("document_number", "surname", "given_names", "birth_date",
+              "expiry_date", "nationality", "sex")
+
+def _empty_ocr_result() -> Dict[str, Any]:
+    """OCR result returned when OCR is skipped, fails or times out"""
+    return {
+        "fields": [],
+        "full_text": "",
+        "lines": [],
+        "total_words": 0,
+        "avg_confidence": 0.0,
+    }
+
 class ExtractionType(Enum):
     """Types of evidence extraction"""
     OCR_TEXT = "ocr_text"
@@ -108,9 +129,27 @@ class ExtractionResult:
 class EvidenceExtractor:
     """Extracts evidence from document images"""
     
-    def __init__(self, config_path: Optional[str] = None):
-        """Initialize evidence extractor"""
+    def __init__(self, config_path: Optional[str] = None, ocr_pool: Optional[Any] = None,
+                 result_cache: Optional[Any] = None):
+        """
+        Initialize evidence extractor
+
+        Args:
+            config_path: Optional JSON config overriding the defaults
+            ocr_pool: Optional ResourcePool of TesseractWorker instances; when
+                set, OCR runs on a long-lived engine instead of spawning a
+                tesseract process per call
+            result_cache: Optional ExtractionResultCache shared across
+                extractors; resubmitted images are served from it
+        """
         self.config = self._load_config(config_path)
+        # Cache entries are only valid for the config that produced them
+        self.config_version = hashlib.sha256(
+            json.dumps(self.config, sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+        self.ocr_pool = ocr_pool
+        self.result_cache = result_cache
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.face_cascade = self._load_face_detector()
         self.mrz_validator = MRZValidator()
         # Optional NFC support
@@ -137,7 +176,19 @@ class EvidenceExtractor:
             },
             "mrz": {
                 "validate_checksums": True,
-                "strict_mode": False
+                "strict_mode": False,
+                # Bottom fraction of the page searched for the MRZ band
+                "search_band": 0.4,
+                # Document types whose MRZ is read before deciding on full-page OCR
+                "mrz_first_document_types": ["PASSPORT", "TD1", "TD3"],
+                # Fields that must come from a validated MRZ to skip full-page OCR
+                "required_fields": ["document_number", "surname", "given_names",
+                                    "birth_date", "expiry_date", "nationality"]
+            },
+            "concurrency": {
+                "max_workers": len(SUB_EXTRACTORS),
+                # Per sub-extractor timeouts; a slow one yields a partial result
+                "timeouts_s": {"ocr": 20.0, "mrz": 10.0, "barcode": 5.0, "face": 5.0, "nfc": 10.0}
             },
             "barcode": {
                 # Use ZBar symbologies only if pyzbar/zbar is available
@@ -173,61 +224,154 @@ class EvidenceExtractor:
         return face_cascade
     
     def extract_all(self, image: np.ndarray, 
-                   document_type: Optional[str] = None) -> ExtractionResult:
+                   document_type: Optional[str] = None,
+                   extractors: Optional[Iterable[str]] = None,
+                   required_fields: Optional[Iterable[str]] = None) -> ExtractionResult:
         """
         Extract all evidence from document image
+
+        Sub-extractors read the same image and run concurrently on the
+        extractor's thread pool (tesseract, zbar and OpenCV release the GIL),
+        so wall time approaches the slowest one. Each has its own timeout from
+        config["concurrency"]["timeouts_s"]; one that times out or fails is
+        reported in metadata["extractors"] and contributes an empty result.
+        After a timeout the thread pool is replaced, so later calls do not
+        queue behind the stuck task (tesseract subprocesses are also killed
+        at the same timeout).
+
+        For MRZ document types (config["mrz"]["mrz_first_document_types"])
+        full-page OCR waits for the MRZ band result and is skipped when the
+        MRZ checksums validate and cover required_fields.
         
         Args:
             image: Input document image
             document_type: Optional document type hint
+            extractors: Subset of SUB_EXTRACTORS to run (default: all)
+            required_fields: MRZ fields needed to skip full-page OCR
+                (default: config["mrz"]["required_fields"])
             
         Returns:
             Complete extraction result
         """
         import time
         start_time = time.time()
-        
-        extracted_fields = []
-        
-        # Extract OCR text
-        logger.info("📝 Extracting OCR text...")
-        ocr_result = self.extract_ocr(image)
-        extracted_fields.extend(ocr_result["fields"])
-        
-        # Extract MRZ if present
-        logger.info("🔍 Checking for MRZ...")
-        mrz_data = self.extract_mrz(image)
+
+        selected = SUB_EXTRACTORS if extractors is None else tuple(extractors)
+        unknown = set(selected) - set(SUB_EXTRACTORS)
+        if unknown:
+            raise ValueError(f"Unknown extractors: {sorted(unknown)}")
+        if "nfc" in selected and self.nfc_reader is None:
+            selected = tuple(name for name in selected if name != "nfc")
+        if required_fields is None:
+            required_fields = self.config["mrz"].get("required_fields", [])
+        required_fields = tuple(required_fields)
+
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = image_cache_key(image, self.config_version, document_type,
+                                        tuple(sorted(selected)), required_fields)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                # Each caller gets its own copy so mutations never reach the cache
+                return replace(
+                    copy.deepcopy(cached),
+                    metadata={**cached.metadata, "cache_hit": True},
+                    extraction_time_ms=(time.time() - start_time) * 1000,
+                )
+
+        tasks = {
+            "ocr": lambda: self.extract_ocr(image),
+            "mrz": lambda: self._extract_mrz_band(image),
+            "barcode": lambda: self.extract_barcodes(image),
+            "face": lambda: self.extract_faces(image),
+            "nfc": self._read_nfc,
+        }
+        defaults = {
+            "ocr": _empty_ocr_result,
+            "mrz": lambda: (None, None),
+            "barcode": list,
+            "face": list,
+            "nfc": dict,
+        }
+        timeouts = self.config["concurrency"].get("timeouts_s", {})
+
+        mrz_first = (
+            "ocr" in selected and "mrz" in selected
+            and str(document_type).upper() in self.config["mrz"].get("mrz_first_document_types", [])
+        )
+
+        logger.info(f"Running extractors: {', '.join(selected)}")
+        executor = self._get_executor()
+        futures: Dict[str, Any] = {}
+        submitted: Dict[str, float] = {}
+
+        def submit(name: str) -> None:
+            submitted[name] = time.perf_counter()
+            futures[name] = executor.submit(self._timed, tasks[name])
+
+        results: Dict[str, Any] = {}
+        status: Dict[str, Dict[str, Any]] = {}
+        timed_out: List[str] = []
+
+        def collect(name: str) -> None:
+            if name not in futures:
+                results[name] = defaults[name]()
+                status[name] = {"status": "skipped"}
+                return
+            remaining = max(0.0, submitted[name] + timeouts.get(name, 30.0) - time.perf_counter())
+            try:
+                results[name], elapsed_ms = futures[name].result(timeout=remaining)
+                status[name] = {"status": "ok", "elapsed_ms": round(elapsed_ms, 2)}
+            except FuturesTimeoutError:
+                # The task keeps running in the background; its result is dropped
+                futures[name].cancel()
+                timed_out.append(name)
+                logger.warning(f"Extractor '{name}' timed out after {timeouts.get(name, 30.0)}s")
+                results[name] = defaults[name]()
+                status[name] = {"status": "timeout"}
+            except Exception as e:
+                logger.warning(f"Extractor '{name}' failed: {e}")
+                results[name] = defaults[name]()
+                status[name] = {"status": "error", "error": str(e)}
+
+        for name in selected:
+            if not (mrz_first and name == "ocr"):
+                submit(name)
+
+        if mrz_first:
+            collect("mrz")
+            if self._mrz_covers(results["mrz"][0], required_fields):
+                logger.info("✅ MRZ validated; skipping full-page OCR")
+                results["ocr"] = defaults["ocr"]()
+                status["ocr"] = {"status": "skipped", "reason": "mrz_validated"}
+            else:
+                submit("ocr")
+
+        for name in SUB_EXTRACTORS:
+            if name not in status:
+                collect(name)
+
+        if timed_out:
+            # Leave the stuck tasks to the old pool; the next call starts a new one
+            executor.shutdown(wait=False)
+            if self._executor is executor:
+                self._executor = None
+
+        ocr_result = results["ocr"]
+        mrz_data, mrz_roi = results["mrz"]
+        barcodes = results["barcode"]
+        faces = results["face"]
+        nfc_metadata = results["nfc"]
+        extracted_fields = list(ocr_result["fields"])
+        if mrz_data is not None:
+            extracted_fields.extend(self._mrz_fields(mrz_data, mrz_roi))
+
         if mrz_data:
             logger.info(f"✅ MRZ detected: {mrz_data.mrz_type}")
-        
-        # Extract barcodes
-        logger.info("📊 Scanning for barcodes...")
-        barcodes = self.extract_barcodes(image)
         if barcodes:
             logger.info(f"✅ Found {len(barcodes)} barcode(s)")
-        
-        # Detect and extract faces
-        logger.info("👤 Detecting faces...")
-        faces = self.extract_faces(image)
         if faces:
             logger.info(f"✅ Detected {len(faces)} face(s)")
-        
-        # NFC (DG1/DG2) if reader available
-        nfc_metadata: Dict[str, Any] = {}
-        if self.nfc_reader is not None:
-            try:
-                dg1 = self.nfc_reader.read_dg1()
-                dg2 = self.nfc_reader.read_dg2()
-                if dg1:
-                    nfc_metadata["dg1"] = {
-                        "document_number": getattr(dg1, "document_number", None),
-                        "name": getattr(dg1, "name", None),
-                        "expiry_date": getattr(dg1, "expiry_date", None),
-                    }
-                if dg2:
-                    nfc_metadata["dg2_present"] = True
-            except Exception as e:
-                logger.warning(f"NFC read failed: {e}")
 
         # Validate extracted data
         validation_passed = self._validate_extraction(
@@ -237,7 +381,7 @@ class EvidenceExtractor:
         # Calculate extraction time
         extraction_time_ms = (time.time() - start_time) * 1000
         
-        return ExtractionResult(
+        result = ExtractionResult(
             extracted_fields=extracted_fields,
             mrz_data=mrz_data,
             faces=faces,
@@ -249,11 +393,69 @@ class EvidenceExtractor:
                 "has_mrz": mrz_data is not None,
                 "has_faces": len(faces) > 0,
                 "has_barcodes": len(barcodes) > 0,
-                "nfc": nfc_metadata or None
+                "nfc": nfc_metadata or None,
+                "extractors": status,
+                "partial": any(s["status"] in ("timeout", "error") for s in status.values()),
+                # Pixels handed to the OCR engine, for OCR cost accounting
+                "ocr_pixels": {
+                    "full_page": image.shape[0] * image.shape[1] if "ocr" in futures else 0,
+                    "mrz_band": mrz_roi[2] * mrz_roi[3] if mrz_roi else 0,
+                },
+                "cache_hit": False,
             },
             validation_passed=validation_passed,
             extraction_time_ms=extraction_time_ms
         )
+
+        # Partial results (timeouts/errors) are retried rather than replayed
+        if cache_key is not None and not result.metadata["partial"]:
+            self.result_cache.put(cache_key, copy.deepcopy(result))
+
+        return result
+
+    @staticmethod
+    def _timed(task: Callable[[], Any]) -> Tuple[Any, float]:
+        import time
+        start = time.perf_counter()
+        result = task()
+        return result, (time.perf_counter() - start) * 1000
+
+    def _ocr_timeout(self, name: str) -> float:
+        """Seconds before a tesseract subprocess is killed (the sub-extractor timeout)"""
+        return self.config["concurrency"].get("timeouts_s", {}).get(name, 30.0)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Per-extractor thread pool for sub-extractors, created on first use"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config["concurrency"].get("max_workers", len(SUB_EXTRACTORS)),
+                thread_name_prefix="evidence-extractor",
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the sub-extractor thread pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _read_nfc(self) -> Dict[str, Any]:
+        """NFC (DG1/DG2) summary if a reader is available"""
+        nfc_metadata: Dict[str, Any] = {}
+        try:
+            dg1 = self.nfc_reader.read_dg1()
+            dg2 = self.nfc_reader.read_dg2()
+            if dg1:
+                nfc_metadata["dg1"] = {
+                    "document_number": getattr(dg1, "document_number", None),
+                    "name": getattr(dg1, "name", None),
+                    "expiry_date": getattr(dg1, "expiry_date", None),
+                }
+            if dg2:
+                nfc_metadata["dg2_present"] = True
+        except Exception as e:
+            logger.warning(f"NFC read failed: {e}")
+        return nfc_metadata
     
     def extract_ocr(self, image: np.ndarray) -> Dict[str, Any]:
         """
@@ -266,15 +468,9 @@ class EvidenceExtractor:
             OCR extraction results
         """
         # Graceful fallback if Tesseract is not present
-        if not TESSERACT_AVAILABLE or pytesseract is None:
+        if self.ocr_pool is None and (not TESSERACT_AVAILABLE or pytesseract is None):
             logger.warning("Skipping OCR: Tesseract not available.")
-            return {
-                "fields": [],
-                "full_text": "",
-                "lines": [],
-                "total_words": 0,
-                "avg_confidence": 0.0,
-            }
+            return _empty_ocr_result()
         # Preprocess image for better OCR
         processed = self._preprocess_for_ocr(image)
         
@@ -286,21 +482,20 @@ class EvidenceExtractor:
         
         # Get detailed OCR data
         try:
-            ocr_data = pytesseract.image_to_data(
-                processed,
-                lang=self.config['ocr_config']['lang'],
-                config=custom_config,
-                output_type=pytesseract.Output.DICT,
-            )
+            if self.ocr_pool is not None:
+                with self.ocr_pool.acquire() as worker:
+                    ocr_data = worker.image_to_data(processed, psm=self.config['ocr_config']['psm'])
+            else:
+                ocr_data = pytesseract.image_to_data(
+                    processed,
+                    lang=self.config['ocr_config']['lang'],
+                    config=custom_config,
+                    output_type=pytesseract.Output.DICT,
+                    timeout=self._ocr_timeout("ocr"),
+                )
         except Exception as e:
             logger.warning(f"OCR failed, returning empty result. Details: {e}")
-            return {
-                "fields": [],
-                "full_text": "",
-                "lines": [],
-                "total_words": 0,
-                "avg_confidence": 0.0,
-            }
+            return _empty_ocr_result()
         
         # Extract fields with confidence
         fields = []
@@ -460,87 +655,150 @@ class EvidenceExtractor:
         Returns:
             Parsed MRZ data or None if not found
         """
+        return self._extract_mrz_band(image)[0]
+
+    def _extract_mrz_band(self, image: np.ndarray) -> Tuple[Optional[MRZData], Optional[Tuple[int, int, int, int]]]:
+        """MRZ data plus the (x, y, w, h) band that was OCR'd, if one was found"""
         # Find MRZ region
-        mrz_region = self._locate_mrz_region(image)
+        roi = self._locate_mrz_band(image)
         
-        if mrz_region is None:
-            return None
+        if roi is None:
+            return None, None
         
-        # Extract MRZ text
-        mrz_text = self._extract_mrz_text(mrz_region)
+        # Extract MRZ text from the band only
+        x, y, w, h = roi
+        mrz_text = self._extract_mrz_text(image[y:y + h, x:x + w])
         
         if not mrz_text:
-            return None
+            return None, roi
         
         # Parse MRZ data
         mrz_data = self._parse_mrz(mrz_text)
         
         # Validate checksums if configured
-        if self.config['mrz']['validate_checksums']:
+        if mrz_data is not None and self.config['mrz']['validate_checksums']:
             mrz_data = self.mrz_validator.validate(mrz_data)
         
-        return mrz_data
+        return mrz_data, roi
+
+    def _mrz_covers(self, mrz_data: Optional[MRZData], required_fields: Iterable[str]) -> bool:
+        """Whether a checksum-valid MRZ supplies every required field"""
+        if mrz_data is None or not mrz_data.check_digits or not all(mrz_data.check_digits.values()):
+            return False
+        return all(getattr(mrz_data, field, None) for field in required_fields)
+
+    def _mrz_fields(self, mrz_data: MRZData, roi: Optional[Tuple[int, int, int, int]]) -> List[ExtractedField]:
+        """MRZ values as extracted fields"""
+        validation_status = "valid" if mrz_data.check_digits and all(mrz_data.check_digits.values()) else "invalid"
+        return [
+            ExtractedField(
+                field_name=field,
+                value=getattr(mrz_data, field),
+                confidence=mrz_data.confidence,
+                extraction_type=ExtractionType.MRZ,
+                roi=roi or (0, 0, 0, 0),
+                validation_status=validation_status,
+                metadata={"mrz_type": mrz_data.mrz_type}
+            )
+            for field in MRZ_FIELDS
+            if getattr(mrz_data, field)
+        ]
     
     def _locate_mrz_region(self, image: np.ndarray) -> Optional[np.ndarray]:
         """Locate MRZ region in document"""
+        roi = self._locate_mrz_band(image)
+        if roi is None:
+            return None
+        x, y, w, h = roi
+        return image[y:y + h, x:x + w]
+
+    def _locate_mrz_band(self, image: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Locate the MRZ band morphologically, without OCR
+
+        Dark text on the light bottom band is isolated with a black-hat
+        filter, characters are merged into line blobs with a wide closing
+        kernel, and the bottom-most run of 2-3 evenly sized text lines is
+        taken as the MRZ.
+
+        Returns:
+            (x, y, w, h) of the band in image coordinates, or None
+        """
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
-        
-        # MRZ typically in bottom 30% of document
-        height = gray.shape[0]
-        roi = gray[int(height * 0.7):, :]
-        
-        # Apply morphological operations to find text regions
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (30, 5))
-        morph = cv2.morphologyEx(roi, cv2.MORPH_BLACKHAT, kernel)
-        
-        # Find horizontal text lines
-        thresh = cv2.threshold(morph, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)[1]
-        
-        # Check if MRZ-like pattern exists
-        horizontal_projection = np.sum(thresh, axis=1)
-        
-        # MRZ has 2-3 distinct lines with specific spacing
-        lines = []
-        in_line = False
-        start = 0
-        
-        for i, val in enumerate(horizontal_projection):
-            if val > thresh.shape[1] * 0.3:  # Significant horizontal content
-                if not in_line:
-                    start = i
-                    in_line = True
-            else:
-                if in_line:
-                    lines.append((start, i))
-                    in_line = False
-        
-        # Check if we have 2 or 3 lines (TD1/TD2 or TD3)
-        if len(lines) in [2, 3]:
-            # Extract MRZ region
-            top = int(height * 0.7) + lines[0][0]
-            bottom = int(height * 0.7) + lines[-1][1]
-            mrz_region = image[top:bottom, :]
-            return mrz_region
-        
-        return None
+        height, width = gray.shape
+        band_top = int(height * (1.0 - self.config["mrz"].get("search_band", 0.4)))
+        roi = gray[band_top:, :]
+        if roi.size == 0:
+            return None
+
+        # Kernel sizes scale with the page so small captures and scans both work
+        char_h = max(3, height // 60)
+        blackhat = cv2.morphologyEx(
+            roi, cv2.MORPH_BLACKHAT, cv2.getStructuringElement(cv2.MORPH_RECT, (char_h * 3, char_h))
+        )
+        thresh = cv2.threshold(blackhat, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)[1]
+        lines_mask = cv2.morphologyEx(
+            thresh, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (char_h * 3, 1))
+        )
+
+        # Rows where merged text spans most of the page width, as MRZ lines do
+        row_coverage = np.count_nonzero(lines_mask, axis=1) / width
+        text_rows = np.concatenate([[False], row_coverage > 0.6, [False]])
+        edges = np.flatnonzero(np.diff(text_rows.astype(np.int8)))
+        lines = [(a, b) for a, b in zip(edges[::2], edges[1::2]) if b - a >= 2]
+        if len(lines) < 2:
+            return None
+
+        # Bottom-most run of lines with similar heights and regular spacing
+        ref_h = lines[-1][1] - lines[-1][0]
+        group = [lines[-1]]
+        for a, b in reversed(lines[:-1]):
+            gap = group[0][0] - b
+            if len(group) == 3 or abs((b - a) - ref_h) > ref_h * 0.5 or gap > ref_h * 2:
+                break
+            group.insert(0, (a, b))
+        if len(group) not in (2, 3):
+            return None
+
+        pad = max(2, ref_h // 2)
+        top = max(0, band_top + group[0][0] - pad)
+        bottom = min(height, band_top + group[-1][1] + pad)
+        cols = np.flatnonzero(lines_mask[group[0][0]:group[-1][1]].any(axis=0))
+        left = max(0, int(cols[0]) - pad)
+        right = min(width, int(cols[-1]) + 1 + pad)
+        return left, top, right - left, bottom - top
     
     def _extract_mrz_text(self, mrz_region: np.ndarray) -> List[str]:
         """Extract text from MRZ region"""
         # Preprocess for MRZ OCR
         gray = cv2.cvtColor(mrz_region, cv2.COLOR_BGR2GRAY) if len(mrz_region.shape) == 3 else mrz_region
 
+        # Tesseract reads best with character heights around 30px
+        if gray.shape[0] < 60:
+            scale = 60.0 / gray.shape[0]
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+
         # Enhance contrast
         enhanced = cv2.equalizeHist(gray)
 
         # Use specific OCR settings for MRZ
-        custom_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789<'
+        whitelist = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789<"
+        custom_config = rf'--oem 3 --psm 6 -c tessedit_char_whitelist={whitelist}'
+        # Pooled workers carry the document OCR language; MRZ is always read as eng, oem 3
+        ocr_config = self.config['ocr_config']
+        use_pool = self.ocr_pool is not None and (ocr_config['lang'], ocr_config['oem']) == ("eng", 3)
         # If Tesseract is unavailable, skip MRZ OCR
-        if not TESSERACT_AVAILABLE or pytesseract is None:
+        if not use_pool and (not TESSERACT_AVAILABLE or pytesseract is None):
             logger.warning("Skipping MRZ OCR: Tesseract not available.")
             return []
 
         try:
-            text = pytesseract.image_to_string(enhanced, config=custom_config)
+            if use_pool:
+                with self.ocr_pool.acquire() as worker:
+                    text = worker.image_to_string(enhanced, psm=6, whitelist=whitelist)
+            else:
+                text = pytesseract.image_to_string(enhanced, config=custom_config,
+                                                   timeout=self._ocr_timeout("mrz"))
         except Exception as e:
             logger.warning(f"MRZ OCR failed, skipping. Details: {e}")
             return []
@@ -551,6 +809,14 @@ class EvidenceExtractor:
             cleaned = line.strip().replace(' ', '')
             if len(cleaned) > 20:  # MRZ lines are typically 30-44 chars
                 lines.append(cleaned)
+
+        # OCR often drops or adds trailing fillers; snap near-miss lengths
+        expected = {2: 44, 3: 30}.get(len(lines))
+        if expected:
+            lines = [
+                (line + '<' * expected)[:expected] if abs(len(line) - expected) <= 2 else line
+                for line in lines
+            ]
         
         return lines
     
@@ -566,7 +832,7 @@ class EvidenceExtractor:
             logger.warning(f"Unexpected MRZ format with {len(mrz_lines)} lines")
             return None
     
-    def _parse_td3(self, lines: List[str]) -> MRZData:
+    def _parse_td3(self, lines: List[str]) -> Optional[MRZData]:
         """Parse TD3 format MRZ (passports)"""
         if len(lines) != 2 or len(lines[0]) != 44 or len(lines[1]) != 44:
             return None
@@ -577,30 +843,24 @@ class EvidenceExtractor:
         # Parse line 1
         doc_type = line1[0:2].replace('<', '')
         country = line1[2:5].replace('<', '')
-        names = line1[5:44].split('<<')
-        surname = names[0].replace('<', ' ').strip() if names else ''
-        given_names = names[1].replace('<', ' ').strip() if len(names) > 1 else ''
+        surname, given_names = self._parse_mrz_names(line1[5:44])
         
         # Parse line 2
         doc_number = line2[0:9].replace('<', '')
-        doc_number_check = line2[9]
         nationality = line2[10:13].replace('<', '')
         birth_date = line2[13:19]
-        birth_date_check = line2[19]
         sex = line2[20]
         expiry_date = line2[21:27]
-        expiry_date_check = line2[27]
         optional_data = line2[28:42].replace('<', '')
-        optional_check = line2[42]
-        composite_check = line2[43]
         
-        # Validate checksums
+        # Validate checksums over the raw fields (fillers count as zero)
+        check = self.mrz_validator.matches
         check_digits = {
-            "document_number": self.mrz_validator.check_digit(doc_number) == doc_number_check,
-            "birth_date": self.mrz_validator.check_digit(birth_date) == birth_date_check,
-            "expiry_date": self.mrz_validator.check_digit(expiry_date) == expiry_date_check,
-            "optional": self.mrz_validator.check_digit(optional_data) == optional_check,
-            "composite": True  # TODO: Implement composite check
+            "document_number": check(line2[0:9], line2[9]),
+            "birth_date": check(birth_date, line2[19]),
+            "expiry_date": check(expiry_date, line2[27]),
+            "optional": check(line2[28:42], line2[42]),
+            "composite": check(line2[0:10] + line2[13:20] + line2[21:43], line2[43])
         }
         
         return MRZData(
@@ -621,27 +881,47 @@ class EvidenceExtractor:
             confidence=0.9 if all(check_digits.values()) else 0.5
         )
     
-    def _parse_td1(self, lines: List[str]) -> MRZData:
+    def _parse_td1(self, lines: List[str]) -> Optional[MRZData]:
         """Parse TD1 format MRZ (ID cards)"""
-        # Similar implementation for TD1 format
-        # This is a simplified version
+        if len(lines) != 3 or any(len(line) != 30 for line in lines):
+            return None
+
+        line1, line2, line3 = lines
+        surname, given_names = self._parse_mrz_names(line3)
+
+        check = self.mrz_validator.matches
+        check_digits = {
+            "document_number": check(line1[5:14], line1[14]),
+            "birth_date": check(line2[0:6], line2[6]),
+            "expiry_date": check(line2[8:14], line2[14]),
+            "composite": check(line1[5:30] + line2[0:7] + line2[8:15] + line2[18:29], line2[29])
+        }
+
         return MRZData(
             mrz_type="TD1",
-            document_type="ID",
-            country_code="PHL",
-            document_number="",
-            birth_date="",
-            sex="",
-            expiry_date="",
-            nationality="PHL",
-            surname="",
-            given_names="",
-            optional_data1="",
-            optional_data2="",
-            check_digits={},
+            document_type=line1[0:2].replace('<', ''),
+            country_code=line1[2:5].replace('<', ''),
+            document_number=line1[5:14].replace('<', ''),
+            birth_date=line2[0:6],
+            sex=line2[7],
+            expiry_date=line2[8:14],
+            nationality=line2[15:18].replace('<', ''),
+            surname=surname,
+            given_names=given_names,
+            optional_data1=line1[15:30].replace('<', ''),
+            optional_data2=line2[18:29].replace('<', ''),
+            check_digits=check_digits,
             raw_text=lines,
-            confidence=0.5
+            confidence=0.9 if all(check_digits.values()) else 0.5
         )
+
+    @staticmethod
+    def _parse_mrz_names(field: str) -> Tuple[str, str]:
+        """Split an MRZ name field into (surname, given names)"""
+        names = field.split('<<', 1)
+        surname = names[0].replace('<', ' ').strip()
+        given_names = names[1].replace('<', ' ').strip() if len(names) > 1 else ''
+        return surname, given_names
     
     def extract_barcodes(self, image: np.ndarray) -> List[Dict[str, Any]]:
         """
@@ -849,6 +1129,10 @@ class MRZValidator:
                 total += value * weight[i % 3]
         
         return str(total % 10)
+
+    def matches(self, data: str, check_char: str) -> bool:
+        """Whether check_char is the check digit of data ('<' reads as 0)"""
+        return self.check_digit(data) == check_char.replace('<', '0')
     
     def validate(self, mrz_data: MRZData) -> MRZData:
         """Validate MRZ checksums"""
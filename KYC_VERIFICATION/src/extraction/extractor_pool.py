@@ -0,0 +1,283 @@
+"""
+Extractor Pooling
+Pre-initialized EvidenceExtractor instances and long-lived Tesseract workers
+
+Building an EvidenceExtractor loads the face detector and OCR configuration,
+and pytesseract starts a new tesseract process (and re-loads the language
+model) on every call. The pools here keep warm instances for reuse:
+
+- ResourcePool: fixed-size, thread-safe pool with utilization metrics
+- TesseractWorker: one tesserocr engine handle kept open across calls
+  (optional and off by default; requires the tesserocr bindings)
+- ExtractorPool: EvidenceExtractor pool sharing one Tesseract worker pool
+  and one content-hash result cache
+
+Pool sizes come from environment config (EXTRACTOR_POOL_SIZE,
+TESSERACT_POOL_SIZE, EXTRACTOR_POOL_TIMEOUT_SECONDS); TESSERACT_POOL_SIZE
+defaults to 0, i.e. one tesseract process per call.
+"""
+
+import os
+import queue
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tesserocr  # type: ignore
+    TESSEROCR_AVAILABLE = True
+except Exception:
+    tesserocr = None  # type: ignore
+    TESSEROCR_AVAILABLE = False
+
+# Column order of tesseract's TSV output (same as pytesseract.image_to_data)
+TSV_COLUMNS = ["level", "page_num", "block_num", "par_num", "line_num", "word_num",
+               "left", "top", "width", "height", "conf", "text"]
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when no pooled instance becomes free within the timeout"""
+
+
+class ResourcePool:
+    """Fixed-size pool of pre-built instances with utilization metrics"""
+
+    def __init__(self, factory: Callable[[], Any], size: int, name: str = "pool",
+                 acquire_timeout: Optional[float] = 30.0):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.name = name
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self._items: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._all: List[Any] = []
+
+        start = time.perf_counter()
+        for _ in range(size):
+            item = factory()
+            self._all.append(item)
+            self._items.put(item)
+        self.init_ms = (time.perf_counter() - start) * 1000
+
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.acquisitions = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.busy_ms = 0.0
+
+        logger.info(f"Pool '{name}' ready: {size} instances in {self.init_ms:.0f}ms")
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Borrow an instance for the duration of the with-block
+
+        Raises:
+            PoolTimeoutError: If none is free within timeout (default acquire_timeout)
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        start = time.perf_counter()
+        try:
+            item = self._items.get_nowait()
+            waited = False
+        except queue.Empty:
+            waited = True
+            try:
+                item = self._items.get(timeout=timeout)
+            except queue.Empty:
+                with self._lock:
+                    self.waits += 1
+                    self.timeouts += 1
+                raise PoolTimeoutError(f"No free instance in pool '{self.name}' after {timeout}s")
+
+        acquired = time.perf_counter()
+        wait_ms = (acquired - start) * 1000
+        with self._lock:
+            self.acquisitions += 1
+            self.waits += int(waited)
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+        try:
+            yield item
+        finally:
+            with self._lock:
+                self.in_use -= 1
+                self.busy_ms += (time.perf_counter() - acquired) * 1000
+            self._items.put(item)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Pool utilization snapshot"""
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": self.size,
+                "in_use": self.in_use,
+                "available": self.size - self.in_use,
+                "utilization": self.in_use / self.size,
+                "peak_in_use": self.peak_in_use,
+                "acquisitions": self.acquisitions,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait_ms / max(self.acquisitions, 1), 3),
+                "max_wait_ms": round(self.max_wait_ms, 3),
+                "avg_busy_ms": round(self.busy_ms / max(self.acquisitions, 1), 3),
+                "init_ms": round(self.init_ms, 1),
+            }
+
+    def close(self) -> None:
+        """Release instances that hold native resources"""
+        for item in self._all:
+            close = getattr(item, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.warning(f"Failed to close pooled instance in '{self.name}': {e}")
+
+
+def _tsv_to_dict(tsv: str) -> Dict[str, List[Any]]:
+    """Parse tesseract TSV rows into pytesseract's Output.DICT layout"""
+    data: Dict[str, List[Any]] = {column: [] for column in TSV_COLUMNS}
+    for row in tsv.splitlines():
+        parts = row.split("\t")
+        if len(parts) < len(TSV_COLUMNS) - 1 or parts[0] == "level":
+            continue
+        parts += [""] * (len(TSV_COLUMNS) - len(parts))
+        for column, value in zip(TSV_COLUMNS[:-2], parts):
+            data[column].append(int(value))
+        data["conf"].append(float(parts[10]))
+        data["text"].append(parts[11])
+    return data
+
+
+class TesseractWorker:
+    """Long-lived tesseract engine reused across OCR calls
+
+    Holds one initialized tesserocr handle, so the language model is loaded
+    once instead of per call and no process is spawned per image.
+    """
+
+    def __init__(self, lang: str = "eng", oem: int = 3):
+        if not TESSEROCR_AVAILABLE:
+            raise RuntimeError("tesserocr is not installed")
+        self.lang = lang
+        self.oem = oem
+        self.api = tesserocr.PyTessBaseAPI(lang=lang, oem=oem)
+
+    def _set_image(self, image: np.ndarray, psm: int, whitelist: str = "") -> None:
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        image = np.ascontiguousarray(image, dtype=np.uint8)
+        height, width = image.shape[:2]
+        bytes_per_pixel = 1 if image.ndim == 2 else image.shape[2]
+        self.api.SetPageSegMode(psm)
+        self.api.SetVariable("tessedit_char_whitelist", whitelist)
+        self.api.SetImageBytes(image.tobytes(), width, height, bytes_per_pixel, width * bytes_per_pixel)
+
+    def image_to_data(self, image: np.ndarray, psm: int = 3) -> Dict[str, List[Any]]:
+        """Word boxes and confidences in pytesseract Output.DICT layout"""
+        try:
+            self._set_image(image, psm)
+            self.api.Recognize()
+            return _tsv_to_dict(self.api.GetTSVText(0))
+        finally:
+            self.api.Clear()
+
+    def image_to_string(self, image: np.ndarray, psm: int = 3, whitelist: str = "") -> str:
+        try:
+            self._set_image(image, psm, whitelist)
+            return self.api.GetUTF8Text()
+        finally:
+            self.api.Clear()
+
+    def close(self) -> None:
+        self.api.End()
+
+
+class ExtractorPool:
+    """Pre-initialized EvidenceExtractor instances sharing Tesseract workers"""
+
+    def __init__(self, size: int, tesseract_workers: int = 0,
+                 acquire_timeout: Optional[float] = 30.0, config_path: Optional[str] = None,
+                 result_cache: Optional[Any] = None,
+                 factory: Optional[Callable[..., Any]] = None):
+        if factory is None:
+            from .evidence_extractor import EvidenceExtractor
+            factory = EvidenceExtractor
+
+        self.result_cache = result_cache
+        self.extractors = ResourcePool(
+            lambda: factory(config_path, result_cache=result_cache),
+            size, name="evidence_extractor", acquire_timeout=acquire_timeout,
+        )
+
+        # Workers use the extractors' OCR language and engine mode, so pooled
+        # and per-call OCR read the same way
+        self.ocr_pool: Optional[ResourcePool] = None
+        if tesseract_workers > 0:
+            if TESSEROCR_AVAILABLE:
+                ocr_config = self.extractors._all[0].config["ocr_config"]
+                self.ocr_pool = ResourcePool(
+                    lambda: TesseractWorker(ocr_config["lang"], ocr_config["oem"]), tesseract_workers,
+                    name="tesseract", acquire_timeout=acquire_timeout,
+                )
+                for extractor in self.extractors._all:
+                    extractor.ocr_pool = self.ocr_pool
+            else:
+                logger.warning("tesserocr not installed; OCR falls back to one tesseract process per call")
+
+    def acquire(self, timeout: Optional[float] = None):
+        return self.extractors.acquire(timeout)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "extractors": self.extractors.get_metrics(),
+            "tesseract": self.ocr_pool.get_metrics() if self.ocr_pool else None,
+        }
+
+    def close(self) -> None:
+        self.extractors.close()
+        if self.ocr_pool:
+            self.ocr_pool.close()
+
+
+def create_extractor_pool(size: Optional[int] = None, tesseract_workers: Optional[int] = None,
+                          acquire_timeout: Optional[float] = None) -> ExtractorPool:
+    """Build an ExtractorPool sized from arguments or environment config
+
+    The shared result cache is configured by create_result_cache
+    (EXTRACTION_CACHE_* variables).
+    """
+    from .result_cache import create_result_cache
+
+    default_size = max(2, min(8, os.cpu_count() or 2))
+    size = size if size is not None else int(os.getenv("EXTRACTOR_POOL_SIZE", default_size))
+    if tesseract_workers is None:
+        tesseract_workers = int(os.getenv("TESSERACT_POOL_SIZE", "0"))
+    if acquire_timeout is None:
+        acquire_timeout = float(os.getenv("EXTRACTOR_POOL_TIMEOUT_SECONDS", "30"))
+    return ExtractorPool(size, tesseract_workers, acquire_timeout, result_cache=create_result_cache())
+
+
+__all__ = [
+    "ResourcePool",
+    "PoolTimeoutError",
+    "TesseractWorker",
+    "ExtractorPool",
+    "create_extractor_pool",
+    "TESSEROCR_AVAILABLE",
+]
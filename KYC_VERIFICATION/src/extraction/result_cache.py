@@ -0,0 +1,258 @@
+"""
+Extraction Result Cache
+Content-addressed cache for EvidenceExtractor results
+
+Mobile clients resubmit the same capture after network timeouts. Results are
+keyed by a hash of the decoded pixel buffer plus the extractor config
+version and request options, so a resubmission is served without rerunning
+OCR, MRZ, barcode and face extraction.
+
+- Memory tier: size- and TTL-bounded LRU (OrderedDict, O(1) operations)
+- Optional disk tier: one Fernet-encrypted file per entry under a byte
+  budget, so extracted PII is never written in clear; the Fernet token
+  timestamp enforces the retention TTL on read
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    CRYPTO_AVAILABLE = True
+except Exception:
+    Fernet = None  # type: ignore
+    InvalidToken = Exception  # type: ignore
+    CRYPTO_AVAILABLE = False
+
+DISK_SUFFIX = ".bin"
+
+
+def image_cache_key(image: np.ndarray, config_version: str, *options: Any) -> str:
+    """Hash of the decoded pixel buffer, its layout, the config version and options"""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{image.shape}|{image.dtype}|{config_version}|{options!r}".encode())
+    digest.update(np.ascontiguousarray(image).data)
+    return digest.hexdigest()
+
+
+class ExtractionResultCache:
+    """Size- and TTL-bounded LRU for extraction results with an encrypted disk tier"""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 900.0,
+                 disk_dir: Optional[str] = None, max_disk_bytes: int = 256 * 1024 * 1024,
+                 encryption_key: Optional[bytes] = None, clock=None):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_disk_bytes = int(max_disk_bytes)
+        self._clock = clock or time.monotonic
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.disk_evictions = 0
+
+        self.disk_dir: Optional[Path] = None
+        self._fernet = None
+        if disk_dir:
+            if not CRYPTO_AVAILABLE:
+                logger.warning("cryptography not installed; extraction disk cache disabled")
+            else:
+                if encryption_key is None:
+                    # Entries written under an ephemeral key are unreadable after restart
+                    logger.warning("No extraction cache key configured; using an ephemeral key")
+                    encryption_key = Fernet.generate_key()
+                self._fernet = Fernet(encryption_key)
+                self.disk_dir = Path(disk_dir)
+                self.disk_dir.mkdir(parents=True, exist_ok=True)
+                os.chmod(self.disk_dir, 0o700)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached result for key, or None on miss/expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if self._clock() - stored_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+
+        value, age = self._disk_get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            # Keep the original write time so promotion does not extend retention
+            self._insert(key, value, self._clock() - age)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Insert or refresh an entry in memory and, if enabled, on disk"""
+        with self._lock:
+            self._insert(key, value)
+        self._disk_put(key, value)
+
+    def _insert(self, key: str, value: Any, stored_at: Optional[float] = None) -> None:
+        now = self._clock()
+        self._entries[key] = (now if stored_at is None else stored_at, value)
+        self._entries.move_to_end(key)
+        while self._entries:
+            stored_at = next(iter(self._entries.values()))[0]
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            elif now - stored_at >= self.ttl_seconds:
+                self._entries.popitem(last=False)
+                self.expirations += 1
+            else:
+                break
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}{DISK_SUFFIX}"
+
+    def _disk_get(self, key: str) -> Tuple[Optional[Any], float]:
+        """Decrypted entry and its age in seconds, or (None, 0) if absent/expired"""
+        if self.disk_dir is None:
+            return None, 0.0
+        path = self._disk_path(key)
+        try:
+            token = path.read_bytes()
+        except FileNotFoundError:
+            return None, 0.0
+        try:
+            # Fernet tokens are authenticated, so only our own entries unpickle
+            value = pickle.loads(self._fernet.decrypt(token, ttl=max(1, int(self.ttl_seconds))))
+            return value, max(0.0, time.time() - self._fernet.extract_timestamp(token))
+        except InvalidToken:
+            # Expired or written under another key
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.expirations += 1
+            return None, 0.0
+
+    def _disk_put(self, key: str, value: Any) -> None:
+        if self.disk_dir is None:
+            return
+        token = self._fernet.encrypt(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        if len(token) > self.max_disk_bytes:
+            return
+        path = self._disk_path(key)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(token)
+        os.chmod(tmp, 0o600)
+        tmp.replace(path)
+        self._enforce_disk_budget()
+
+    def _enforce_disk_budget(self) -> None:
+        """Delete the oldest disk entries until the tier fits max_disk_bytes"""
+        files = []
+        total = 0
+        for path in self.disk_dir.glob(f"*{DISK_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            with self._lock:
+                self.disk_evictions += 1
+
+    def purge_expired(self) -> int:
+        """Drop expired memory and disk entries; returns the number removed"""
+        removed = 0
+        with self._lock:
+            now = self._clock()
+            for key in [k for k, (stored_at, _) in self._entries.items()
+                        if now - stored_at >= self.ttl_seconds]:
+                del self._entries[key]
+                removed += 1
+            self.expirations += removed
+        if self.disk_dir is not None:
+            cutoff = time.time() - self.ttl_seconds
+            for path in self.disk_dir.glob(f"*{DISK_SUFFIX}"):
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                        removed += 1
+                except FileNotFoundError:
+                    continue
+        return removed
+
+    def clear(self) -> None:
+        """Drop all entries, including the disk tier"""
+        with self._lock:
+            self._entries.clear()
+        if self.disk_dir is not None:
+            for path in self.disk_dir.glob(f"*{DISK_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "disk_enabled": self.disk_dir is not None,
+            "disk_evictions": self.disk_evictions,
+        }
+
+
+def create_result_cache(max_entries: Optional[int] = None) -> Optional[ExtractionResultCache]:
+    """Build an ExtractionResultCache from environment config, or None if disabled"""
+    if max_entries is None:
+        max_entries = int(os.getenv("EXTRACTION_CACHE_SIZE", "256"))
+    if max_entries <= 0:
+        return None
+    key = os.getenv("EXTRACTION_CACHE_KEY")
+    return ExtractionResultCache(
+        max_entries=max_entries,
+        ttl_seconds=float(os.getenv("EXTRACTION_CACHE_TTL_SECONDS", "900")),
+        disk_dir=os.getenv("EXTRACTION_CACHE_DIR") or None,
+        max_disk_bytes=int(float(os.getenv("EXTRACTION_CACHE_MAX_DISK_MB", "256")) * 1024 * 1024),
+        encryption_key=key.encode() if key else None,
+    )
+
+
+__all__ = [
+    "ExtractionResultCache",
+    "create_result_cache",
+    "image_cache_key",
+    "CRYPTO_AVAILABLE",
+]
@@ -463,9 +463,9 @@ class BenchmarkSuite:
         logger.info(f"Running lock benchmark ({iterations} iterations)...")
         
         from .geometry import analyze_face_geometry
-        from src.config.threshold_manager import ThresholdManager
+        from src.config.threshold_manager import get_threshold_manager
         
-        tm = ThresholdManager()
+        tm = get_threshold_manager()
         thresholds = tm.get_face_geometry_thresholds()
         
         # Simulate lock attempts
@@ -50,7 +50,7 @@ from .session_manager import (
     CaptureState,
     DocumentSide
 )
-from ..config.threshold_manager import ThresholdManager
+from ..config.threshold_manager import get_threshold_manager
 
 logger = logging.getLogger(__name__)
 
@@ -407,7 +407,7 @@ def handle_pad_pregate(
     session = get_or_create_session(session_id)
     
     # Get thresholds
-    tm = ThresholdManager()
+    tm = get_threshold_manager()
     pad_thresholds = tm.get_face_pad_thresholds()
     
     # Analyze PAD
@@ -484,7 +484,7 @@ def handle_challenge_script(
     session = get_or_create_session(session_id)
     
     # Get thresholds
-    tm = ThresholdManager()
+    tm = get_threshold_manager()
     challenge_thresholds = tm.get_face_challenge_thresholds()
     
     # Map complexity string to int
@@ -669,7 +669,7 @@ def handle_burst_upload(
     session = get_or_create_session(session_id)
     
     # Get thresholds
-    tm = ThresholdManager()
+    tm = get_threshold_manager()
     burst_thresholds = tm.get_face_burst_thresholds()
     
     max_frames = int(burst_thresholds['max_frames'])
@@ -743,7 +743,7 @@ def handle_burst_eval(
         }
     
     # Get thresholds
-    tm = ThresholdManager()
+    tm = get_threshold_manager()
     burst_thresholds = tm.get_face_burst_thresholds()
     
     # Get geometry and PAD thresholds too
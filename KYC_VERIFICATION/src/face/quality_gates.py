@@ -192,11 +192,11 @@ class QualityGateManager:
     def _load_thresholds(self):
         """Load quality thresholds from configuration"""
         try:
-            from ..config.threshold_manager import ThresholdManager
+            from ..config.threshold_manager import get_threshold_manager
         except ImportError:
-            from config.threshold_manager import ThresholdManager
+            from config.threshold_manager import get_threshold_manager
         
-        tm = ThresholdManager()
+        tm = get_threshold_manager()
         
         # Get thresholds for each metric with fallback defaults
         try:
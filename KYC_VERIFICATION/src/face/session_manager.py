@@ -624,14 +624,14 @@ class EnhancedSessionState:
     def get_timing_metadata(self) -> Dict[str, Any]:
         """Get timing metadata for API response (UX Requirement B)"""
         try:
-            from ..config.threshold_manager import ThresholdManager
+            from ..config.threshold_manager import get_threshold_manager
         except ImportError:
             # Fallback for test environment
-            from config.threshold_manager import ThresholdManager
+            from config.threshold_manager import get_threshold_manager
         
         # Get animation timings if not cached
         if self.animation_timings is None:
-            tm = ThresholdManager()
+            tm = get_threshold_manager()
             self.animation_timings = tm.get_face_animation_timings()
         
         # Calculate response time if tracking
@@ -6,6 +6,7 @@ Implements texture/FFT checks and font/kerning scoring for tamper detection
 
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
@@ -22,6 +23,17 @@ import hashlib
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Log line announcing each scheduled check
+CHECK_MESSAGES = {
+    "ela": "🔍 Performing Error Level Analysis...",
+    "noise": "📊 Analyzing noise patterns...",
+    "resampling": "🔄 Checking for resampling artifacts...",
+    "copy_move": "📋 Detecting copy-move forgery...",
+    "texture": "🎨 Analyzing texture consistency...",
+    "font": "🔤 Checking font consistency...",
+    "security_features": "🛡️ Verifying security features..."
+}
+
 class TamperType(Enum):
     """Types of tampering detected"""
     COPY_MOVE = "copy_move"
@@ -34,6 +46,13 @@ class TamperType(Enum):
     NOISE_INCONSISTENCY = "noise_inconsistency"
     LIGHTING_INCONSISTENCY = "lighting_inconsistency"
 
+# Largest score deduction a check's findings can cause. detect_copy_move
+# reports only the strongest region: one critical finding at confidence <= 1.
+# Checks missing here (texture reports any number of regions) are unbounded.
+CHECK_MAX_DEDUCTION = {
+    "copy_move": 0.3,
+}
+
 @dataclass
 class ForensicFinding:
     """Individual forensic finding"""
@@ -74,6 +93,8 @@ class AuthenticityVerifier:
         self.config = self._load_config(config_path)
         self.tamper_threshold = self.config.get("tamper_threshold", 0.1)
         self.auc_target = self.config.get("auc_target", 0.90)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._gabor_kernels: Dict[int, np.ndarray] = {}
         
     def _load_config(self, config_path: Optional[str]) -> Dict:
         """Load forensics configuration"""
@@ -91,18 +112,48 @@ class AuthenticityVerifier:
             },
             "copy_move": {
                 "block_size": 16,
-                "search_window": 64,
-                "threshold": 0.9
+                "threshold": 0.9,
+                "analysis_max_side": 1024,
+                "smoothing_sigma": 1.5,
+                "dct_coefficients": 4,
+                "quantization": 32.0,
+                "feature_tolerance": 32.0,
+                "neighbors": 4,
+                "min_block_detail": 0.5,
+                "min_distance": 32,
+                "min_shift_votes": 192
             },
             "texture": {
                 "gabor_frequencies": [0.1, 0.2, 0.3],
-                "gabor_orientations": [0, 45, 90, 135]
+                "gabor_orientations": [0, 45, 90, 135],
+                # Larger captures are filtered at an integer downscale; the
+                # cap keeps the 10 px Gabor wavelength above 3 px
+                "analysis_max_side": 1024,
+                "max_downscale": 3
             },
             "security_features": {
                 "check_hologram": True,
                 "check_microprint": True,
                 "check_uv": False,  # Requires special hardware
                 "check_watermark": True
+            },
+            "schedule": {
+                # Tiers run in order; checks within a tier run concurrently.
+                # A later tier is skipped once the decision cannot change:
+                # the running score is below the threshold, or above it by
+                # more than every pending check can deduct (see
+                # CHECK_MAX_DEDUCTION; texture has no bound). With
+                # tamper_threshold 0.1 the score tops out 0.3 above the
+                # threshold, so only documents that already fail skip
+                # anything; cheap texture runs first to find more of them
+                "tiers": [
+                    ["ela", "noise", "resampling", "font", "security_features"],
+                    ["texture"],
+                    ["copy_move"]
+                ],
+                # Checks that policy requires on every document
+                "always_run": [],
+                "max_workers": 4
             }
         }
         
@@ -114,13 +165,22 @@ class AuthenticityVerifier:
         return default_config
     
     def verify_authenticity(self, image: np.ndarray, 
-                           document_type: Optional[str] = None) -> ForensicResult:
+                           document_type: Optional[str] = None,
+                           exhaustive: bool = False) -> ForensicResult:
         """
         Perform complete forensic analysis
         
+        Checks run in the cost-ordered tiers of config["schedule"]; the
+        checks of a tier run concurrently. After the first tier, a tier
+        only runs while the pending checks can still change the decision:
+        below the threshold further findings can only lower the score, and
+        a score above it by more than the pending checks can deduct stays
+        above it. A pending check with no known bound keeps its tier running.
+        
         Args:
             image: Input document image
             document_type: Optional document type for specific checks
+            exhaustive: Run every check regardless of the running score
             
         Returns:
             Complete forensic analysis result
@@ -128,47 +188,30 @@ class AuthenticityVerifier:
         import time
         start_time = time.time()
         
-        findings = []
+        settings = self.config["schedule"]
+        always_run = set(settings.get("always_run", []))
+        results: Dict[str, Tuple[Any, Optional[np.ndarray]]] = {}
+        skipped: List[str] = []
+        
+        for index, tier in enumerate(settings["tiers"]):
+            checks = list(tier)
+            pending = [check for later in settings["tiers"][index:] for check in later]
+            if index > 0 and not exhaustive and not self._is_uncertain(results, pending):
+                checks = [check for check in tier if check in always_run]
+                skipped.extend(check for check in tier if check not in always_run)
+            if len(checks) > 1:
+                outputs = self._get_executor().map(
+                    lambda check: self._run_check(check, image, document_type), checks)
+            else:
+                outputs = [self._run_check(check, image, document_type) for check in checks]
+            results.update(zip(checks, outputs))
         
-        # Perform Error Level Analysis
-        logger.info("🔍 Performing Error Level Analysis...")
-        ela_result, ela_heatmap = self.error_level_analysis(image)
-        if ela_result:
-            findings.extend(ela_result)
-        
-        # Perform noise analysis
-        logger.info("📊 Analyzing noise patterns...")
-        noise_result, noise_heatmap = self.noise_analysis(image)
-        if noise_result:
-            findings.extend(noise_result)
-        
-        # Check for resampling
-        logger.info("🔄 Checking for resampling artifacts...")
-        resample_result = self.detect_resampling(image)
-        if resample_result:
-            findings.extend(resample_result)
-        
-        # Detect copy-move forgery
-        logger.info("📋 Detecting copy-move forgery...")
-        copy_move_result = self.detect_copy_move(image)
-        if copy_move_result:
-            findings.extend(copy_move_result)
-        
-        # Analyze texture consistency
-        logger.info("🎨 Analyzing texture consistency...")
-        texture_result, texture_heatmap = self.texture_analysis(image)
-        if texture_result:
-            findings.extend(texture_result)
-        
-        # Check font consistency
-        logger.info("🔤 Checking font consistency...")
-        font_result = self.check_font_consistency(image)
-        if font_result:
-            findings.extend(font_result)
-        
-        # Verify security features
-        logger.info("🛡️ Verifying security features...")
-        security_features = self.verify_security_features(image, document_type)
+        # Findings keep the fixed check order whatever the schedule
+        findings = []
+        for check in ("ela", "noise", "resampling", "copy_move", "texture", "font"):
+            if check in results:
+                findings.extend(results[check][0])
+        security_features = results.get("security_features", ([], None))[0]
         
         # Calculate overall authenticity score
         authenticity_score = self._calculate_authenticity_score(findings, security_features)
@@ -184,17 +227,71 @@ class AuthenticityVerifier:
             authenticity_score=authenticity_score,
             findings=findings,
             security_features=security_features,
-            ela_heatmap=ela_heatmap,
-            noise_heatmap=noise_heatmap,
-            texture_heatmap=texture_heatmap,
+            ela_heatmap=results.get("ela", (None, None))[1],
+            noise_heatmap=results.get("noise", (None, None))[1],
+            texture_heatmap=results.get("texture", (None, None))[1],
             metadata={
                 "total_findings": len(findings),
                 "critical_findings": sum(1 for f in findings if f.severity == "critical"),
-                "security_features_verified": sum(1 for s in security_features if s.validation_passed)
+                "security_features_verified": sum(1 for s in security_features if s.validation_passed),
+                "checks_run": list(results),
+                "checks_skipped": skipped,
+                "early_exit": bool(skipped)
             },
             processing_time_ms=processing_time_ms
         )
     
+    def _run_check(self, check: str, image: np.ndarray,
+                   document_type: Optional[str]) -> Tuple[List[Any], Optional[np.ndarray]]:
+        """Run one scheduled check; returns its findings (or security features) and heatmap"""
+        logger.info(CHECK_MESSAGES.get(check, check))
+        if check == "ela":
+            return self.error_level_analysis(image)
+        if check == "noise":
+            return self.noise_analysis(image)
+        if check == "resampling":
+            return self.detect_resampling(image), None
+        if check == "copy_move":
+            return self.detect_copy_move(image), None
+        if check == "texture":
+            return self.texture_analysis(image)
+        if check == "font":
+            return self.check_font_consistency(image), None
+        if check == "security_features":
+            return self.verify_security_features(image, document_type), None
+        raise ValueError(f"Unknown forensic check: {check}")
+    
+    def _is_uncertain(self, results: Dict[str, Tuple[Any, Optional[np.ndarray]]],
+                      pending: List[str]) -> bool:
+        """Whether the pending checks can still change the decision"""
+        # The security bonus can lift the score, so nothing is settled without it
+        if "security_features" not in results:
+            return True
+        findings = [f for check, (found, _) in results.items()
+                    if check != "security_features" for f in found]
+        margin = (self._raw_authenticity_score(findings, results["security_features"][0])
+                  - (1 - self.tamper_threshold))
+        # Every check that can still run counts, including always_run ones
+        reach = sum(CHECK_MAX_DEDUCTION.get(check, float("inf")) for check in pending)
+        # Tolerance for summation order differing from the final score
+        eps = 1e-9
+        return -eps <= margin < reach + eps
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for concurrent checks, created on first use"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config["schedule"].get("max_workers", 4),
+                thread_name_prefix="forensics",
+            )
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down the check thread pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
     def error_level_analysis(self, image: np.ndarray) -> Tuple[List[ForensicFinding], np.ndarray]:
         """
         Perform Error Level Analysis to detect digital manipulation
@@ -378,82 +475,243 @@ class AuthenticityVerifier:
     
     def detect_copy_move(self, image: np.ndarray) -> List[ForensicFinding]:
         """
-        Detect copy-move forgery using block matching
-        
+        Detect copy-move forgery using sorted block features
+
+        Every block_size x block_size block is reduced to its low-frequency
+        DCT coefficients. Sorting the quantized feature vectors puts
+        near-identical blocks next to each other, so each block is compared
+        with a few sorted neighbours instead of every other block. Matching
+        pairs vote for their shift vector: a cloned region gives many pairs
+        with the same shift, while chance matches scatter. Blocks that also
+        match at other well-supported shifts lie on repetitive structure
+        and do not vote.
+
         Args:
             image: Input image
-            
+
         Returns:
             List of findings
         """
         findings = []
-        
+
         # Convert to grayscale
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
-        
+
         # Parameters
-        block_size = self.config["copy_move"]["block_size"]
-        search_window = self.config["copy_move"]["search_window"]
-        threshold = self.config["copy_move"]["threshold"]
-        
-        h, w = gray.shape
-        
-        # Divide image into blocks
-        blocks = []
-        positions = []
-        
-        for i in range(0, h - block_size, block_size // 2):
-            for j in range(0, w - block_size, block_size // 2):
-                block = gray[i:i+block_size, j:j+block_size]
-                blocks.append(block.flatten())
-                positions.append((i, j))
-        
-        blocks = np.array(blocks)
-        
-        # Find similar blocks using correlation
-        matches = []
-        
-        for i in range(len(blocks)):
-            for j in range(i + 1, min(i + search_window, len(blocks))):
-                # Calculate correlation
-                correlation = np.corrcoef(blocks[i], blocks[j])[0, 1]
-                
-                if correlation > threshold:
-                    pos1 = positions[i]
-                    pos2 = positions[j]
-                    
-                    # Check if blocks are not adjacent
-                    dist = np.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
-                    
-                    if dist > block_size * 2:
-                        matches.append({
-                            "pos1": pos1,
-                            "pos2": pos2,
-                            "correlation": correlation,
-                            "distance": dist
-                        })
-        
-        # Group matches into regions
-        if matches:
-            # Simplified: Report the strongest match
-            best_match = max(matches, key=lambda x: x["correlation"])
-            
+        params = self.config["copy_move"]
+        block_size = params["block_size"]
+        threshold = params["threshold"]
+        min_votes = params["min_shift_votes"]
+
+        # Large captures are analysed downscaled; clones survive resizing
+        scale = min(1.0, params["analysis_max_side"] / max(gray.shape))
+        if scale < 1.0:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        gray = gray.astype(np.float32)
+
+        if min(gray.shape) < block_size:
+            return findings
+
+        # Light smoothing keeps features stable when a clone was resampled
+        smoothed = cv2.GaussianBlur(gray, (0, 0), params["smoothing_sigma"])
+        features, positions = self._block_features(smoothed, block_size,
+                                                   params["dct_coefficients"], params["min_block_detail"])
+        first, second = self._sorted_neighbour_pairs(features, params["quantization"],
+                                                     params["feature_tolerance"], params["neighbors"])
+
+        # Shift vectors, oriented so both members of a pair vote the same way;
+        # overlapping blocks are alike in any image
+        shifts = positions[second] - positions[first]
+        distance = np.hypot(shifts[:, 0], shifts[:, 1])
+        apart = distance >= block_size / 2
+        first, second, shifts, distance = first[apart], second[apart], shifts[apart], distance[apart]
+        flip = (shifts[:, 0] < 0) | ((shifts[:, 0] == 0) & (shifts[:, 1] < 0))
+        first, second = np.where(flip, second, first), np.where(flip, first, second)
+        shifts[flip] *= -1
+
+        # One integer id per shift vector (dy >= 0 after orienting)
+        span = 2 * gray.shape[1] + 1
+        shift_ids = shifts[:, 0] * span + shifts[:, 1] + gray.shape[1]
+        _, inverse, votes = np.unique(shift_ids, return_inverse=True, return_counts=True)
+
+        # Blocks matching at two or more well-supported offsets sit on
+        # repetitive structure (ruled lines, repeated glyphs, guilloche)
+        strong = votes[inverse.ravel()] >= min_votes
+        single = self._single_shift_blocks(first[strong], second[strong], shifts[strong], len(positions))
+        keep = single[first] & single[second] & (distance > params["min_distance"])
+        first, second, shifts, shift_ids = first[keep], second[keep], shifts[keep], shift_ids[keep]
+        if len(shifts) < min_votes:
+            return findings
+
+        # Vote on shift vectors and confirm the strongest with pixel correlation
+        ids, votes = np.unique(shift_ids, return_counts=True)
+        blocks = np.lib.stride_tricks.sliding_window_view(gray, (block_size, block_size))
+        for candidate in np.argsort(-votes, kind="stable"):
+            if votes[candidate] < min_votes:
+                break
+            dy, dx = divmod(int(ids[candidate]), span)
+            dx -= gray.shape[1]
+            # Resizing splits a clone's votes between neighbouring shifts
+            members = np.flatnonzero(np.max(np.abs(shifts - (dy, dx)), axis=1) <= 1)
+            source = positions[first[members]]
+            target = positions[second[members]]
+            correlation = self._block_correlation(blocks[source[:, 0], source[:, 1]],
+                                                  blocks[target[:, 0], target[:, 1]])
+            matched = correlation > threshold
+            if np.count_nonzero(matched) < min_votes:
+                continue
+            # A clone is one compact region; chance matches are scattered
+            matched[matched] = self._largest_cluster(source[matched], gray.shape)
+            if np.count_nonzero(matched) < min_votes:
+                continue
+
+            source, target = source[matched], target[matched]
+            confidence = float(np.mean(correlation[matched]))
+            top, left = source.min(axis=0)
+            bottom, right = source.max(axis=0) + block_size
+            anchor = np.lexsort((source[:, 1], source[:, 0]))[0]
+
             findings.append(ForensicFinding(
                 tamper_type=TamperType.COPY_MOVE,
-                confidence=best_match["correlation"],
-                location=(best_match["pos1"][1], best_match["pos1"][0], block_size, block_size),
-                severity="critical" if best_match["correlation"] > 0.95 else "high",
+                confidence=confidence,
+                location=(int(left / scale), int(top / scale),
+                          int(round((right - left) / scale)), int(round((bottom - top) / scale))),
+                severity="critical" if confidence > 0.95 else "high",
                 description="Copy-move forgery detected",
                 evidence={
-                    "correlation": float(best_match["correlation"]),
-                    "distance": float(best_match["distance"]),
-                    "source": best_match["pos1"],
-                    "target": best_match["pos2"]
+                    "correlation": confidence,
+                    "distance": float(np.hypot(dy, dx) / scale),
+                    "source": tuple(int(round(v / scale)) for v in source[anchor]),
+                    "target": tuple(int(round(v / scale)) for v in target[anchor]),
+                    "shift": (int(round(dy / scale)), int(round(dx / scale))),
+                    "matched_blocks": int(len(source))
                 }
             ))
-        
+            # Report the strongest cloned region
+            break
+
         return findings
-    
+
+    @staticmethod
+    def _dct_basis(size: int, count: int) -> np.ndarray:
+        """First count rows of the orthonormal DCT-II matrix of order size"""
+        frequency = np.arange(count)[:, None]
+        sample = np.arange(size)[None, :]
+        basis = np.cos(np.pi * (2 * sample + 1) * frequency / (2 * size)) * np.sqrt(2 / size)
+        basis[0] /= np.sqrt(2)
+        return basis.astype(np.float32)
+
+    def _block_features(self, gray: np.ndarray, block_size: int,
+                        coefficients: int, min_detail: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Low-frequency DCT coefficients of every block (one per pixel offset)
+
+        Every offset is needed: the shift vote threshold, the +-1 px shift
+        tolerance and the 1 px gap bridging all assume adjacent origins.
+        Each coefficient is a separable filter over the whole image, so all
+        blocks are transformed in a few passes without materializing them.
+        Blocks without two-dimensional detail (blank paper, gradients,
+        straight or gently curved edges) look alike along their extent and
+        are dropped.
+
+        Returns:
+            (K, N) features and (N, 2) block origins as (row, col)
+        """
+        h, w = gray.shape
+        valid = (slice(0, h - block_size + 1), slice(0, w - block_size + 1))
+        box = (block_size, block_size)
+
+        # Smaller eigenvalue of the block's structure tensor: high only for
+        # two-dimensional texture, not for flat areas, gradients or edges
+        dx = cv2.Sobel(gray, cv2.CV_32F, 1, 0, scale=0.125)
+        dy = cv2.Sobel(gray, cv2.CV_32F, 0, 1, scale=0.125)
+        xx, yy, xy = (cv2.boxFilter(product, cv2.CV_32F, box, anchor=(0, 0), borderType=cv2.BORDER_CONSTANT)[valid]
+                      for product in (dx * dx, dy * dy, dx * dy))
+        min_eigenvalue = (xx + yy) / 2 - np.sqrt(((xx - yy) / 2) ** 2 + xy ** 2)
+        textured = min_eigenvalue > min_detail ** 2
+
+        basis = self._dct_basis(block_size, coefficients)
+        rows = [cv2.filter2D(gray, cv2.CV_32F, basis[u][None, :], anchor=(0, 0),
+                             borderType=cv2.BORDER_CONSTANT) for u in range(coefficients)]
+        features = np.stack([
+            cv2.filter2D(rows[u], cv2.CV_32F, basis[v][:, None], anchor=(0, 0),
+                         borderType=cv2.BORDER_CONSTANT)[valid][textured]
+            for u in range(coefficients) for v in range(coefficients) if u + v < coefficients
+        ])
+
+        rows_index, cols_index = np.nonzero(textured)
+        positions = np.stack([rows_index, cols_index], axis=1)
+        return features, positions
+
+    @staticmethod
+    def _sorted_neighbour_pairs(features: np.ndarray, quantization: float, tolerance: float,
+                                neighbors: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Index pairs of similar blocks found among neighbours in sorted order
+
+        The quantized coefficients (lowest frequency first) are packed into
+        one integer key, so a single argsort gives their lexicographic
+        order. Coefficients that do not fit in 63 bits only take part in
+        the tolerance check.
+        """
+        if features.shape[1] < 2:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty
+
+        quantized = np.floor(features / quantization).astype(np.int64)
+        quantized -= quantized.min(axis=1, keepdims=True)
+        key = np.zeros(features.shape[1], dtype=np.int64)
+        bits = 0
+        for column in quantized:
+            width = int(column.max()).bit_length()
+            if bits + width > 63:
+                break
+            key = (key << width) | column
+            bits += width
+        order = np.argsort(key, kind="stable")
+        ordered = features[:, order]
+
+        first, second = [], []
+        for offset in range(1, min(neighbors, len(order) - 1) + 1):
+            close = np.ones(len(order) - offset, dtype=bool)
+            for coefficient in ordered:
+                close &= np.abs(coefficient[offset:] - coefficient[:-offset]) <= tolerance
+            index = np.flatnonzero(close)
+            first.append(order[index])
+            second.append(order[index + offset])
+        return np.concatenate(first), np.concatenate(second)
+
+    @staticmethod
+    def _single_shift_blocks(first: np.ndarray, second: np.ndarray, shifts: np.ndarray,
+                             count: int) -> np.ndarray:
+        """Mask of blocks whose matches all share one shift vector (within 1 px)"""
+        index = np.concatenate([first, second])
+        low = np.full((count, 2), np.iinfo(np.int64).max)
+        high = np.full((count, 2), np.iinfo(np.int64).min)
+        np.minimum.at(low, index, np.concatenate([shifts, shifts]))
+        np.maximum.at(high, index, np.concatenate([shifts, shifts]))
+        return np.all(high - low <= 2, axis=1)
+
+    @staticmethod
+    def _largest_cluster(positions: np.ndarray, shape: Tuple[int, int]) -> np.ndarray:
+        """Mask of the block origins in the largest 8-connected group (1 px gaps bridged)"""
+        grid = np.zeros(shape, dtype=np.uint8)
+        grid[positions[:, 0], positions[:, 1]] = 1
+        grid = cv2.dilate(grid, np.ones((3, 3), dtype=np.uint8))
+        _, labels = cv2.connectedComponents(grid, connectivity=8)
+        label = labels[positions[:, 0], positions[:, 1]]
+        return label == np.argmax(np.bincount(label))
+
+    @staticmethod
+    def _block_correlation(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """Pearson correlation of corresponding blocks in two (N, B, B) stacks"""
+        a = first.reshape(len(first), -1)
+        b = second.reshape(len(second), -1)
+        a = a - a.mean(axis=1, keepdims=True)
+        b = b - b.mean(axis=1, keepdims=True)
+        denominator = np.sqrt(np.einsum("ij,ij->i", a, a) * np.einsum("ij,ij->i", b, b))
+        return np.einsum("ij,ij->i", a, b) / np.maximum(denominator, 1e-6)
+
     def texture_analysis(self, image: np.ndarray) -> Tuple[List[ForensicFinding], np.ndarray]:
         """
         Analyze texture consistency using Gabor filters
@@ -469,31 +727,8 @@ class AuthenticityVerifier:
         # Convert to grayscale
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
         
-        # Apply Gabor filters
-        frequencies = self.config["texture"]["gabor_frequencies"]
-        orientations = [o * np.pi / 180 for o in self.config["texture"]["gabor_orientations"]]
-        
-        responses = []
-        
-        for freq in frequencies:
-            for theta in orientations:
-                # Create Gabor kernel
-                kernel = cv2.getGaborKernel(
-                    (31, 31), 4.0, theta, 10.0, freq, 0
-                )
-                
-                # Apply filter
-                filtered = cv2.filter2D(gray, cv2.CV_32F, kernel)
-                responses.append(filtered)
-        
-        # Combine responses
-        texture_map = np.mean(responses, axis=0)
-        
-        # Calculate local texture variance
-        kernel_size = 15
-        kernel = np.ones((kernel_size, kernel_size)) / (kernel_size ** 2)
-        local_mean = cv2.filter2D(texture_map, cv2.CV_32F, kernel)
-        local_var = cv2.filter2D(texture_map ** 2, cv2.CV_32F, kernel) - local_mean ** 2
+        # Local variance of the combined Gabor response
+        local_var = self._texture_variance(gray)
         
         # Normalize variance map
         texture_normalized = cv2.normalize(local_var, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
@@ -532,6 +767,63 @@ class AuthenticityVerifier:
         
         return findings, texture_heatmap
     
+    def _texture_variance(self, gray: np.ndarray) -> np.ndarray:
+        """
+        Local variance (15 x 15 window) of the mean Gabor bank response
+        
+        Captures longer than analysis_max_side are filtered after an
+        integer INTER_AREA downscale (at most max_downscale) with a matching
+        kernel and window; the variance map is resized back to the input
+        size.
+        """
+        h, w = gray.shape
+        params = self.config["texture"]
+        factor = -(-max(h, w) // params.get("analysis_max_side", 1024))
+        factor = max(1, min(factor, params.get("max_downscale", 3)))
+        small = gray
+        if factor > 1:
+            small = cv2.resize(gray, None, fx=1 / factor, fy=1 / factor, interpolation=cv2.INTER_AREA)
+        
+        # filter2D switches to a DFT for kernels of 11 x 11 and larger
+        texture_map = cv2.filter2D(small, cv2.CV_32F, self._gabor_kernel(factor))
+        _, local_var = self._local_mean_var(texture_map, (15 // factor) | 1)
+        
+        if factor > 1:
+            local_var = cv2.resize(local_var, (w, h), interpolation=cv2.INTER_LINEAR)
+        return local_var
+    
+    def _gabor_kernel(self, factor: int) -> np.ndarray:
+        """Mean kernel of the Gabor bank for a given downscale factor, built once"""
+        kernel = self._gabor_kernels.get(factor)
+        if kernel is None:
+            params = self.config["texture"]
+            size = (31 // factor) | 1
+            # gabor_frequencies are passed as the aspect ratio, as before
+            bank = [
+                cv2.getGaborKernel((size, size), 4.0 / factor, theta * np.pi / 180, 10.0 / factor, freq, 0)
+                for freq in params["gabor_frequencies"]
+                for theta in params["gabor_orientations"]
+            ]
+            # Filtering is linear, so averaging the responses equals one pass
+            # with the mean kernel; factor ** 2 keeps the response level
+            kernel = np.mean(bank, axis=0) * factor ** 2
+            self._gabor_kernels[factor] = kernel
+        return kernel
+    
+    @staticmethod
+    def _local_mean_var(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Box mean and variance over window x window from float64 integral images"""
+        r = window // 2
+        padded = cv2.copyMakeBorder(values.astype(np.float64), r, r, r, r, cv2.BORDER_REFLECT_101)
+        sums, squares = cv2.integral2(padded, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+        
+        def box(integral: np.ndarray) -> np.ndarray:
+            return (integral[window:, window:] - integral[:-window, window:]
+                    - integral[window:, :-window] + integral[:-window, :-window]) / (window * window)
+        
+        mean = box(sums)
+        return mean.astype(np.float32), (box(squares) - mean ** 2).astype(np.float32)
+    
     def check_font_consistency(self, image: np.ndarray) -> List[ForensicFinding]:
         """
         Check for font and kerning inconsistencies
@@ -728,6 +1020,13 @@ class AuthenticityVerifier:
     def _calculate_authenticity_score(self, findings: List[ForensicFinding], 
                                      security_features: List[SecurityFeature]) -> float:
         """Calculate overall authenticity score"""
+        score = self._raw_authenticity_score(findings, security_features)
+        return max(0.0, min(1.0, score))
+    
+    @staticmethod
+    def _raw_authenticity_score(findings: List[ForensicFinding],
+                                security_features: List[SecurityFeature]) -> float:
+        """Authenticity score before clipping to [0, 1]"""
         score = 1.0
         
         # Deduct points for tamper findings
@@ -744,10 +1043,9 @@ class AuthenticityVerifier:
         # Add points for verified security features
         if security_features:
             verified_features = sum(1 for f in security_features if f.validation_passed)
-            feature_bonus = (verified_features / len(security_features)) * 0.2
-            score = min(1.0, score + feature_bonus)
+            score += (verified_features / len(security_features)) * 0.2
         
-        return max(0.0, score)
+        return score
 
 # Export main components
 __all__ = [
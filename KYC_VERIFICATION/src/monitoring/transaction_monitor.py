@@ -6,9 +6,12 @@ Part of KYC Bank-Grade Parity - Phase 6
 This module implements foundational transaction monitoring rules.
 """
 
+import bisect
 import logging
 import hashlib
 import json
+import sqlite3
+import threading
 import time
 import math
 from typing import Dict, List, Optional, Any, Tuple
@@ -90,6 +93,7 @@ class Alert:
     created_at: str
     requires_review: bool
     case_id: Optional[str] = None
+    status: str = "open"
     
     def to_json(self) -> str:
         """Convert to JSON"""
@@ -97,6 +101,14 @@ class Alert:
         data['alert_type'] = self.alert_type.value
         data['severity'] = self.severity.value
         return json.dumps(data)
+    
+    @classmethod
+    def from_json(cls, payload: str) -> 'Alert':
+        """Parse an alert serialized with to_json"""
+        data = json.loads(payload)
+        data['alert_type'] = AlertType(data['alert_type'])
+        data['severity'] = AlertSeverity(data['severity'])
+        return cls(**data)
 
 
 @dataclass
@@ -115,18 +127,96 @@ class MonitoringResult:
         return len(self.alerts_generated) > 0
 
 
+class VelocityWindowBuffer:
+    """Shared time-ordered buffer with running totals for several windows
+    
+    Each window keeps a start index into the shared buffer plus a running
+    count and amount. Advancing time moves each start index past expired
+    entries and subtracts them, so a check costs O(expired items) instead of
+    re-summing the whole window. Late entries are inserted in time order, and
+    one already older than a window's last cutoff is not counted there.
+    """
+    
+    COMPACT_THRESHOLD = 1024
+    
+    def __init__(self, windows: Dict[str, timedelta]):
+        self.windows = dict(windows)
+        self.entries: List[Dict[str, Any]] = []
+        self.starts: Dict[str, int] = {name: 0 for name in self.windows}
+        self.counts: Dict[str, int] = {name: 0 for name in self.windows}
+        self.amounts: Dict[str, float] = {name: 0.0 for name in self.windows}
+        self.cutoffs: Dict[str, Optional[datetime]] = {name: None for name in self.windows}
+    
+    def __len__(self) -> int:
+        return len(self.entries) - min(self.starts.values(), default=0)
+    
+    def append(self, entry: Dict[str, Any]):
+        """Add an entry, keeping the buffer in time order"""
+        entries, when, amount = self.entries, entry['time'], entry['amount']
+        if entries and when < entries[-1]['time']:
+            bisect.insort_right(entries, entry, key=lambda e: e['time'])
+        else:
+            entries.append(entry)
+        for name, cutoff in self.cutoffs.items():
+            if cutoff is not None and when < cutoff:
+                # Already expired: it sits before the window start
+                self.starts[name] += 1
+            else:
+                self.counts[name] += 1
+                self.amounts[name] += amount
+    
+    def advance(self, now: datetime):
+        """Expire entries that fell out of each window as of now"""
+        entries = self.entries
+        for name, size in self.windows.items():
+            cutoff = now - size
+            previous = self.cutoffs[name]
+            if previous is not None and cutoff <= previous:
+                continue
+            self.cutoffs[name] = cutoff
+            i = self.starts[name]
+            while i < len(entries) and entries[i]['time'] < cutoff:
+                self.counts[name] -= 1
+                self.amounts[name] -= entries[i]['amount']
+                i += 1
+            self.starts[name] = i
+            if self.counts[name] == 0:
+                self.amounts[name] = 0.0  # drop accumulated rounding error
+        self._compact()
+    
+    def _compact(self):
+        """Drop entries that have expired from every window"""
+        head = min(self.starts.values(), default=0)
+        if head >= self.COMPACT_THRESHOLD and head * 2 >= len(self.entries):
+            del self.entries[:head]
+            for name in self.starts:
+                self.starts[name] -= head
+    
+    def window_entries(self, name: str) -> List[Dict[str, Any]]:
+        """Entries currently inside the named window"""
+        return self.entries[self.starts[name]:]
+
+
 class VelocityTracker:
     """Tracks transaction velocity per customer"""
     
-    def __init__(self, window_size_minutes: int = 60):
+    def __init__(self, window_size_minutes: int = 60,
+                 windows: Optional[Dict[str, timedelta]] = None):
         """
         Initialize velocity tracker
         
         Args:
             window_size_minutes: Time window for velocity calculation
+                (the "hourly" window)
+            windows: Additional named windows sharing each customer's buffer
         """
         self.window_size = timedelta(minutes=window_size_minutes)
-        self.transactions: Dict[str, deque] = defaultdict(deque)
+        self.windows = {
+            "hourly": self.window_size,
+            "daily": timedelta(days=1),
+            **(windows or {})
+        }
+        self.transactions: Dict[str, VelocityWindowBuffer] = {}
         
         # Load thresholds
         import sys
@@ -136,18 +226,23 @@ class VelocityTracker:
         
         logger.info(f"Velocity Tracker initialized with {window_size_minutes}min window")
     
-    def add_transaction(self, transaction: Transaction):
+    def add_transaction(self, transaction: Transaction, now: Optional[datetime] = None):
         """
         Add transaction to tracking
         
         Args:
             transaction: Transaction to track
+            now: Reference time for expiry (defaults to current time)
         """
         customer_id = transaction.customer_id
         tx_time = datetime.fromisoformat(transaction.timestamp)
         
+        buffer = self.transactions.get(customer_id)
+        if buffer is None:
+            buffer = self.transactions[customer_id] = VelocityWindowBuffer(self.windows)
+        
         # Add to customer's transaction history
-        self.transactions[customer_id].append({
+        buffer.append({
             'time': tx_time,
             'amount': transaction.amount,
             'type': transaction.transaction_type,
@@ -155,51 +250,55 @@ class VelocityTracker:
         })
         
         # Clean old transactions
-        self._clean_old_transactions(customer_id)
+        self._clean_old_transactions(customer_id, now)
     
-    def _clean_old_transactions(self, customer_id: str):
-        """Remove transactions outside the time window"""
-        now = datetime.now(MANILA_TZ)
-        cutoff = now - self.window_size
+    def _clean_old_transactions(self, customer_id: str, now: Optional[datetime] = None):
+        """Expire transactions outside each window"""
+        buffer = self.transactions.get(customer_id)
+        if buffer is not None:
+            buffer.advance(now or datetime.now(MANILA_TZ))
+    
+    def get_window_totals(self, customer_id: str,
+                          now: Optional[datetime] = None) -> Dict[str, Tuple[int, float]]:
+        """
+        Get running (count, amount) per window
         
-        while (self.transactions[customer_id] and 
-               self.transactions[customer_id][0]['time'] < cutoff):
-            self.transactions[customer_id].popleft()
+        Args:
+            customer_id: Customer ID
+            now: Reference time (defaults to current time)
+            
+        Returns:
+            Mapping of window name to (count, amount)
+        """
+        self._clean_old_transactions(customer_id, now)
+        buffer = self.transactions.get(customer_id)
+        if buffer is None:
+            return {name: (0, 0.0) for name in self.windows}
+        return {name: (buffer.counts[name], buffer.amounts[name]) for name in self.windows}
     
-    def check_velocity(self, customer_id: str) -> Tuple[bool, Dict[str, Any]]:
+    def check_velocity(self, customer_id: str,
+                       now: Optional[datetime] = None) -> Tuple[bool, Dict[str, Any]]:
         """
         Check if velocity exceeds threshold
         
         Args:
             customer_id: Customer ID
+            now: Reference time (defaults to current time)
             
         Returns:
             Tuple of (exceeds_threshold, details)
         """
-        self._clean_old_transactions(customer_id)
-        
         if customer_id not in self.transactions:
             return False, {}
         
+        totals = self.get_window_totals(customer_id, now)
+        
         # Get thresholds
         hourly_limit = self.threshold_manager.get("tm_velocity_hourly") or 10
         daily_limit = self.threshold_manager.get("tm_velocity_daily") or 50
         
-        # Count transactions
-        now = datetime.now(MANILA_TZ)
-        hour_ago = now - timedelta(hours=1)
-        day_ago = now - timedelta(days=1)
-        
-        hourly_count = sum(1 for tx in self.transactions[customer_id] 
-                          if tx['time'] >= hour_ago)
-        daily_count = sum(1 for tx in self.transactions[customer_id] 
-                         if tx['time'] >= day_ago)
-        
-        # Calculate amounts
-        hourly_amount = sum(tx['amount'] for tx in self.transactions[customer_id] 
-                           if tx['time'] >= hour_ago)
-        daily_amount = sum(tx['amount'] for tx in self.transactions[customer_id] 
-                          if tx['time'] >= day_ago)
+        hourly_count, hourly_amount = totals["hourly"]
+        daily_count, daily_amount = totals["daily"]
         
         # Check if exceeded
         hourly_exceeded = hourly_count > hourly_limit
@@ -626,19 +725,77 @@ class TransactionMonitor:
 
 
 class AlertStorage:
-    """Storage for transaction monitoring alerts"""
+    """Indexed, append-only storage for transaction monitoring alerts
+    
+    Alerts are kept in a single SQLite database in WAL mode with indexes on
+    (customer_id, created_ts) and (status, created_ts), so investigator
+    lookups and status/time-range queries do not scan every alert, and
+    millions of alerts do not turn into millions of files.
+    """
+    
+    DB_FILENAME = "alerts.db"
     
     def __init__(self, storage_path: Optional[Path] = None):
         """
         Initialize alert storage
         
         Args:
-            storage_path: Path to store alerts
+            storage_path: Directory holding the alert database
         """
         self.storage_path = storage_path or Path("/workspace/KYC VERIFICATION/alerts")
         self.storage_path.mkdir(parents=True, exist_ok=True)
-        self.alerts: Dict[str, Alert] = {}
-        logger.info(f"Alert Storage initialized at {self.storage_path}")
+        self.db_path = self.storage_path / self.DB_FILENAME
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_schema()
+        logger.info(f"Alert Storage initialized at {self.db_path}")
+    
+    def _init_schema(self):
+        """Create tables and indexes if missing"""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS alerts (
+                    alert_id TEXT PRIMARY KEY,
+                    customer_id TEXT NOT NULL,
+                    alert_type TEXT NOT NULL,
+                    severity TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    created_ts REAL NOT NULL,
+                    payload TEXT NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_alerts_customer ON alerts (customer_id, created_ts)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_alerts_status ON alerts (status, created_ts)"
+            )
+            self._conn.commit()
+    
+    @staticmethod
+    def _to_timestamp(value: Any) -> float:
+        """Convert an ISO string or datetime to epoch seconds"""
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=MANILA_TZ)
+        return value.timestamp()
+    
+    @classmethod
+    def _to_row(cls, alert: Alert) -> Tuple[str, str, str, str, str, float, str]:
+        return (
+            alert.alert_id,
+            alert.customer_id,
+            alert.alert_type.value,
+            alert.severity.value,
+            alert.status,
+            cls._to_timestamp(alert.created_at),
+            alert.to_json()
+        )
     
     def store_alert(self, alert: Alert) -> bool:
         """
@@ -650,20 +807,30 @@ class AlertStorage:
         Returns:
             True if stored successfully
         """
-        try:
-            # Store in memory
-            self.alerts[alert.alert_id] = alert
-            
-            # Persist to file
-            filename = self.storage_path / f"{alert.alert_id}.json"
-            with open(filename, 'w') as f:
-                f.write(alert.to_json())
+        return self.store_alerts([alert]) == 1
+    
+    def store_alerts(self, alerts: List[Alert]) -> int:
+        """
+        Store a batch of alerts in a single transaction
+        
+        Args:
+            alerts: Alerts to store
             
-            logger.debug(f"Alert stored: {alert.alert_id}")
-            return True
+        Returns:
+            Number of alerts stored
+        """
+        try:
+            rows = [self._to_row(alert) for alert in alerts]
+            # The connection context commits, or rolls back a partial batch
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO alerts VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                )
+            logger.debug(f"Stored {len(rows)} alert(s)")
+            return len(rows)
         except Exception as e:
-            logger.error(f"Failed to store alert: {e}")
-            return False
+            logger.error(f"Failed to store alerts: {e}")
+            return 0
     
     def get_alert(self, alert_id: str) -> Optional[Alert]:
         """
@@ -675,7 +842,83 @@ class AlertStorage:
         Returns:
             Alert or None
         """
-        return self.alerts.get(alert_id)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM alerts WHERE alert_id = ?", (alert_id,)
+            ).fetchone()
+        return Alert.from_json(row[0]) if row else None
+    
+    def update_status(self, alert_id: str, status: str) -> bool:
+        """
+        Update an alert's review status
+        
+        Args:
+            alert_id: Alert ID
+            status: New status (e.g. open, in_review, closed)
+            
+        Returns:
+            True if the alert exists
+        """
+        alert = self.get_alert(alert_id)
+        if alert is None:
+            return False
+        alert.status = status
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE alerts SET status = ?, payload = ? WHERE alert_id = ?",
+                (status, alert.to_json(), alert_id)
+            )
+        return True
+    
+    def query_alerts(self, customer_id: Optional[str] = None,
+                     status: Optional[str] = None,
+                     start: Optional[Any] = None,
+                     end: Optional[Any] = None,
+                     limit: int = 100,
+                     cursor: Optional[str] = None) -> Tuple[List[Alert], Optional[str]]:
+        """
+        Query alerts newest first, with keyset pagination
+        
+        Args:
+            customer_id: Filter by customer
+            status: Filter by status
+            start: Inclusive lower bound on created_at (ISO string or datetime)
+            end: Exclusive upper bound on created_at (ISO string or datetime)
+            limit: Page size
+            cursor: next_cursor from the previous page
+            
+        Returns:
+            Tuple of (alerts, next_cursor); next_cursor is None on the last page
+        """
+        clauses, params = [], []
+        if customer_id is not None:
+            clauses.append("customer_id = ?")
+            params.append(customer_id)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if start is not None:
+            clauses.append("created_ts >= ?")
+            params.append(self._to_timestamp(start))
+        if end is not None:
+            clauses.append("created_ts < ?")
+            params.append(self._to_timestamp(end))
+        if cursor:
+            cursor_ts, cursor_id = cursor.split("|", 1)
+            clauses.append("(created_ts < ? OR (created_ts = ? AND alert_id < ?))")
+            params.extend([float(cursor_ts), float(cursor_ts), cursor_id])
+        
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (f"SELECT created_ts, alert_id, payload FROM alerts {where} "
+               f"ORDER BY created_ts DESC, alert_id DESC LIMIT ?")
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit + 1]).fetchall()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = f"{rows[-1][0]!r}|{rows[-1][1]}"
+        return [Alert.from_json(row[2]) for row in rows], next_cursor
     
     def get_customer_alerts(self, customer_id: str, 
                            limit: int = 100) -> List[Alert]:
@@ -687,17 +930,86 @@ class AlertStorage:
             limit: Maximum alerts to return
             
         Returns:
-            List of alerts
+            List of alerts (newest first)
         """
-        customer_alerts = [
-            alert for alert in self.alerts.values()
-            if alert.customer_id == customer_id
-        ]
-        
-        # Sort by creation time (newest first)
-        customer_alerts.sort(key=lambda a: a.created_at, reverse=True)
+        alerts, _ = self.query_alerts(customer_id=customer_id, limit=limit)
+        return alerts
+    
+    def count_alerts(self) -> int:
+        """Total number of stored alerts"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+    
+    def count_by(self, column: str) -> Dict[str, int]:
+        """Alert counts grouped by alert_type, severity or status"""
+        if column not in ("alert_type", "severity", "status"):
+            raise ValueError(f"Unsupported group-by column: {column}")
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {column}, COUNT(*) FROM alerts GROUP BY {column}"
+            ).fetchall()
+        return dict(rows)
+    
+    def customers_with_severity(self, severities: List[str]) -> List[str]:
+        """Distinct customers having alerts of the given severities"""
+        placeholders = ", ".join("?" for _ in severities)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT DISTINCT customer_id FROM alerts WHERE severity IN ({placeholders})",
+                list(severities)
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def migrate_json_files(self, directory: Optional[Path] = None,
+                           batch_size: int = 5000,
+                           delete_migrated: bool = False) -> Dict[str, int]:
+        """
+        Import legacy one-file-per-alert JSON files
         
-        return customer_alerts[:limit]
+        Args:
+            directory: Directory with <alert_id>.json files (defaults to storage_path)
+            batch_size: Alerts per insert transaction
+            delete_migrated: Remove each file once its batch is committed
+            
+        Returns:
+            Counts of migrated and failed files
+        """
+        directory = directory or self.storage_path
+        migrated, failed = 0, 0
+        batch: List[Alert] = []
+        batch_files: List[Path] = []
+        
+        def flush():
+            nonlocal migrated
+            if not batch:
+                return
+            stored = self.store_alerts(batch)
+            migrated += stored
+            if delete_migrated and stored == len(batch):
+                for path in batch_files:
+                    path.unlink()
+            batch.clear()
+            batch_files.clear()
+        
+        for path in directory.glob("*.json"):
+            try:
+                batch.append(Alert.from_json(path.read_text()))
+                batch_files.append(path)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable alert file {path.name}: {e}")
+                failed += 1
+                continue
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+        
+        logger.info(f"Migrated {migrated} alert file(s), {failed} failed")
+        return {"migrated": migrated, "failed": failed}
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
 
 
 def generate_alert_summary(monitor: TransactionMonitor) -> Dict[str, Any]:
@@ -710,30 +1022,18 @@ def generate_alert_summary(monitor: TransactionMonitor) -> Dict[str, Any]:
     Returns:
         Summary dictionary
     """
+    storage = monitor.alert_storage
     summary = {
         'timestamp': datetime.now(MANILA_TZ).isoformat(),
         'active_customers': len(monitor.velocity_tracker.transactions),
-        'alerts_total': len(monitor.alert_storage.alerts),
-        'alerts_by_type': {},
-        'alerts_by_severity': {},
-        'high_risk_customers': []
+        'alerts_total': storage.count_alerts(),
+        'alerts_by_type': storage.count_by('alert_type'),
+        'alerts_by_severity': storage.count_by('severity'),
+        'high_risk_customers': storage.customers_with_severity(
+            [AlertSeverity.HIGH.value, AlertSeverity.CRITICAL.value]
+        )
     }
     
-    # Count by type and severity
-    for alert in monitor.alert_storage.alerts.values():
-        # By type
-        alert_type = alert.alert_type.value
-        summary['alerts_by_type'][alert_type] = summary['alerts_by_type'].get(alert_type, 0) + 1
-        
-        # By severity
-        severity = alert.severity.value
-        summary['alerts_by_severity'][severity] = summary['alerts_by_severity'].get(severity, 0) + 1
-        
-        # Track high risk
-        if alert.severity in [AlertSeverity.HIGH, AlertSeverity.CRITICAL]:
-            if alert.customer_id not in summary['high_risk_customers']:
-                summary['high_risk_customers'].append(alert.customer_id)
-    
     return summary
 
 
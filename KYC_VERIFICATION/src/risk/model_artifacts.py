@@ -0,0 +1,329 @@
+"""
+Risk Model Artifacts
+Flat, memory-mappable storage for the risk engine's tree ensembles
+
+Fitted sklearn forests are exported as a directory of .npy node arrays
+(feature, threshold, left, right, value) plus a meta.json. Loading maps the
+arrays read-only, so every worker process scoring with the same artifact
+shares one copy of the tree pages through the OS page cache instead of
+holding its own unpickled forest. Models that cannot be flattened fall back
+to an uncompressed joblib file loaded with mmap_mode="r".
+
+Artifacts are never rewritten in place, since other processes may have them
+mapped. A flat artifact is written to a new versioned sibling directory and
+published by atomically replacing the {name}.flat symlink; joblib files are
+written to a temporary file and os.replace()d.
+"""
+
+import json
+import logging
+import os
+import pickle
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import joblib
+import numpy as np
+from scipy.special import expit
+from sklearn.ensemble import (
+    ExtraTreesClassifier,
+    GradientBoostingClassifier,
+    RandomForestClassifier,
+)
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMAT_VERSION = 1
+FLAT_SUFFIX = ".flat"
+ARRAY_NAMES = ("feature", "threshold", "left", "right", "value", "roots", "tree_output")
+
+# Loaded artifacts shared by every RiskEngine in the process:
+# path -> ((resolved marker path, mtime_ns), model)
+_LOADED: Dict[str, Tuple[Tuple[str, int], Any]] = {}
+
+
+class FlatTreeEnsemble:
+    """Tree ensemble evaluated from flat node arrays
+
+    All trees are concatenated into one node table with global child indices
+    (-1 marks a leaf) and evaluated with a level-by-level traversal across
+    every tree at once, avoiding sklearn's per-call validation and
+    per-estimator dispatch. For forests, leaf values are per-class probabilities
+    averaged over trees; for gradient boosting they are raw stage outputs
+    summed into tree_output columns and passed through the loss link.
+    """
+
+    CHUNK_ROWS = 4096
+
+    def __init__(self, kind: str, arrays: Dict[str, np.ndarray], classes: np.ndarray,
+                 n_features_in: int, learning_rate: float = 1.0,
+                 init_raw: Optional[np.ndarray] = None):
+        self.kind = kind
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.left = arrays["left"]
+        self.right = arrays["right"]
+        self.value = arrays["value"]
+        self.roots = arrays["roots"]
+        self.tree_output = arrays["tree_output"]
+        self.classes_ = np.asarray(classes)
+        self.n_classes_ = len(self.classes_)
+        self.n_features_in_ = n_features_in
+        self.learning_rate = learning_rate
+        self.init_raw = np.zeros(1) if init_raw is None else np.asarray(init_raw, dtype=np.float64)
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return {name: getattr(self, name) for name in ARRAY_NAMES}
+
+    def _leaves(self, X: np.ndarray) -> np.ndarray:
+        """Leaf node index per (row, tree)
+
+        Every tree advances one level per step for all rows at once, so the
+        Python-level loop runs max-depth times regardless of ensemble size.
+        """
+        node = np.repeat(self.roots[np.newaxis, :].astype(np.intp), X.shape[0], axis=0)
+        rows = np.arange(X.shape[0])[:, np.newaxis]
+        while True:
+            left = self.left[node]
+            internal = left >= 0
+            if not internal.any():
+                return node
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(internal, np.where(go_left, left, self.right[node]), node)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        # sklearn trees compare float32 inputs against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[0] > self.CHUNK_ROWS:
+            # Bound the (rows x trees) working arrays on large batches
+            return np.concatenate([self.predict_proba(X[i:i + self.CHUNK_ROWS])
+                                   for i in range(0, X.shape[0], self.CHUNK_ROWS)])
+        leaves = self._leaves(X)
+
+        # cumsum accumulates trees strictly in order, like sklearn, so results
+        # do not depend on the batch size or array layout
+        if self.kind == "forest":
+            return np.cumsum(self.value[leaves], axis=1)[:, -1] / self.n_trees
+
+        n_outputs = len(self.init_raw)
+        stage_values = self.learning_rate * self.value[leaves, 0]
+        raw = np.empty((X.shape[0], n_outputs))
+        for k in range(n_outputs):
+            terms = np.column_stack([np.full(X.shape[0], self.init_raw[k]),
+                                     stage_values[:, self.tree_output == k]])
+            raw[:, k] = np.cumsum(terms, axis=1)[:, -1]
+
+        if n_outputs == 1:
+            p = expit(raw[:, 0])
+            return np.column_stack([1.0 - p, p])
+        raw -= raw.max(axis=1, keepdims=True)
+        exp = np.exp(raw)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+
+def _concat_trees(trees, leaf_values) -> Dict[str, np.ndarray]:
+    """Concatenate sklearn Tree objects into one node table"""
+    feature, threshold, left, right, value, roots = [], [], [], [], [], []
+    offset = 0
+    for tree, values in zip(trees, leaf_values):
+        is_leaf = tree.children_left == -1
+        feature.append(np.where(is_leaf, 0, tree.feature).astype(np.int32))
+        threshold.append(tree.threshold.astype(np.float64))
+        left.append(np.where(is_leaf, -1, tree.children_left + offset).astype(np.int32))
+        right.append(np.where(is_leaf, -1, tree.children_right + offset).astype(np.int32))
+        value.append(values)
+        roots.append(offset)
+        offset += tree.node_count
+    return {
+        "feature": np.concatenate(feature),
+        "threshold": np.concatenate(threshold),
+        "left": np.concatenate(left),
+        "right": np.concatenate(right),
+        "value": np.concatenate(value).astype(np.float64),
+        "roots": np.asarray(roots, dtype=np.int64),
+    }
+
+
+def flatten_model(model: Any) -> FlatTreeEnsemble:
+    """
+    Convert a fitted sklearn tree ensemble into a FlatTreeEnsemble
+
+    Raises:
+        ValueError: If the model type or configuration is not supported
+    """
+    if isinstance(model, FlatTreeEnsemble):
+        return model
+    if not hasattr(model, "estimators_"):
+        raise ValueError(f"{type(model).__name__} is not a fitted tree ensemble")
+
+    if isinstance(model, (RandomForestClassifier, ExtraTreesClassifier)):
+        if getattr(model, "n_outputs_", 1) != 1:
+            raise ValueError("Multi-output forests are not supported")
+        trees = [e.tree_ for e in model.estimators_]
+        leaf_values = []
+        for tree in trees:
+            proba = tree.value[:, 0, :model.n_classes_]
+            normalizer = proba.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            leaf_values.append(proba / normalizer)
+        arrays = _concat_trees(trees, leaf_values)
+        arrays["tree_output"] = np.zeros(len(trees), dtype=np.int32)
+        return FlatTreeEnsemble("forest", arrays, model.classes_, model.n_features_in_)
+
+    if isinstance(model, GradientBoostingClassifier):
+        if model.loss != "log_loss":
+            raise ValueError(f"Gradient boosting loss {model.loss!r} is not supported")
+        if not (model.init_ == "zero" or type(model.init_).__name__ == "DummyClassifier"):
+            raise ValueError("Gradient boosting with a custom init estimator is not supported")
+        stages, n_outputs = model.estimators_.shape
+        trees = [model.estimators_[s, k].tree_ for s in range(stages) for k in range(n_outputs)]
+        arrays = _concat_trees(trees, [t.value[:, 0, :1] for t in trees])
+        arrays["tree_output"] = np.tile(np.arange(n_outputs, dtype=np.int32), stages)
+        # Prior-based init is constant, so evaluate it once on a dummy row
+        init_raw = model._raw_predict_init(np.zeros((1, model.n_features_in_), dtype=np.float32))[0]
+        return FlatTreeEnsemble("boosting", arrays, model.classes_, model.n_features_in_,
+                                learning_rate=float(model.learning_rate), init_raw=init_raw)
+
+    raise ValueError(f"{type(model).__name__} cannot be flattened")
+
+
+def save_model_artifact(model: Any, model_dir: Path, name: str) -> Path:
+    """
+    Write a model artifact, flattened when possible, otherwise as joblib
+
+    Returns:
+        Path of the written artifact (a .flat directory or a .joblib file)
+    """
+    model_dir = Path(model_dir)
+    model_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        flat = flatten_model(model)
+    except ValueError as e:
+        logger.info(f"Model {name} saved as joblib ({e})")
+        path = model_dir / f"{name}.joblib"
+        tmp = path.with_name(f"{path.name}.tmp-{uuid.uuid4().hex[:12]}")
+        try:
+            joblib.dump(model, tmp, compress=0)  # uncompressed so it can be memory-mapped
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return path
+
+    path = model_dir / f"{name}{FLAT_SUFFIX}"
+    version = model_dir / f"{path.name}.{uuid.uuid4().hex[:12]}"
+    version.mkdir()
+    try:
+        _write_flat(flat, model, version)
+        _publish(version, path)
+    except BaseException:
+        shutil.rmtree(version, ignore_errors=True)
+        raise
+    return path
+
+
+def _write_flat(flat: FlatTreeEnsemble, model: Any, path: Path) -> None:
+    for array_name, array in flat.arrays().items():
+        np.save(path / f"{array_name}.npy", np.ascontiguousarray(array))
+    meta = {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "kind": flat.kind,
+        "model_type": type(model).__name__,
+        "classes": flat.classes_.tolist(),
+        "n_features_in": int(flat.n_features_in_),
+        "learning_rate": flat.learning_rate,
+        "init_raw": flat.init_raw.tolist(),
+    }
+    # meta.json is written last and marks the artifact complete
+    (path / "meta.json").write_text(json.dumps(meta, indent=2))
+
+
+def _publish(version: Path, path: Path) -> None:
+    """Point path at a completely written version directory in one step"""
+    previous = path.resolve() if path.is_symlink() else None
+    link = path.with_name(f"{path.name}.link-{version.suffix[1:]}")
+    try:
+        os.symlink(version.name, link, target_is_directory=True)
+    except OSError:
+        link = None  # no symlink support: fall back to a two-step swap below
+
+    if path.exists() and not path.is_symlink():
+        # Plain directory from an older save: move it aside first
+        previous = path.with_name(f"{path.name}.old-{version.suffix[1:]}")
+        os.replace(path, previous)
+    if link is not None:
+        os.replace(link, path)
+    else:
+        os.replace(version, path)
+
+    # Processes that already mapped the old arrays keep their pages after unlink
+    if previous is not None and previous != version:
+        shutil.rmtree(previous, ignore_errors=True)
+
+
+def _load_flat(path: Path) -> FlatTreeEnsemble:
+    # Read every file from one version even if a newer one is published meanwhile
+    path = path.resolve()
+    meta = json.loads((path / "meta.json").read_text())
+    if meta.get("format_version") != ARTIFACT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported artifact format {meta.get('format_version')}")
+    arrays = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in ARRAY_NAMES}
+    return FlatTreeEnsemble(meta["kind"], arrays, np.asarray(meta["classes"]),
+                            meta["n_features_in"], meta["learning_rate"], meta["init_raw"])
+
+
+def load_model_artifact(model_dir: Path, name: str) -> Optional[Any]:
+    """
+    Load a model artifact, preferring flat arrays, then joblib, then pickle
+
+    Loaded models are cached per process and reused until the artifact is
+    replaced.
+
+    Returns:
+        The loaded model, or None if no artifact exists for name
+    """
+    model_dir = Path(model_dir)
+    candidates = [
+        (model_dir / f"{name}{FLAT_SUFFIX}", lambda p: _load_flat(p)),
+        (model_dir / f"{name}.joblib", lambda p: joblib.load(p, mmap_mode="r")),
+        (model_dir / f"{name}.pkl", lambda p: pickle.loads(p.read_bytes())),
+    ]
+
+    for path, loader in candidates:
+        marker = path / "meta.json" if path.suffix == FLAT_SUFFIX else path
+        if not marker.exists():
+            continue
+        key = str(path.absolute())
+        stamp = (str(marker.resolve()), marker.stat().st_mtime_ns)
+        cached = _LOADED.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        try:
+            model = loader(path)
+        except FileNotFoundError:
+            # A newer version replaced this one mid-load; load that instead
+            stamp = (str(marker.resolve()), marker.stat().st_mtime_ns)
+            model = loader(path)
+        _LOADED[key] = (stamp, model)
+        return model
+
+    return None
+
+
+__all__ = [
+    "FlatTreeEnsemble",
+    "flatten_model",
+    "save_model_artifact",
+    "load_model_artifact",
+]
@@ -6,13 +6,13 @@ Policy-driven thresholds with explainable decisions (approve/review/deny)
 
 import json
 import logging
+import time
 import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 from pathlib import Path
-import pickle
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.preprocessing import StandardScaler
 try:
@@ -21,11 +21,21 @@ try:
 except Exception:
     xgb = None  # type: ignore
     XGB_AVAILABLE = False
+try:
+    import yaml  # type: ignore
+    YAML_AVAILABLE = True
+except Exception:
+    yaml = None  # type: ignore
+    YAML_AVAILABLE = False
+
+from .model_artifacts import flatten_model, load_model_artifact, save_model_artifact
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_POLICY_PACK = Path(__file__).resolve().parents[2] / "configs" / "policy_pack.yaml"
+
 class DecisionType(Enum):
     """Decision outcomes"""
     APPROVE = "approve"
@@ -83,6 +93,107 @@ class RiskPolicy:
     action: DecisionType
     message: str
 
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class CompiledPolicySet:
+    """Policies compiled once for fast first-match evaluation
+    
+    Condition paths become key tuples, and each policy is filed in a dispatch
+    table under its first hashable condition (path -> expected value ->
+    policies). Dispatch paths are merged into a key trie so shared prefixes
+    are resolved once per request; only policies whose discriminating value
+    matched are then checked, in priority order, so unrelated policies are
+    never visited.
+    """
+    
+    def __init__(self, policies: List[RiskPolicy]):
+        self.policies = sorted((p for p in policies if p.enabled), key=lambda p: p.priority)
+        self.conditions: List[Tuple[Tuple[Tuple[str, ...], Any], ...]] = []
+        self.dispatch: Dict[Tuple[str, ...], Dict[Any, List[int]]] = {}
+        self.unconditional: List[int] = []  # policies with no hashable condition
+        
+        for order, policy in enumerate(self.policies):
+            conditions = tuple(
+                (tuple(path.split('.')), expected)
+                for path, expected in policy.conditions.items()
+            )
+            self.conditions.append(conditions)
+            
+            key = next(((path, expected) for path, expected in conditions
+                        if _is_hashable(expected)), None)
+            if key is None:
+                self.unconditional.append(order)
+            else:
+                path, expected = key
+                self.dispatch.setdefault(path, {}).setdefault(expected, []).append(order)
+        
+        # Trie node: key -> [child node, value buckets or None]
+        self._trie: Dict[str, list] = {}
+        for path, buckets in self.dispatch.items():
+            node = self._trie
+            for key in path[:-1]:
+                node = node.setdefault(key, [{}, None])[0]
+            node.setdefault(path[-1], [{}, None])[1] = buckets
+    
+    def __len__(self) -> int:
+        return len(self.policies)
+    
+    @staticmethod
+    def _resolve(data: Dict, path: Tuple[str, ...]) -> Any:
+        value = data
+        for key in path:
+            if isinstance(value, dict):
+                value = value.get(key)
+            else:
+                return None
+        return value
+    
+    def _candidates(self, data: Dict[str, Any]) -> List[int]:
+        """Policies whose discriminating condition holds for data"""
+        candidates = list(self.unconditional)
+        stack = [(self._trie, data)]
+        
+        while stack:
+            node, value = stack.pop()
+            for key, (children, buckets) in node.items():
+                child = value.get(key) if isinstance(value, dict) else None
+                if buckets is not None:
+                    try:
+                        bucket = buckets.get(child)
+                    except TypeError:  # unhashable value cannot equal a hashable expected
+                        bucket = None
+                    if bucket:
+                        candidates.extend(bucket)
+                if children:
+                    stack.append((children, child))
+        
+        return candidates
+    
+    def match(self, data: Dict[str, Any]) -> Optional[RiskPolicy]:
+        """Return the highest-priority policy whose conditions all hold"""
+        candidates = self._candidates(data)
+        if not candidates:
+            return None
+        
+        resolved: Dict[Tuple[str, ...], Any] = {}
+        for order in sorted(candidates):
+            for path, expected in self.conditions[order]:
+                if path not in resolved:
+                    resolved[path] = self._resolve(data, path)
+                if resolved[path] != expected:
+                    break
+            else:
+                return self.policies[order]
+        
+        return None
+
+
 class RiskEngine:
     """Risk scoring and decisioning engine"""
     
@@ -90,9 +201,14 @@ class RiskEngine:
         """Initialize risk engine"""
         self.config = self._load_config(config_path)
         self.policies = self._load_policies()
+        self.compiled_policies = CompiledPolicySet(self.policies)
         self.models = self._initialize_models()
         self.scaler = StandardScaler()
         self.feature_weights = self._load_feature_weights()
+        # Fixed model input column order, shared by single and batch scoring
+        self.feature_names = list(self.feature_weights.keys())
+        # model name -> (source model, its estimators_, flattened ensemble or None)
+        self.compiled_models: Dict[str, Tuple[Any, Any, Any]] = {}
         
     def _load_config(self, config_path: Optional[str]) -> Dict:
         """Load risk engine configuration"""
@@ -127,7 +243,11 @@ class RiskEngine:
                 "allow_manual_override": True,
                 "require_supervisor_approval": True,
                 "audit_all_overrides": True
-            }
+            },
+            "policy_pack": str(DEFAULT_POLICY_PACK),
+            "model_dir": "models",
+            "compiled_inference": True,  # flat-array evaluation of trained sklearn tree ensembles
+            "compiled_max_batch": 64     # larger batches are faster through sklearn itself
         }
         
         if config_path and Path(config_path).exists():
@@ -222,9 +342,62 @@ class RiskEngine:
             )
         ]
         
+        # Policy pack entries replace built-ins of the same name or add new ones
+        pack_policies = {p.name: p for p in self._load_policy_pack(self.config.get("policy_pack"))}
+        policies = [pack_policies.pop(p.name, p) for p in policies] + list(pack_policies.values())
+        
         # Sort by priority
         return sorted(policies, key=lambda p: p.priority)
     
+    def _load_policy_pack(self, pack_path: Optional[str]) -> List[RiskPolicy]:
+        """Load risk_policies entries from the YAML policy pack"""
+        if not pack_path or not Path(pack_path).exists():
+            return []
+        if not YAML_AVAILABLE:
+            logger.warning(f"PyYAML not installed; skipping policy pack {pack_path}")
+            return []
+        
+        try:
+            with open(pack_path, 'r') as f:
+                pack = yaml.safe_load(f) or {}
+        except Exception as e:
+            logger.warning(f"Failed to load policy pack {pack_path}: {e}")
+            return []
+        
+        policies = []
+        for entry in pack.get("risk_policies") or []:
+            try:
+                policies.append(RiskPolicy(
+                    name=entry["name"],
+                    enabled=bool(entry.get("enabled", True)),
+                    priority=int(entry.get("priority", 5)),
+                    conditions=dict(entry["conditions"]),
+                    action=DecisionType(entry["action"]),
+                    message=entry.get("message", entry["name"])
+                ))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping invalid policy pack entry {entry!r}: {e}")
+        
+        return policies
+    
+    def reload_policies(self, policies: Optional[List[RiskPolicy]] = None) -> int:
+        """
+        Recompile policies and swap them in atomically
+        
+        Args:
+            policies: Explicit policy list; defaults to built-ins plus the policy pack
+            
+        Returns:
+            Number of enabled compiled policies
+        """
+        policies = sorted(policies, key=lambda p: p.priority) if policies is not None else self._load_policies()
+        compiled = CompiledPolicySet(policies)
+        # Single reference assignments: in-flight checks keep the set they started with
+        self.policies = policies
+        self.compiled_policies = compiled
+        logger.info(f"Risk policies reloaded: {len(compiled)} enabled")
+        return len(compiled)
+    
     def _initialize_models(self) -> Dict[str, Any]:
         """Initialize ML models for ensemble"""
         models = {}
@@ -261,19 +434,89 @@ class RiskEngine:
         return models
     
     def _load_pretrained_models(self, models: Dict[str, Any]):
-        """Load pre-trained models if available"""
-        model_dir = Path("models")
+        """Load pre-trained model artifacts if available
+        
+        Flat (.flat) and joblib artifacts are memory-mapped and cached per
+        process, so workers share the model pages; legacy .pkl files are
+        still accepted.
+        """
+        model_dir = Path(self.config.get("model_dir", "models"))
         
         if model_dir.exists():
             for model_name in models.keys():
-                model_path = model_dir / f"{model_name}.pkl"
-                if model_path.exists():
-                    try:
-                        with open(model_path, 'rb') as f:
-                            models[model_name] = pickle.load(f)
-                        logger.info(f"Loaded pre-trained model: {model_name}")
-                    except Exception as e:
-                        logger.warning(f"Failed to load model {model_name}: {e}")
+                try:
+                    model = load_model_artifact(model_dir, model_name)
+                except Exception as e:
+                    logger.warning(f"Failed to load model {model_name}: {e}")
+                    continue
+                if model is not None:
+                    models[model_name] = model
+                    logger.info(f"Loaded pre-trained model: {model_name} ({type(model).__name__})")
+    
+    def export_models(self, model_dir: Optional[str] = None) -> Dict[str, str]:
+        """
+        Write trained ensemble models as shareable artifacts
+        
+        Args:
+            model_dir: Target directory; defaults to the configured model_dir
+            
+        Returns:
+            Artifact path per exported model
+        """
+        model_dir = Path(model_dir or self.config.get("model_dir", "models"))
+        exported = {}
+        for model_name, model in self.models.items():
+            if hasattr(model, 'n_classes_'):
+                exported[model_name] = str(save_model_artifact(model, model_dir, model_name))
+        return exported
+    
+    def _predictor(self, model_name: str, model: Any, n_rows: int = 1) -> Any:
+        """Return the object used for predict_proba on a trained model
+        
+        With compiled_inference enabled, sklearn tree ensembles scoring up to
+        compiled_max_batch rows use the flat-array evaluator; they are
+        flattened on first use and re-flattened if the model is refit.
+        Anything that cannot be flattened (e.g. XGBoost) is used as is.
+        """
+        if not self.config.get("compiled_inference", False):
+            return model
+        if n_rows > self.config.get("compiled_max_batch", 64):
+            return model
+        
+        estimators = getattr(model, "estimators_", None)
+        cached = self.compiled_models.get(model_name)
+        if cached is None or cached[0] is not model or cached[1] is not estimators:
+            try:
+                compiled = flatten_model(model)
+            except ValueError as e:
+                logger.debug(f"Model {model_name} not compiled: {e}")
+                compiled = None
+            cached = (model, estimators, compiled)
+            self.compiled_models[model_name] = cached
+        
+        return cached[2] if cached[2] is not None else model
+    
+    def warm_up(self) -> Dict[str, float]:
+        """
+        Run a dummy prediction through every trained model
+        
+        Call at startup so artifact pages are mapped and models are compiled
+        before the first request rather than during it.
+        
+        Returns:
+            Warm-up latency per trained model in milliseconds
+        """
+        X = np.zeros((1, len(self.feature_names)))
+        timings = {}
+        for model_name, model in self.models.items():
+            if not hasattr(model, 'n_classes_'):
+                logger.warning(f"Model {model_name} is not trained; excluded from ensemble scoring")
+                continue
+            start = time.perf_counter()
+            self._predictor(model_name, model).predict_proba(X)
+            timings[model_name] = (time.perf_counter() - start) * 1000
+        logger.info(f"Risk models warmed up: {timings}")
+        return timings
     
     def _load_feature_weights(self) -> Dict[str, float]:
         """Load feature importance weights"""
@@ -351,6 +594,40 @@ class RiskEngine:
         
         return risk_score, decision
     
+    def calculate_risk_batch(self, verification_data_list: List[Dict[str, Any]]) -> List[Tuple[RiskScore, Decision]]:
+        """
+        Calculate risk scores and decisions for many applicants at once
+        
+        Features are stacked into one matrix so each ensemble model runs a
+        single predict_proba over the whole batch, and rule scores and
+        feature importance are computed on arrays; results match calling
+        calculate_risk on each item.
+        
+        Args:
+            verification_data_list: Aggregated verification data per applicant
+            
+        Returns:
+            (risk score, decision) per applicant, in input order
+        """
+        if not verification_data_list:
+            return []
+        
+        logger.info(f"🎯 Starting batch risk assessment for {len(verification_data_list)} applicants...")
+        
+        feature_sets = [self._extract_features(data) for data in verification_data_list]
+        risk_scores = self._calculate_risk_scores_batch(feature_sets)
+        
+        results = []
+        for data, features, risk_score in zip(verification_data_list, feature_sets, risk_scores):
+            policy_decision = self._check_policies(data)
+            decision = self._make_decision(risk_score, policy_decision, data)
+            decision = self._add_explanations(decision, risk_score, features)
+            results.append((risk_score, decision))
+        
+        logger.info(f"✅ Batch risk assessment complete: {len(results)} applicants")
+        
+        return results
+    
     def _extract_features(self, data: Dict[str, Any]) -> List[RiskFeature]:
         """Extract risk features from verification data"""
         features = []
@@ -509,51 +786,30 @@ class RiskEngine:
     
     def _check_policies(self, data: Dict[str, Any]) -> Optional[Decision]:
         """Check policy rules for immediate decisions"""
-        for policy in self.policies:
-            if not policy.enabled:
-                continue
-            
-            # Check if policy conditions are met
-            conditions_met = True
-            
-            for condition, expected_value in policy.conditions.items():
-                actual_value = self._get_nested_value(data, condition)
-                
-                if actual_value != expected_value:
-                    conditions_met = False
-                    break
-            
-            if conditions_met:
-                logger.info(f"Policy triggered: {policy.name}")
-                
-                return Decision(
-                    decision_type=policy.action,
-                    risk_score=1.0 if policy.action == DecisionType.DENY else 0.5,
-                    confidence=1.0,
-                    reasons=[policy.message],
-                    recommendations=[],
-                    policy_violations=[policy.name],
-                    review_required_fields=[],
-                    metadata={"triggered_policy": policy.name}
-                )
-        
-        return None
-    
-    def _get_nested_value(self, data: Dict, path: str) -> Any:
-        """Get value from nested dictionary using dot notation"""
-        keys = path.split('.')
-        value = data
+        policy = self.compiled_policies.match(data)
+        if policy is None:
+            return None
         
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            else:
-                return None
+        logger.debug(f"Policy triggered: {policy.name}")
         
-        return value
+        return Decision(
+            decision_type=policy.action,
+            risk_score=1.0 if policy.action == DecisionType.DENY else 0.5,
+            confidence=1.0,
+            reasons=[policy.message],
+            recommendations=[],
+            policy_violations=[policy.name],
+            review_required_fields=[],
+            metadata={"triggered_policy": policy.name}
+        )
     
-    def _calculate_risk_score(self, features: List[RiskFeature]) -> RiskScore:
-        """Calculate risk score using ensemble model"""
+    def _calculate_risk_score(self, features: List[RiskFeature],
+                              model_scores: Optional[Dict[str, float]] = None) -> RiskScore:
+        """Calculate risk score using ensemble model
+        
+        model_scores may be supplied by the caller; otherwise the ensemble
+        is queried for this feature set.
+        """
         # Group features by category
         category_features = {}
         for feature in features:
@@ -584,9 +840,11 @@ class RiskEngine:
             overall_score += score * weight
         
         # Get model predictions if available
-        model_scores = {}
-        if self.config["ensemble"]["use_ensemble"] and self.models:
-            model_scores = self._get_ensemble_predictions(features)
+        if not (self.config["ensemble"]["use_ensemble"] and self.models):
+            model_scores = {}
+        else:
+            if model_scores is None:
+                model_scores = self._get_ensemble_predictions(features)
             
             # Combine rule-based and ML scores
             if model_scores:
@@ -607,33 +865,117 @@ class RiskEngine:
             feature_importance=feature_importance[:10]  # Top 10 features
         )
     
+    def _calculate_risk_scores_batch(self, feature_sets: List[List[RiskFeature]]) -> List[RiskScore]:
+        """Calculate risk scores for many feature sets at once
+        
+        Applicants with the same features present share one feature layout,
+        so each layout is scored on a value matrix, one column per feature.
+        Sums run in the same order as _calculate_risk_score, so every score
+        is identical to scoring the applicant alone.
+        """
+        n = len(feature_sets)
+        if self.config["ensemble"]["use_ensemble"] and self.models:
+            model_scores = self._get_ensemble_predictions_batch(feature_sets)
+        else:
+            model_scores = [{} for _ in range(n)]
+        
+        layouts: Dict[Tuple[str, ...], List[int]] = {}
+        for i, features in enumerate(feature_sets):
+            layouts.setdefault(tuple(f.name for f in features), []).append(i)
+        
+        category_weights = self.config["feature_categories"]
+        results: List[Optional[RiskScore]] = [None] * n
+        for names, rows in layouts.items():
+            template = feature_sets[rows[0]]
+            values = np.array([[f.normalized_value for f in feature_sets[i]] for i in rows])
+            values = values.reshape(len(rows), len(names))
+            
+            # Weighted average per category, features in their original order
+            category_columns: Dict[RiskCategory, List[int]] = {}
+            for j, feature in enumerate(template):
+                category_columns.setdefault(feature.category, []).append(j)
+            category_scores = {}
+            for category, columns in category_columns.items():
+                total_weight = sum(template[j].weight for j in columns)
+                weighted_sum = 0
+                for j in columns:
+                    weighted_sum = weighted_sum + (1 - values[:, j]) * template[j].weight  # Invert: high value = low risk
+                category_scores[category] = weighted_sum / max(total_weight, 1)
+            
+            overall_score = np.zeros(len(rows))
+            for category, score in category_scores.items():
+                overall_score = overall_score + score * category_weights.get(category.value, 0.1)
+            
+            # Combine rule-based and ML scores
+            layout_model_scores = [model_scores[i] for i in rows]
+            if layout_model_scores[0]:
+                ml_score = np.array([list(scores.values()) for scores in layout_model_scores]).mean(axis=1)
+                overall_score = 0.6 * overall_score + 0.4 * ml_score
+            overall_score = np.minimum(1.0, overall_score)
+            
+            # Feature importance: stable sort keeps feature order among equal impacts
+            scale = np.array([self.feature_weights.get(f.name, 0.05) for f in template])
+            weight = np.array([f.weight for f in template])
+            impact = np.abs(0.5 - values) * scale * weight
+            top = np.argsort(-impact, axis=1, kind="stable")[:, :10]
+            top_names = np.array(names, dtype=object)[top].tolist()
+            top_impacts = np.take_along_axis(impact, top, axis=1).tolist()
+            
+            category_lists = {c: s.tolist() for c, s in category_scores.items()}
+            overall_list = overall_score.tolist()
+            confidence = len(names) / len(self.feature_weights)
+            for k, i in enumerate(rows):
+                results[i] = RiskScore(
+                    overall_score=overall_list[k],
+                    category_scores={c: scores[k] for c, scores in category_lists.items()},
+                    confidence=confidence,
+                    model_scores=layout_model_scores[k],
+                    feature_importance=list(zip(top_names[k], top_impacts[k]))
+                )
+        
+        return results
+    
     def _get_ensemble_predictions(self, features: List[RiskFeature]) -> Dict[str, float]:
         """Get predictions from ensemble models"""
-        model_scores = {}
+        return self._get_ensemble_predictions_batch([features])[0]
+    
+    def _feature_matrix(self, feature_sets: List[List[RiskFeature]]) -> np.ndarray:
+        """Stack feature sets into an (n_applicants, n_features) model input"""
+        column = {name: j for j, name in enumerate(self.feature_names)}
+        X = np.zeros((len(feature_sets), len(self.feature_names)))
         
-        # Convert features to array
-        feature_names = list(self.feature_weights.keys())
-        feature_dict = {f.name: f.normalized_value for f in features}
+        for i, features in enumerate(feature_sets):
+            for f in features:
+                j = column.get(f.name)
+                if j is not None:
+                    X[i, j] = f.normalized_value
         
-        X = np.array([[
-            feature_dict.get(name, 0.0) for name in feature_names
-        ]])
+        return X
+    
+    def _get_ensemble_predictions_batch(self, feature_sets: List[List[RiskFeature]]) -> List[Dict[str, float]]:
+        """Get predictions from ensemble models, one predict_proba call per model"""
+        n = len(feature_sets)
+        model_scores: List[Dict[str, float]] = [{} for _ in range(n)]
+        if n == 0:
+            return model_scores
+        
+        X = self._feature_matrix(feature_sets)
         
-        # Get predictions from each model
+        # Get predictions from each trained model; untrained models are skipped
+        # so scores stay deterministic (rule-based only when nothing is trained)
         for model_name, model in self.models.items():
+            if not hasattr(model, 'n_classes_'):
+                continue
             try:
-                # Check if model is trained
-                if hasattr(model, 'n_classes_'):
-                    # Model is trained, get prediction
-                    prob = model.predict_proba(X)[0]
-                    # Assuming binary classification (risk/no-risk)
-                    model_scores[model_name] = prob[1] if len(prob) > 1 else prob[0]
-                else:
-                    # Model not trained, use random prediction for demo
-                    model_scores[model_name] = np.random.random() * 0.3  # Low risk for demo
+                prob = self._predictor(model_name, model, n).predict_proba(X)
+                # Assuming binary classification (risk/no-risk)
+                column = prob[:, 1] if prob.shape[1] > 1 else prob[:, 0]
             except Exception as e:
                 logger.warning(f"Model {model_name} prediction failed: {e}")
-                model_scores[model_name] = 0.5  # Neutral score
+                column = np.full(n, 0.5)  # Neutral score
+            
+            for scores, value in zip(model_scores, column):
+                scores[model_name] = value
         
         return model_scores
     
@@ -824,5 +1166,6 @@ __all__ = [
     "DecisionType",
     "RiskCategory",
     "RiskFeature",
-    "RiskPolicy"
+    "RiskPolicy",
+    "CompiledPolicySet"
 ]
\ No newline at end of file
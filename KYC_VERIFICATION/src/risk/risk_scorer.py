@@ -12,6 +12,10 @@ class RiskScorer:
     def __init__(self) -> None:
         self._engine = RiskEngine()
 
+    def warm_up(self) -> Dict[str, float]:
+        """Warm the engine's models; see RiskEngine.warm_up"""
+        return self._engine.warm_up()
+
     def calculate_score(
         self,
         document_data: Dict[str, Any],
@@ -7,7 +7,10 @@ Explainable hits with entity resolution and continuous monitoring
 import json
 import logging
 import hashlib
+import threading
+import time
 import requests
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -137,6 +140,214 @@ class ScreeningResult:
     screening_timestamp: datetime
     processing_time_ms: float
 
+@dataclass
+class MonitoringAlert:
+    """Alert raised when a list change matches a monitored individual"""
+    alert_id: str
+    individual_id: str
+    hit: ScreeningHit
+    list_version: str
+    created_at: datetime
+
+class CustomerBlockingIndex:
+    """Blocking index over the monitored customer base
+
+    Each name word is indexed under its deletion neighbourhood (the word
+    and every one-letter deletion of it, so two words within one edit
+    share a key) and its Soundex code; adjacent words are also indexed
+    joined ("Al Rashid" / "AlRashid"). A customer is a candidate when
+    min_shared_tokens tokens of the list name match one of theirs, or
+    every word when either name has fewer. Spelling variants the forward
+    matcher accepts ("Jon" / "John", "Mohammed" / "Muhamad") are kept,
+    while customers sharing a single common token are not scored.
+    """
+
+    _SOUNDEX_CODES = {
+        **dict.fromkeys("BFPV", "1"), **dict.fromkeys("CGJKQSXZ", "2"),
+        **dict.fromkeys("DT", "3"), "L": "4", **dict.fromkeys("MN", "5"), "R": "6",
+    }
+    # Shorter words only get their exact key: their deletions are too common
+    MIN_DELETION_LENGTH = 4
+
+    def __init__(self, normalizer, min_shared_tokens: int = 2):
+        self._normalize = normalizer
+        self.min_shared_tokens = max(1, int(min_shared_tokens))
+        self._postings: Dict[str, set] = {}
+        self._customers: Dict[str, Dict[str, Any]] = {}
+        self._customer_keys: Dict[str, List[str]] = {}
+        self._word_counts: Dict[str, int] = {}
+
+    @classmethod
+    def _soundex(cls, token: str) -> str:
+        codes = cls._SOUNDEX_CODES
+        encoded, previous = [], codes.get(token[0], "")
+        for char in token[1:]:
+            code = codes.get(char, "")
+            if code and code != previous:
+                encoded.append(code)
+            if char not in "HW":
+                previous = code
+        return (token[0] + "".join(encoded) + "000")[:4]
+
+    @classmethod
+    def _word_keys(cls, word: str) -> List[str]:
+        keys = {f"D:{word}", f"S:{cls._soundex(word)}"}
+        if len(word) >= cls.MIN_DELETION_LENGTH:
+            keys.update(f"D:{word[:i]}{word[i + 1:]}" for i in range(len(word)))
+        return sorted(keys)
+
+    def _tokens(self, name: str) -> Tuple[List[str], List[List[str]]]:
+        """Words of name and the index keys of each token (words, then joined pairs)"""
+        # Punctuation separates words here so "Al-Rashid" also matches "Al Rashid"
+        spaced = re.sub(r"[^\w\s]", " ", name or "")
+        words = list(dict.fromkeys(t for t in self._normalize(spaced).split() if len(t) > 1))
+        joined = [a + b for a, b in zip(words, words[1:])]
+        return words, [self._word_keys(w) for w in words] + [[f"D:{j}"] for j in joined]
+
+    def add(self, individual_id: str, individual_data: Dict[str, Any]) -> None:
+        """Index (or re-index) an individual"""
+        if individual_id in self._customers:
+            self.remove(individual_id)
+        words, token_keys = self._tokens(individual_data.get("name", ""))
+        keys = sorted(set(k for keys in token_keys for k in keys))
+        for key in keys:
+            self._postings.setdefault(key, set()).add(individual_id)
+        self._customers[individual_id] = individual_data
+        self._customer_keys[individual_id] = keys
+        self._word_counts[individual_id] = len(words)
+
+    def remove(self, individual_id: str) -> bool:
+        """Remove an individual from the index"""
+        if individual_id not in self._customers:
+            return False
+        for key in self._customer_keys.pop(individual_id):
+            posting = self._postings.get(key)
+            if posting is not None:
+                posting.discard(individual_id)
+                if not posting:
+                    del self._postings[key]
+        del self._customers[individual_id]
+        del self._word_counts[individual_id]
+        return True
+
+    def get(self, individual_id: str) -> Optional[Dict[str, Any]]:
+        return self._customers.get(individual_id)
+
+    def candidates(self, name: str) -> set:
+        """Return IDs of customers sharing enough name tokens with name"""
+        words, token_keys = self._tokens(name)
+        counts: Dict[str, int] = {}
+        for keys in token_keys:
+            matched = set()
+            for key in keys:
+                matched |= self._postings.get(key, set())
+            for individual_id in matched:
+                counts[individual_id] = counts.get(individual_id, 0) + 1
+
+        required = min(self.min_shared_tokens, len(words))
+        return {individual_id for individual_id, n in counts.items()
+                if n >= min(required, self._word_counts[individual_id])}
+
+    def __len__(self) -> int:
+        return len(self._customers)
+
+    def __contains__(self, individual_id: str) -> bool:
+        return individual_id in self._customers
+
+class ScreeningResultCache:
+    """Size- and TTL-bounded LRU cache for screening results
+
+    Entries are kept in an OrderedDict in least-recently-used order, so
+    lookups, inserts and evictions are all O(1). Every entry is tagged with
+    the list snapshot version it was computed against; changing the version
+    drops the whole cache so results are never served against an outdated
+    sanctions/PEP list.
+    """
+
+    def __init__(self, max_entries: int = 100_000, ttl_seconds: float = 90 * 86400,
+                 clock=None):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self._clock = clock or time.monotonic
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.version: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on miss/expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if self._clock() - stored_at >= self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Insert or refresh an entry, evicting the LRU/expired head as needed"""
+        with self._lock:
+            now = self._clock()
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            while self._entries:
+                stored_at = next(iter(self._entries.values()))[0]
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+                elif now - stored_at >= self.ttl_seconds:
+                    self._entries.popitem(last=False)
+                    self.expirations += 1
+                else:
+                    break
+
+    def ensure_version(self, version: str) -> None:
+        """Invalidate the whole cache if the list snapshot version changed"""
+        with self._lock:
+            if self.version != version:
+                if self._entries:
+                    self.invalidations += 1
+                self._entries.clear()
+                self.version = version
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "list_version": self.version,
+        }
+
 class AMLScreener:
     """AML and sanctions screening engine"""
     
@@ -146,7 +357,17 @@ class AMLScreener:
         self.sanctions_db = self._load_sanctions_database()
         self.pep_db = self._load_pep_database()
         self.vendor_configs = self._load_vendor_configs()
-        self.false_positive_cache = {}
+        fp_config = self.config["false_positive_handling"]
+        self.false_positive_cache = ScreeningResultCache(
+            max_entries=fp_config.get("max_cache_entries", 100_000),
+            ttl_seconds=fp_config["cache_duration_days"] * 86400
+        )
+        self.list_version = self._compute_list_version()
+        self.false_positive_cache.ensure_version(self.list_version)
+        self.monitoring_index = CustomerBlockingIndex(
+            self._normalize_name,
+            min_shared_tokens=self.config["continuous_monitoring"].get("min_shared_tokens", 2)
+        )
         
     def _load_config(self, config_path: Optional[str]) -> Dict:
         """Load AML screening configuration"""
@@ -182,13 +403,15 @@ class AMLScreener:
             "false_positive_handling": {
                 "enable_cache": True,
                 "cache_duration_days": 90,
+                "max_cache_entries": 100000,
                 "require_approval": True,
                 "audit_trail": True
             },
             "continuous_monitoring": {
                 "enabled": True,
                 "frequency_days": 30,
-                "alert_on_new_hits": True
+                "alert_on_new_hits": True,
+                "min_shared_tokens": 2
             }
         }
         
@@ -335,12 +558,14 @@ class AMLScreener:
         subject_id_numbers = individual_data.get("id_numbers", {})
         
         # Check false positive cache
+        cache_enabled = self.config["false_positive_handling"]["enable_cache"]
         cache_key = self._generate_cache_key(individual_data)
-        if cache_key in self.false_positive_cache:
-            cached_result = self.false_positive_cache[cache_key]
-            if self._is_cache_valid(cached_result):
+        if cache_enabled:
+            self.false_positive_cache.ensure_version(self.list_version)
+            cached_result = self.false_positive_cache.get(cache_key)
+            if cached_result is not None:
                 logger.info("Using cached screening result")
-                return cached_result["result"]
+                return cached_result
         
         # Perform internal screening
         sanctions_hits = self._screen_sanctions(
@@ -398,11 +623,8 @@ class AMLScreener:
         )
         
         # Cache result if auto-clearable
-        if auto_clearable and self.config["false_positive_handling"]["enable_cache"]:
-            self.false_positive_cache[cache_key] = {
-                "result": result,
-                "timestamp": datetime.now()
-            }
+        if auto_clearable and cache_enabled:
+            self.false_positive_cache.put(cache_key, result)
         
         logger.info(f"✅ AML screening complete: Risk={overall_risk.value}, "
                    f"Hits={result.total_hits}, Review={requires_review}")
@@ -411,11 +633,12 @@ class AMLScreener:
     
     def _screen_sanctions(self, name: str, dob: Optional[str], 
                          nationality: Optional[str],
-                         id_numbers: Dict[str, str]) -> List[ScreeningHit]:
-        """Screen against sanctions lists"""
+                         id_numbers: Dict[str, str],
+                         entities: Optional[List[SanctionedEntity]] = None) -> List[ScreeningHit]:
+        """Screen against sanctions lists (or only the given entities)"""
         hits = []
         
-        for entity in self.sanctions_db:
+        for entity in (self.sanctions_db if entities is None else entities):
             # Check name match
             name_score, match_type = self._match_names(name, entity.primary_name)
             
@@ -473,11 +696,12 @@ class AMLScreener:
         
         return hits
     
-    def _screen_pep(self, name: str, nationality: Optional[str]) -> List[ScreeningHit]:
-        """Screen against PEP database"""
+    def _screen_pep(self, name: str, nationality: Optional[str],
+                    peps: Optional[List[PEPEntity]] = None) -> List[ScreeningHit]:
+        """Screen against PEP database (or only the given PEPs)"""
         hits = []
         
-        for pep in self.pep_db:
+        for pep in (self.pep_db if peps is None else peps):
             # Match name
             name_score, match_type = self._match_names(name, pep.name)
             
@@ -757,21 +981,47 @@ class AMLScreener:
             individual_data.get("date_of_birth", ""),
             individual_data.get("nationality", "")
         ]
-        return hashlib.sha256("".join(key_parts).encode()).hexdigest()
+        return hashlib.sha256("|".join(str(p or "") for p in key_parts).encode()).hexdigest()
     
-    def _is_cache_valid(self, cached_entry: Dict) -> bool:
-        """Check if cached entry is still valid"""
-        if not self.config["false_positive_handling"]["enable_cache"]:
-            return False
-        
-        cache_duration = self.config["false_positive_handling"]["cache_duration_days"]
-        cache_timestamp = cached_entry.get("timestamp")
+    def _compute_list_version(self) -> str:
+        """Compute a snapshot version for the loaded sanctions and PEP lists"""
+        digest = hashlib.sha256()
+        for entity in self.sanctions_db:
+            digest.update(json.dumps(entity.__dict__, sort_keys=True, default=str).encode())
+        for pep in self.pep_db:
+            digest.update(json.dumps(pep.__dict__, sort_keys=True, default=str).encode())
+        return digest.hexdigest()[:16]
+    
+    def update_lists(self, sanctions_db: Optional[List[SanctionedEntity]] = None,
+                     pep_db: Optional[List[PEPEntity]] = None) -> str:
+        """
+        Replace the sanctions and/or PEP list snapshot
         
-        if cache_timestamp:
-            age_days = (datetime.now() - cache_timestamp).days
-            return age_days < cache_duration
+        Cached results are invalidated whenever the snapshot version changes.
         
-        return False
+        Args:
+            sanctions_db: New sanctions list (unchanged if None)
+            pep_db: New PEP list (unchanged if None)
+            
+        Returns:
+            New list snapshot version
+        """
+        if sanctions_db is not None:
+            self.sanctions_db = list(sanctions_db)
+        if pep_db is not None:
+            self.pep_db = list(pep_db)
+        
+        version = self._compute_list_version()
+        if version != self.list_version:
+            logger.info(f"List snapshot changed: {self.list_version} -> {version}")
+            self.list_version = version
+            self.false_positive_cache.ensure_version(version)
+        
+        return version
+    
+    def get_cache_metrics(self) -> Dict[str, Any]:
+        """Return screening result cache metrics"""
+        return self.false_positive_cache.get_metrics()
     
     def mark_false_positive(self, hit_id: str, reason: str, 
                            approved_by: str) -> bool:
@@ -804,6 +1054,10 @@ class AMLScreener:
         """
         Set up continuous monitoring for an individual
         
+        The individual is added to the customer blocking index, so later list
+        changes applied through apply_list_delta are reverse-matched against
+        them without re-screening the whole customer base.
+        
         Args:
             individual_id: Unique individual identifier
             individual_data: Individual information
@@ -814,11 +1068,14 @@ class AMLScreener:
         if not self.config["continuous_monitoring"]["enabled"]:
             return {"status": "disabled", "message": "Continuous monitoring is not enabled"}
         
-        # In production, this would register the individual for periodic re-screening
+        self.monitoring_index.add(individual_id, individual_data)
+        
         monitoring_config = {
             "individual_id": individual_id,
             "frequency_days": self.config["continuous_monitoring"]["frequency_days"],
             "alert_on_new_hits": self.config["continuous_monitoring"]["alert_on_new_hits"],
+            "reverse_matching": True,
+            "list_version": self.list_version,
             "last_screened": datetime.now().isoformat(),
             "next_screening": (
                 datetime.now() + 
@@ -826,16 +1083,105 @@ class AMLScreener:
             ).isoformat()
         }
         
-        logger.info(f"Continuous monitoring enabled for {individual_id}")
+        logger.debug(f"Continuous monitoring enabled for {individual_id}")
         
         return {
             "status": "active",
             "config": monitoring_config
         }
+    
+    def stop_monitoring(self, individual_id: str) -> bool:
+        """Remove an individual from continuous monitoring"""
+        return self.monitoring_index.remove(individual_id)
+    
+    def apply_list_delta(self, sanctions: Optional[List[SanctionedEntity]] = None,
+                         peps: Optional[List[PEPEntity]] = None) -> List[MonitoringAlert]:
+        """
+        Apply new or changed list entries and reverse-match them
+        
+        Entries replace any existing entry with the same entity_id. Only the
+        changed entries are scored, and only against customers returned by the
+        blocking index, so the work is proportional to the size of the delta
+        rather than the customer base.
+        
+        Args:
+            sanctions: Added or changed sanctioned entities
+            peps: Added or changed PEP entities
+            
+        Returns:
+            Alerts for monitored individuals matching the changed entries
+        """
+        sanctions = list(sanctions or [])
+        peps = list(peps or [])
+        
+        changed_ids = {e.entity_id for e in sanctions}
+        new_sanctions = [e for e in self.sanctions_db if e.entity_id not in changed_ids] + sanctions
+        changed_ids = {p.entity_id for p in peps}
+        new_peps = [p for p in self.pep_db if p.entity_id not in changed_ids] + peps
+        version = self.update_lists(sanctions_db=new_sanctions, pep_db=new_peps)
+        
+        alerts: List[MonitoringAlert] = []
+        for entity in sanctions:
+            names = [entity.primary_name] + list(entity.aliases)
+            alerts.extend(self._reverse_match(names, version, sanctions=[entity]))
+        for pep in peps:
+            alerts.extend(self._reverse_match([pep.name], version, peps=[pep]))
+        
+        # Keep one alert per individual and hit
+        unique: Dict[Tuple[str, str], MonitoringAlert] = {}
+        for alert in alerts:
+            unique.setdefault((alert.individual_id, alert.hit.hit_id), alert)
+        alerts = list(unique.values())
+        
+        if alerts and self.config["continuous_monitoring"]["alert_on_new_hits"]:
+            logger.warning(f"List delta produced {len(alerts)} monitoring alert(s)")
+        
+        return alerts
+    
+    def _reverse_match(self, list_names: List[str], version: str,
+                       sanctions: Optional[List[SanctionedEntity]] = None,
+                       peps: Optional[List[PEPEntity]] = None) -> List[MonitoringAlert]:
+        """Score a list entry against the candidates of any of its names, once each"""
+        alerts = []
+        candidates = set()
+        for list_name in list_names:
+            candidates |= self.monitoring_index.candidates(list_name)
+        
+        for individual_id in sorted(candidates):
+            individual_data = self.monitoring_index.get(individual_id)
+            name = individual_data.get("name", "")
+            
+            hits: List[ScreeningHit] = []
+            if sanctions:
+                hits.extend(self._screen_sanctions(
+                    name,
+                    individual_data.get("date_of_birth"),
+                    individual_data.get("nationality"),
+                    individual_data.get("id_numbers", {}),
+                    entities=sanctions
+                ))
+            if peps:
+                hits.extend(self._screen_pep(
+                    name, individual_data.get("nationality"), peps=peps
+                ))
+            
+            for hit in hits:
+                alerts.append(MonitoringAlert(
+                    alert_id=f"MON-{hashlib.md5(f'{individual_id}{hit.hit_id}{version}'.encode()).hexdigest()[:12]}",
+                    individual_id=individual_id,
+                    hit=hit,
+                    list_version=version,
+                    created_at=datetime.now()
+                ))
+        
+        return alerts
 
 # Export main components
 __all__ = [
     "AMLScreener",
+    "ScreeningResultCache",
+    "CustomerBlockingIndex",
+    "MonitoringAlert",
     "ScreeningResult",
     "ScreeningHit",
     "SanctionedEntity",
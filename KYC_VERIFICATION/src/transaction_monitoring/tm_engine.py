@@ -6,17 +6,21 @@ Part of KYC Bank-Grade Parity - Phase 6
 This module implements transaction monitoring rules for suspicious activity detection.
 """
 
+import bisect
 import logging
 import hashlib
 import json
+import multiprocessing
+import queue
 import time
-from typing import Dict, List, Optional, Any, Tuple
+import traceback
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from enum import Enum
 import math
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
 import numpy as np
 
 # Configure logging
@@ -26,6 +30,49 @@ logger = logging.getLogger(__name__)
 # Manila timezone
 MANILA_TZ = timezone(timedelta(hours=8))
 
+EARTH_RADIUS_KM = 6371
+# Half the Earth's circumference: no two points are further apart than this
+MAX_SURFACE_DISTANCE_KM = math.pi * EARTH_RADIUS_KM
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = 5) -> str:
+    """Encode coordinates as a geohash string of the given precision"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    
+    while len(chars) < precision:
+        rng, value = (lon_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    
+    return "".join(chars)
+
+
+def haversine_km(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Vectorized Haversine distance from one point to arrays of points"""
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    lat2, lon2 = np.radians(lats), np.radians(lons)
+    
+    a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
 
 class TransactionType(Enum):
     """Transaction types"""
@@ -105,6 +152,37 @@ class Transaction:
         if self.location:
             data['location'] = asdict(self.location)
         return json.dumps(data)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Transaction':
+        """Build a transaction from a flat record (e.g. a CSV/Parquet row)"""
+        timestamp = data['timestamp']
+        if not isinstance(timestamp, datetime):
+            timestamp = datetime.fromisoformat(str(timestamp))
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=MANILA_TZ)
+        
+        location = None
+        if data.get('latitude') not in (None, '') and data.get('longitude') not in (None, ''):
+            location = Location(
+                latitude=float(data['latitude']),
+                longitude=float(data['longitude']),
+                country=data.get('country') or '',
+                city=data.get('city') or '',
+                ip_address=data.get('ip_address') or None
+            )
+        
+        return cls(
+            transaction_id=str(data['transaction_id']),
+            customer_id=str(data['customer_id']),
+            timestamp=timestamp,
+            amount=float(data['amount']),
+            currency=data.get('currency') or 'PHP',
+            transaction_type=TransactionType(data['transaction_type']),
+            location=location,
+            merchant=data.get('merchant') or None,
+            reference=data.get('reference') or None
+        )
 
 
 @dataclass
@@ -246,14 +324,78 @@ class VelocityMonitor:
 
 
 class GeovelocityMonitor:
-    """Monitor impossible travel patterns"""
+    """Monitor impossible travel patterns
     
-    def __init__(self):
+    Per customer, locations are kept in a bounded time-ordered ring plus a
+    last-known-location summary per geohash cell (ordered by last visit).
+    Each check only compares against the most recent point and the distinct
+    cells visited within the feasible-speed horizon, so the cost does not
+    grow with the length of the location history.
+    """
+    
+    def __init__(self, geohash_precision: int = 5, max_history_points: int = 2048):
         """Initialize geovelocity monitor"""
         self.max_travel_speed_kmh = 1000  # Max reasonable speed (airplane)
-        self.location_history: Dict[str, List[Tuple[datetime, Location]]] = defaultdict(list)
+        self.rapid_movement_speed_kmh = 500
+        self.rapid_movement_window_hours = 2
+        self.history_days = 7
+        self.geohash_precision = geohash_precision
+        self.max_history_points = max_history_points
+        
+        # Beyond this gap no pair of points can breach either speed rule
+        self.feasible_horizon_hours = max(
+            MAX_SURFACE_DISTANCE_KM / self.max_travel_speed_kmh,
+            self.rapid_movement_window_hours
+        )
+        
+        self.location_history: Dict[str, Deque[Tuple[datetime, Location]]] = defaultdict(
+            lambda: deque(maxlen=self.max_history_points)
+        )
+        self.cell_summary: Dict[str, "OrderedDict[str, Tuple[datetime, Location]]"] = defaultdict(OrderedDict)
         logger.info("Geovelocity Monitor initialized")
     
+    def _candidate_points(self, customer_id: str,
+                          current_time: datetime) -> List[Tuple[datetime, Location]]:
+        """Most recent point plus last-known points of cells within the horizon"""
+        candidates: Dict[int, Tuple[datetime, Location]] = {}
+        
+        ring = self.location_history.get(customer_id)
+        if ring:
+            candidates[id(ring[-1])] = ring[-1]
+        
+        horizon = timedelta(hours=self.feasible_horizon_hours)
+        for entry in reversed(self.cell_summary[customer_id].values()):
+            if current_time - entry[0] > horizon:
+                break
+            candidates[id(entry)] = entry
+        
+        return sorted(candidates.values(), key=lambda e: e[0])
+    
+    def _record_location(self, customer_id: str, current_time: datetime,
+                         location: Location) -> None:
+        """Append to the ring, update the cell summary and expire old entries"""
+        entry = (current_time, location)
+        cutoff = current_time - timedelta(days=self.history_days)
+        
+        ring = self.location_history[customer_id]
+        ring.append(entry)
+        while ring and ring[0][0] < cutoff:
+            ring.popleft()
+        
+        cells = self.cell_summary[customer_id]
+        cell = encode_geohash(location.latitude, location.longitude, self.geohash_precision)
+        previous = cells.get(cell)
+        if previous is None or current_time >= previous[0]:
+            cells[cell] = entry
+            last_time = next(reversed(cells.values()))[0]
+            if current_time >= last_time:
+                cells.move_to_end(cell)
+        while cells:
+            oldest_cell, (oldest_time, _) = next(iter(cells.items()))
+            if oldest_time >= cutoff:
+                break
+            del cells[oldest_cell]
+    
     def check_geovelocity(self, transaction: Transaction) -> Optional[Alert]:
         """
         Check for impossible travel
@@ -271,53 +413,54 @@ class GeovelocityMonitor:
         current_location = transaction.location
         current_time = transaction.timestamp
         
-        # Get location history
-        history = self.location_history[customer_id]
-        
-        # Add current location
-        history.append((current_time, current_location))
-        
-        # Keep last 7 days
-        cutoff = current_time - timedelta(days=7)
-        self.location_history[customer_id] = [
-            (t, loc) for t, loc in history if t >= cutoff
-        ]
+        candidates = self._candidate_points(customer_id, current_time)
+        self._record_location(customer_id, current_time, current_location)
         
         # Check for impossible travel
         violations = []
-        suspicious_pairs = []
         
-        for prev_time, prev_location in history[:-1]:
-            time_diff_hours = (current_time - prev_time).total_seconds() / 3600
-            
-            if time_diff_hours <= 0:
-                continue
-            
-            distance_km = current_location.distance_to(prev_location)
-            required_speed_kmh = distance_km / time_diff_hours
-            
-            # Check if speed is impossible
-            if required_speed_kmh > self.max_travel_speed_kmh:
-                violations.append({
-                    "from": f"{prev_location.city}, {prev_location.country}",
-                    "to": f"{current_location.city}, {current_location.country}",
-                    "distance_km": round(distance_km, 2),
-                    "time_hours": round(time_diff_hours, 2),
-                    "required_speed_kmh": round(required_speed_kmh, 2),
-                    "timestamp_from": prev_time.isoformat(),
-                    "timestamp_to": current_time.isoformat()
-                })
-                suspicious_pairs.append((prev_time, current_time))
+        if candidates:
+            time_diff_hours = np.array([
+                (current_time - prev_time).total_seconds() / 3600 for prev_time, _ in candidates
+            ])
+            distances_km = haversine_km(
+                current_location.latitude, current_location.longitude,
+                np.array([loc.latitude for _, loc in candidates]),
+                np.array([loc.longitude for _, loc in candidates])
+            )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                speeds_kmh = np.where(time_diff_hours > 0, distances_km / time_diff_hours, 0.0)
             
-            # Check for rapid movement even if technically possible
-            elif required_speed_kmh > 500 and time_diff_hours < 2:
-                violations.append({
-                    "type": "rapid_movement",
-                    "from": f"{prev_location.city}, {prev_location.country}",
-                    "to": f"{current_location.city}, {current_location.country}",
-                    "distance_km": round(distance_km, 2),
-                    "time_hours": round(time_diff_hours, 2)
-                })
+            flagged = np.nonzero(
+                (time_diff_hours > 0) & (speeds_kmh > self.rapid_movement_speed_kmh)
+            )[0]
+            for i in flagged:
+                prev_time, prev_location = candidates[i]
+                distance_km = float(distances_km[i])
+                required_speed_kmh = float(speeds_kmh[i])
+                hours = float(time_diff_hours[i])
+                
+                # Check if speed is impossible
+                if required_speed_kmh > self.max_travel_speed_kmh:
+                    violations.append({
+                        "from": f"{prev_location.city}, {prev_location.country}",
+                        "to": f"{current_location.city}, {current_location.country}",
+                        "distance_km": round(distance_km, 2),
+                        "time_hours": round(hours, 2),
+                        "required_speed_kmh": round(required_speed_kmh, 2),
+                        "timestamp_from": prev_time.isoformat(),
+                        "timestamp_to": current_time.isoformat()
+                    })
+                
+                # Check for rapid movement even if technically possible
+                elif hours < self.rapid_movement_window_hours:
+                    violations.append({
+                        "type": "rapid_movement",
+                        "from": f"{prev_location.city}, {prev_location.country}",
+                        "to": f"{current_location.city}, {current_location.country}",
+                        "distance_km": round(distance_km, 2),
+                        "time_hours": round(hours, 2)
+                    })
         
         if violations:
             # Determine if it's impossible travel or just rapid movement
@@ -353,17 +496,157 @@ class GeovelocityMonitor:
         return None
 
 
+class StructuringWindow:
+    """Rolling per-customer aggregates of deposits/withdrawals in the window
+    
+    Counters are updated when a transaction enters and decayed when it
+    expires, so the structuring patterns can be evaluated without
+    re-filtering the customer's history.
+    """
+    
+    def __init__(self):
+        self.transactions: Deque[Transaction] = deque()
+        self._reset()
+    
+    def _reset(self) -> None:
+        self.amount_sum = 0.0
+        self.amount_sq_sum = 0.0
+        self.below_threshold_count = 0
+        self.round_amount_count = 0
+        self.interval_sum = 0.0
+        self.interval_sq_sum = 0.0
+    
+    def __len__(self) -> int:
+        return len(self.transactions)
+    
+    @property
+    def last_timestamp(self) -> Optional[datetime]:
+        return self.transactions[-1].timestamp if self.transactions else None
+    
+    def add(self, transaction: Transaction, is_below: bool, is_round: bool) -> None:
+        """Add a transaction that is not older than the newest one held"""
+        if self.transactions:
+            interval = (transaction.timestamp - self.transactions[-1].timestamp).total_seconds() / 60
+            self.interval_sum += interval
+            self.interval_sq_sum += interval ** 2
+        self.transactions.append(transaction)
+        self.amount_sum += transaction.amount
+        self.amount_sq_sum += transaction.amount ** 2
+        self.below_threshold_count += is_below
+        self.round_amount_count += is_round
+    
+    def expire(self, cutoff: datetime, is_below, is_round) -> None:
+        """Decay counters for transactions older than cutoff"""
+        while self.transactions and self.transactions[0].timestamp < cutoff:
+            oldest = self.transactions.popleft()
+            if not self.transactions:
+                self._reset()
+                break
+            interval = (self.transactions[0].timestamp - oldest.timestamp).total_seconds() / 60
+            self.interval_sum -= interval
+            self.interval_sq_sum -= interval ** 2
+            self.amount_sum -= oldest.amount
+            self.amount_sq_sum -= oldest.amount ** 2
+            self.below_threshold_count -= is_below(oldest.amount)
+            self.round_amount_count -= is_round(oldest.amount)
+
+
 class StructuringDetector:
     """Detect structuring/smurfing patterns"""
     
+    ROUND_AMOUNTS = [1000, 5000, 10000, 50000, 100000, 200000]
+    RELEVANT_TYPES = (TransactionType.DEPOSIT, TransactionType.WITHDRAWAL)
+    
     def __init__(self):
         """Initialize structuring detector"""
         self.reporting_threshold = 500000  # PHP reporting threshold
         self.structuring_threshold = 450000  # 90% of reporting threshold
         self.time_window_hours = 24
         self.min_transactions_for_pattern = 3
+        self.windows: Dict[str, StructuringWindow] = defaultdict(StructuringWindow)
         logger.info("Structuring Detector initialized")
     
+    def _is_below_threshold(self, amount: float) -> bool:
+        return self.structuring_threshold <= amount < self.reporting_threshold
+    
+    def _is_round_amount(self, amount: float) -> bool:
+        return any(abs(amount - ra) < 100 for ra in self.ROUND_AMOUNTS)
+    
+    def check_structuring(self, transaction: Transaction) -> Optional[Alert]:
+        """
+        Incrementally detect structuring for a transaction
+        
+        Equivalent to detect_structuring() over the customer's prior
+        transactions, but uses the rolling window counters so the no-alert
+        path is O(1) per transaction. The window is only materialized when a
+        pattern fires, to build the alert details.
+        
+        Args:
+            transaction: Current transaction
+            
+        Returns:
+            Alert if structuring suspected
+        """
+        window = self.windows[transaction.customer_id]
+        cutoff_time = transaction.timestamp - timedelta(hours=self.time_window_hours)
+        window.expire(cutoff_time, self._is_below_threshold, self._is_round_amount)
+        
+        if window.last_timestamp is not None and transaction.timestamp < window.last_timestamp:
+            # Out-of-order arrival: evaluate the slow way and rebuild the window in time order
+            prior = list(window.transactions)
+            alert = self.detect_structuring(transaction, prior)
+            if transaction.transaction_type in self.RELEVANT_TYPES:
+                prior.append(transaction)
+            rebuilt = StructuringWindow()
+            for t in sorted(prior, key=lambda t: t.timestamp):
+                rebuilt.add(t, self._is_below_threshold(t.amount), self._is_round_amount(t.amount))
+            self.windows[transaction.customer_id] = rebuilt
+            return alert
+        
+        is_below = self._is_below_threshold(transaction.amount)
+        is_round = self._is_round_amount(transaction.amount)
+        
+        alert = None
+        if self._window_has_pattern(window, transaction, is_below, is_round):
+            alert = self._evaluate_patterns(transaction, list(window.transactions) + [transaction])
+        
+        if transaction.transaction_type in self.RELEVANT_TYPES:
+            window.add(transaction, is_below, is_round)
+        
+        return alert
+    
+    def _window_has_pattern(self, window: StructuringWindow, transaction: Transaction,
+                            is_below: bool, is_round: bool) -> bool:
+        """O(1) check whether any structuring pattern fires for window + transaction"""
+        count = len(window) + 1
+        if count < self.min_transactions_for_pattern:
+            return False
+        
+        # Pattern 1 and 2: below-threshold and round amounts
+        if window.below_threshold_count + is_below >= self.min_transactions_for_pattern:
+            return True
+        if window.round_amount_count + is_round >= self.min_transactions_for_pattern:
+            return True
+        
+        # Pattern 3: similar amounts
+        amount_mean = (window.amount_sum + transaction.amount) / count
+        amount_variance = max(
+            0.0, (window.amount_sq_sum + transaction.amount ** 2) / count - amount_mean ** 2
+        )
+        if amount_mean != 0 and amount_variance / (amount_mean ** 2) < 0.1:
+            return True
+        
+        # Pattern 4: regular intervals
+        if count >= 4:
+            interval = (transaction.timestamp - window.last_timestamp).total_seconds() / 60
+            intervals = count - 1
+            interval_mean = (window.interval_sum + interval) / intervals
+            interval_variance = (window.interval_sq_sum + interval ** 2) / intervals - interval_mean ** 2
+            if interval_variance < 100:
+                return True
+        
+        return False
+    
     def detect_structuring(self, transaction: Transaction,
                           recent_transactions: List[Transaction]) -> Optional[Alert]:
         """
@@ -381,10 +664,15 @@ class StructuringDetector:
         relevant_txns = [
             t for t in recent_transactions 
             if t.timestamp >= cutoff_time and 
-            t.transaction_type in [TransactionType.DEPOSIT, TransactionType.WITHDRAWAL]
+            t.transaction_type in self.RELEVANT_TYPES
         ]
         relevant_txns.append(transaction)
         
+        return self._evaluate_patterns(transaction, relevant_txns)
+    
+    def _evaluate_patterns(self, transaction: Transaction,
+                           relevant_txns: List[Transaction]) -> Optional[Alert]:
+        """Evaluate structuring patterns over the in-window transactions"""
         if len(relevant_txns) < self.min_transactions_for_pattern:
             return None
         
@@ -393,7 +681,7 @@ class StructuringDetector:
         # Pattern 1: Multiple transactions just below reporting threshold
         below_threshold_txns = [
             t for t in relevant_txns
-            if self.structuring_threshold <= t.amount < self.reporting_threshold
+            if self._is_below_threshold(t.amount)
         ]
         
         if len(below_threshold_txns) >= self.min_transactions_for_pattern:
@@ -405,10 +693,9 @@ class StructuringDetector:
             })
         
         # Pattern 2: Round amounts pattern
-        round_amounts = [1000, 5000, 10000, 50000, 100000, 200000]
         round_txns = [
             t for t in relevant_txns
-            if any(abs(t.amount - ra) < 100 for ra in round_amounts)
+            if self._is_round_amount(t.amount)
         ]
         
         if len(round_txns) >= self.min_transactions_for_pattern:
@@ -478,6 +765,84 @@ class StructuringDetector:
         return None
 
 
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (bounded memory, mergeable across workers)"""
+    
+    DEFAULT_BUCKETS_MS = [
+        0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000
+    ]
+    
+    def __init__(self, buckets_ms: Optional[List[float]] = None):
+        self.bounds = sorted(buckets_ms or self.DEFAULT_BUCKETS_MS)
+        self.counts = [0] * (len(self.bounds) + 1)  # last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+    
+    def observe(self, value_ms: float) -> None:
+        """Record one observation"""
+        self.counts[bisect.bisect_left(self.bounds, value_ms)] += 1
+        self.count += 1
+        self.sum += value_ms
+        self.max = max(self.max, value_ms)
+    
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add another histogram's observations (same bucket layout)"""
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+    
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+    
+    def percentile(self, q: float) -> float:
+        """Upper bucket bound containing the q-th percentile (0-100)"""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "buckets_ms": self.bounds,
+            "counts": list(self.counts),
+            "count": self.count,
+            "sum_ms": round(self.sum, 3),
+            "max_ms": round(self.max, 3)
+        }
+
+
+def _replay_worker(inbox, outbox) -> None:
+    """
+    Worker process loop: run one engine over this worker's customer partition
+    
+    Each batch is answered with ("ok", alerts, processed, histogram) or, if
+    processing raised, ("error", traceback) before the worker exits.
+    """
+    logging.getLogger(__name__).setLevel(logging.WARNING)
+    try:
+        engine = TransactionMonitoringEngine()
+        while True:
+            batch = inbox.get()
+            if batch is None:
+                break
+            engine.latency_histogram = LatencyHistogram()
+            alerts = []
+            for transaction in batch:
+                alerts.extend(engine.process_transaction(transaction, store_alerts=False))
+            outbox.put(("ok", alerts, len(batch), engine.latency_histogram))
+    except Exception:
+        outbox.put(("error", traceback.format_exc()))
+
+
 class TransactionMonitoringEngine:
     """Main transaction monitoring engine"""
     
@@ -495,23 +860,26 @@ class TransactionMonitoringEngine:
         self.metrics = {
             "transactions_processed": 0,
             "alerts_generated": 0,
-            "alerts_by_type": defaultdict(int),
-            "processing_times": []
+            "alerts_by_type": defaultdict(int)
         }
+        self.latency_histogram = LatencyHistogram()
         
         logger.info("Transaction Monitoring Engine initialized")
     
-    def process_transaction(self, transaction: Transaction) -> List[Alert]:
+    def process_transaction(self, transaction: Transaction,
+                            store_alerts: bool = True) -> List[Alert]:
         """
         Process transaction through all monitoring rules
         
         Args:
             transaction: Transaction to monitor
+            store_alerts: Keep the alerts in alerts/alert_history (counters
+                are always updated)
             
         Returns:
             List of generated alerts
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         alerts = []
         
         # Run velocity checks
@@ -525,25 +893,16 @@ class TransactionMonitoringEngine:
             alerts.append(geo_alert)
         
         # Run structuring detection
-        customer_history = self.velocity_monitor.transaction_history.get(
-            transaction.customer_id, []
-        )
-        struct_alert = self.structuring_detector.detect_structuring(
-            transaction, customer_history
-        )
+        struct_alert = self.structuring_detector.check_structuring(transaction)
         if struct_alert:
             alerts.append(struct_alert)
         
         # Store alerts
-        for alert in alerts:
-            self.alerts.append(alert)
-            self.alert_history[transaction.customer_id].append(alert)
-            self.metrics["alerts_by_type"][alert.alert_type.value] += 1
+        self._record_alerts(alerts, store_alerts)
         
         # Update metrics
         self.metrics["transactions_processed"] += 1
-        self.metrics["alerts_generated"] += len(alerts)
-        self.metrics["processing_times"].append((time.time() - start_time) * 1000)
+        self.latency_histogram.observe((time.perf_counter() - start_time) * 1000)
         
         # Log if alerts generated
         if alerts:
@@ -553,6 +912,120 @@ class TransactionMonitoringEngine:
         
         return alerts
     
+    def _record_alerts(self, alerts: List[Alert], store: bool = True) -> None:
+        """Update alert counters and, if store, keep the alerts"""
+        for alert in alerts:
+            if store:
+                self.alerts.append(alert)
+                self.alert_history[alert.customer_id].append(alert)
+            self.metrics["alerts_by_type"][alert.alert_type.value] += 1
+        self.metrics["alerts_generated"] += len(alerts)
+    
+    def process_batch(self, transactions: Iterable[Transaction],
+                      workers: int = 1) -> List[Alert]:
+        """
+        Process a batch of transactions in timestamp order
+        
+        Args:
+            transactions: Transactions to process (any order)
+            workers: Number of worker processes (customers are partitioned
+                across workers; each customer's order is preserved)
+            
+        Returns:
+            List of generated alerts
+        """
+        ordered = sorted(transactions, key=lambda t: t.timestamp)
+        return list(self.replay(ordered, workers=workers, chunk_size=max(1, len(ordered)),
+                                store_alerts=True))
+    
+    def replay(self, transactions: Iterable[Transaction], workers: int = 1,
+               chunk_size: int = 10000, store_alerts: bool = False) -> Iterator[Alert]:
+        """
+        Replay a transaction stream and yield alerts as they are produced
+        
+        The stream is read in chunks of chunk_size; each chunk is sorted by
+        timestamp, so the input only needs to be ordered across chunks (as
+        with daily export files). With workers > 1, each chunk is partitioned
+        by customer across worker processes that keep their own rule state
+        for the duration of the replay; alerts and latency metrics are
+        merged back into this engine. Streamed alerts are only counted, not
+        kept in alerts/alert_history, so memory stays flat over long
+        replays. A failing worker stops the replay and its error is raised
+        here.
+        
+        Args:
+            transactions: Transaction iterable
+            workers: Number of worker processes
+            chunk_size: Transactions per sorted chunk
+            store_alerts: Also keep every alert on this engine
+            
+        Yields:
+            Alerts in chunk order
+        """
+        if workers <= 1:
+            for chunk in _chunked(transactions, chunk_size):
+                chunk.sort(key=lambda t: t.timestamp)
+                for transaction in chunk:
+                    yield from self.process_transaction(transaction, store_alerts)
+            return
+        
+        ctx = multiprocessing.get_context()
+        outbox = ctx.Queue()
+        inboxes = [ctx.Queue() for _ in range(workers)]
+        procs = [ctx.Process(target=_replay_worker, args=(inbox, outbox), daemon=True)
+                 for inbox in inboxes]
+        for proc in procs:
+            proc.start()
+        
+        failed = False
+        try:
+            for chunk in _chunked(transactions, chunk_size):
+                chunk.sort(key=lambda t: t.timestamp)
+                partitions: List[List[Transaction]] = [[] for _ in range(workers)]
+                for transaction in chunk:
+                    partitions[_partition_for(transaction.customer_id, workers)].append(transaction)
+                
+                for inbox, partition in zip(inboxes, partitions):
+                    inbox.put(partition)
+                for _ in range(workers):
+                    alerts, processed, histogram = self._next_worker_result(outbox, procs)
+                    self._record_alerts(alerts, store_alerts)
+                    self.metrics["transactions_processed"] += processed
+                    self.latency_histogram.merge(histogram)
+                    yield from alerts
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            for inbox in inboxes:
+                inbox.put(None)
+            for proc in procs:
+                if failed:
+                    proc.terminate()
+                proc.join(timeout=5)
+                if proc.is_alive():
+                    proc.terminate()
+    
+    @staticmethod
+    def _next_worker_result(outbox, procs, poll_seconds: float = 1.0):
+        """Next batch result from the workers; raises if a worker failed or died"""
+        while True:
+            try:
+                message = outbox.get(timeout=poll_seconds)
+            except queue.Empty:
+                dead = [proc for proc in procs if not proc.is_alive()]
+                if not dead:
+                    continue
+                # A worker that raised has already queued its traceback
+                try:
+                    message = outbox.get(timeout=poll_seconds)
+                except queue.Empty:
+                    raise RuntimeError(
+                        f"Replay worker exited unexpectedly (exit code {dead[0].exitcode})") from None
+            if message[0] == "error":
+                raise RuntimeError(f"Replay worker failed:\n{message[1]}")
+            return message[1:]
+    
     def get_customer_risk_profile(self, customer_id: str) -> Dict[str, Any]:
         """
         Get risk profile for customer
@@ -605,14 +1078,14 @@ class TransactionMonitoringEngine:
     
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get monitoring metrics summary"""
-        avg_processing_time = np.mean(self.metrics["processing_times"]) if self.metrics["processing_times"] else 0
-        
         return {
             "transactions_processed": self.metrics["transactions_processed"],
             "alerts_generated": self.metrics["alerts_generated"],
             "alert_rate": self.metrics["alerts_generated"] / max(1, self.metrics["transactions_processed"]),
             "alerts_by_type": dict(self.metrics["alerts_by_type"]),
-            "avg_processing_time_ms": round(avg_processing_time, 2),
+            "avg_processing_time_ms": round(self.latency_histogram.mean, 2),
+            "p95_processing_time_ms": self.latency_histogram.percentile(95),
+            "p99_processing_time_ms": self.latency_histogram.percentile(99),
             "active_alerts": len([a for a in self.alerts if a.requires_review])
         }
     
@@ -621,6 +1094,23 @@ class TransactionMonitoringEngine:
         return [alert.to_case_format() for alert in self.alerts if alert.requires_review]
 
 
+def _chunked(items: Iterable[Transaction], size: int) -> Iterator[List[Transaction]]:
+    """Yield lists of at most size items"""
+    chunk: List[Transaction] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _partition_for(customer_id: str, partitions: int) -> int:
+    """Stable customer -> partition assignment (independent of PYTHONHASHSEED)"""
+    return int(hashlib.md5(customer_id.encode()).hexdigest()[:8], 16) % partitions
+
+
 def generate_test_transactions() -> List[Transaction]:
     """Generate test transactions for demo"""
     transactions = []
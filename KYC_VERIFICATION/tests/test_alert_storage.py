@@ -0,0 +1,109 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.monitoring.transaction_monitor import (  # noqa: E402
+    MANILA_TZ,
+    Alert,
+    AlertSeverity,
+    AlertStorage,
+    AlertType,
+)
+
+BASE_TIME = datetime(2025, 8, 14, 9, 0, tzinfo=MANILA_TZ)
+
+
+def make_alert(i, customer_id="CUST001", minutes=0, severity=AlertSeverity.MEDIUM):
+    return Alert(
+        alert_id=f"A{i:06d}",
+        alert_type=AlertType.VELOCITY,
+        severity=severity,
+        customer_id=customer_id,
+        transaction_ids=[f"TX{i}"],
+        score=0.5,
+        reason="Transaction velocity exceeded threshold",
+        details={"hourly_count": i},
+        created_at=(BASE_TIME + timedelta(minutes=minutes)).isoformat(),
+        requires_review=severity != AlertSeverity.MEDIUM,
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    store = AlertStorage(tmp_path)
+    yield store
+    store.close()
+
+
+def test_round_trip_and_customer_lookup(storage):
+    assert storage.store_alert(make_alert(1, minutes=0))
+    assert storage.store_alerts([make_alert(2, minutes=5), make_alert(3, "CUST002", minutes=1)]) == 2
+
+    assert storage.get_alert("A000001") == make_alert(1, minutes=0)
+    assert [a.alert_id for a in storage.get_customer_alerts("CUST001")] == ["A000002", "A000001"]
+    assert storage.count_alerts() == 3
+
+
+def test_paginated_query_by_status_and_time_range(storage):
+    storage.store_alerts([make_alert(i, minutes=i) for i in range(25)])
+    storage.update_status("A000003", "closed")
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = storage.query_alerts(customer_id="CUST001", status="open", limit=10, cursor=cursor)
+        seen.extend(a.alert_id for a in page)
+        if cursor is None:
+            break
+    assert len(seen) == 24
+    assert "A000003" not in seen
+    assert seen == sorted(seen, reverse=True)
+
+    window, _ = storage.query_alerts(start=BASE_TIME + timedelta(minutes=10),
+                                     end=BASE_TIME + timedelta(minutes=15))
+    assert [a.alert_id for a in window] == [f"A{i:06d}" for i in range(14, 9, -1)]
+    assert storage.query_alerts(status="closed")[0][0].status == "closed"
+
+
+def test_migrates_legacy_per_file_alerts(storage, tmp_path):
+    legacy_dir = tmp_path / "legacy"
+    legacy_dir.mkdir()
+    for i in range(7):
+        alert = make_alert(i, "CUST009", minutes=i, severity=AlertSeverity.HIGH)
+        payload = alert.to_json().replace(', "status": "open"', "")  # pre-status format
+        (legacy_dir / f"{alert.alert_id}.json").write_text(payload)
+    (legacy_dir / "broken.json").write_text("{not json")
+
+    result = storage.migrate_json_files(legacy_dir, batch_size=3, delete_migrated=True)
+
+    assert result == {"migrated": 7, "failed": 1}
+    assert [p.name for p in legacy_dir.iterdir()] == ["broken.json"]
+    assert len(storage.get_customer_alerts("CUST009")) == 7
+    assert storage.count_by("severity") == {"high": 7}
+    assert storage.customers_with_severity(["high", "critical"]) == ["CUST009"]
+
+
+def test_failed_batch_is_rolled_back(storage, monkeypatch):
+    to_row = AlertStorage._to_row
+
+    def failing_row(alert):
+        row = to_row(alert)
+        return row[:-1] + (object(),) if alert.alert_id == "A000002" else row
+    monkeypatch.setattr(storage, "_to_row", failing_row)
+
+    assert storage.store_alerts([make_alert(1), make_alert(2)]) == 0
+    monkeypatch.undo()
+    # A later successful batch must not commit the first row of the failed one
+    assert storage.store_alerts([make_alert(3)]) == 1
+    assert storage.get_alert("A000001") is None
+    assert storage.count_alerts() == 1
@@ -0,0 +1,160 @@
+import os
+import random
+import sys
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from screening.aml_screener import (  # noqa: E402
+    AMLScreener,
+    PEPEntity,
+    RiskLevel,
+    SanctionedEntity,
+)
+
+
+def make_entity(entity_id, name, aliases=None, dob=None):
+    return SanctionedEntity(
+        entity_id=entity_id,
+        primary_name=name,
+        aliases=aliases or [],
+        date_of_birth=dob,
+        nationality="PH",
+        addresses=[],
+        identifiers={},
+        sanction_programs=["SDN"],
+        listing_date="2025-01-01",
+        source="OFAC",
+    )
+
+
+def make_monitored_screener():
+    screener = AMLScreener()
+    customers = {
+        "C1": {"name": "Ramon Reyes Jr", "date_of_birth": "1980-02-02", "nationality": "PH"},
+        "C2": {"name": "Ramon Reyes", "nationality": "PH"},
+        "C3": {"name": "Liza Soberano"},
+        "C4": {"name": "Teodoro Aquino"},
+    }
+    for customer_id, data in customers.items():
+        assert screener.monitor_continuous(customer_id, data)["status"] == "active"
+    return screener
+
+
+def test_blocking_index_only_returns_token_sharing_customers():
+    screener = make_monitored_screener()
+    candidates = screener.monitoring_index.candidates("Ramon Reyes")
+    assert candidates == {"C1", "C2"}
+    assert screener.monitoring_index.candidates("Unrelated Person") == set()
+    # A single shared token is not enough for a multi-token name
+    assert screener.monitoring_index.candidates("Ramon Soberano") == set()
+
+
+def test_list_delta_screens_each_customer_once_per_entity(monkeypatch):
+    screener = make_monitored_screener()
+    screened = []
+    original = screener._screen_sanctions
+    monkeypatch.setattr(screener, "_screen_sanctions",
+                        lambda name, *args, **kwargs: screened.append(name) or original(name, *args, **kwargs))
+
+    entity = make_entity("OFAC-101", "Ramon Reyes", aliases=["Ramon Reyes Jr", "Reyes Ramon"])
+    alerts = screener.apply_list_delta(sanctions=[entity])
+
+    assert sorted(screened) == ["Ramon Reyes", "Ramon Reyes Jr"]
+    assert sorted(a.individual_id for a in alerts) == ["C1", "C2"]
+
+
+def test_list_delta_alerts_only_matching_customers():
+    screener = make_monitored_screener()
+    alerts = screener.apply_list_delta(sanctions=[make_entity("OFAC-100", "Ramon Reyes")])
+
+    assert {a.individual_id for a in alerts} == {"C1", "C2"}
+    assert all(a.hit.metadata["entity_id"] == "OFAC-100" for a in alerts)
+    assert all(a.list_version == screener.list_version for a in alerts)
+    assert any(e.entity_id == "OFAC-100" for e in screener.sanctions_db)
+
+
+def test_reverse_match_agrees_with_forward_screening():
+    screener = make_monitored_screener()
+    entity = make_entity("OFAC-101", "Liza Soberano", aliases=["Hope Soberano"])
+    alerts = screener.apply_list_delta(sanctions=[entity])
+
+    forward = screener._screen_sanctions("Liza Soberano", None, None, {}, entities=[entity])
+    assert [a.hit.hit_id for a in alerts if a.individual_id == "C3"] == [h.hit_id for h in forward]
+
+
+def test_changed_entry_replaces_existing_and_invalidates_cache():
+    screener = make_monitored_screener()
+    screener.apply_list_delta(sanctions=[make_entity("OFAC-102", "Someone Else")])
+    version = screener.list_version
+
+    alerts = screener.apply_list_delta(sanctions=[make_entity("OFAC-102", "Teodoro Aquino")])
+    assert [a.individual_id for a in alerts] == ["C4"]
+    assert screener.list_version != version
+    assert [e.primary_name for e in screener.sanctions_db if e.entity_id == "OFAC-102"] == ["Teodoro Aquino"]
+
+
+def test_pep_delta_and_stop_monitoring():
+    screener = make_monitored_screener()
+    assert screener.stop_monitoring("C2")
+    pep = PEPEntity(
+        entity_id="PEP-100",
+        name="Ramon Reyes",
+        position="Mayor",
+        country="PH",
+        risk_level=RiskLevel.MEDIUM,
+        start_date="2022-07-01",
+        end_date=None,
+        is_current=True,
+        relationships=[],
+    )
+    alerts = screener.apply_list_delta(peps=[pep])
+    assert {a.individual_id for a in alerts} == {"C1"}
+
+
+def spelling_variant(rng, name):
+    """Name with one random character substituted, inserted, deleted or doubled"""
+    chars = list(name)
+    i = rng.randrange(len(chars))
+    if chars[i] == " ":
+        return name
+    op = rng.randrange(4)
+    if op == 0:
+        chars[i] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    elif op == 1:
+        chars.insert(i, rng.choice("abcdefghijklmnopqrstuvwxyz"))
+    elif op == 2:
+        del chars[i]
+    else:
+        chars.insert(i, chars[i])
+    return "".join(chars)
+
+
+def test_reverse_match_recalls_every_forward_hit_on_variant_spellings():
+    listed = ["John Smith", "Mohamed Al-Rashid", "Kristine Dela Cruz", "Vladimir Petrovich Ivanov",
+              "Nguyen Van Thanh", "Abdullah Yusuf", "Maria Clara Santos", "Ahmad Khalil"]
+    variants = ["Jon Smith", "Jhon Smyth", "Smith John", "Mohammed Al Rashid", "Muhammad Rashid",
+                "Christine Dela Cruz", "Kristina Delacruz", "Wladimir Ivanov", "Nguyen Thanh",
+                "Abdulla Yousef", "Mariaclara Santos", "Ahmed Khaleel"]
+    rng = random.Random(7)
+    variants += [spelling_variant(rng, name) for name in listed for _ in range(20)]
+
+    screener = AMLScreener()
+    for i, name in enumerate(variants):
+        screener.monitor_continuous(f"V{i}", {"name": name})
+
+    for j, name in enumerate(listed):
+        entity = make_entity(f"OFAC-2{j:02d}", name)
+        forward = {f"V{i}" for i, variant in enumerate(variants)
+                   if screener._screen_sanctions(variant, None, None, {}, entities=[entity])}
+        reverse = {a.individual_id for a in screener.apply_list_delta(sanctions=[entity])}
+        assert forward and forward <= reverse, name
+        # Blocking returns this entry's 20 random spellings and at most three
+        # curated ones, never the variants of the other listed names
+        assert len(screener.monitoring_index.candidates(name)) <= 20 + 3
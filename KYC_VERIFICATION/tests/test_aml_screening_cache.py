@@ -0,0 +1,151 @@
+import logging
+import os
+import sys
+
+import pytest
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from screening.aml_screener import (  # noqa: E402
+    AMLScreener,
+    ScreeningResultCache,
+    SanctionedEntity,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process (Linux /proc, psutil fallback)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        psutil = pytest.importorskip("psutil")
+        return psutil.Process().memory_info().rss
+
+
+def make_screener() -> AMLScreener:
+    screener = AMLScreener()
+    screener.config["screening_vendors"]["use_multiple"] = False
+    return screener
+
+
+def test_cache_evicts_lru_when_full():
+    cache = ScreeningResultCache(max_entries=2, ttl_seconds=60, clock=FakeClock())
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" becomes least recently used
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    metrics = cache.get_metrics()
+    assert metrics["evictions"] == 1
+    assert metrics["size"] == 2
+
+
+def test_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = ScreeningResultCache(max_entries=10, ttl_seconds=5, clock=clock)
+    cache.put("a", 1)
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+
+    # Stale heads are reclaimed on insert even if never looked up again
+    cache.put("b", 2)
+    clock.now = 20.0
+    cache.put("c", 3)
+    assert len(cache) == 1
+
+    metrics = cache.get_metrics()
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 1
+    assert metrics["expirations"] == 2
+
+
+def test_cache_invalidated_on_list_version_change():
+    cache = ScreeningResultCache(max_entries=10, ttl_seconds=60)
+    cache.ensure_version("v1")
+    cache.put("a", 1)
+    cache.ensure_version("v1")
+    assert cache.get("a") == 1
+
+    cache.ensure_version("v2")
+    assert cache.get("a") is None
+    assert cache.get_metrics()["invalidations"] == 1
+
+
+def test_screener_serves_cached_result_until_lists_change():
+    screener = make_screener()
+    subject = {"name": "Pedro Penduko", "date_of_birth": "1990-05-05", "nationality": "PH"}
+
+    first = screener.screen_individual(subject)
+    assert first.auto_clearable
+    assert screener.screen_individual(subject) is first
+    assert screener.get_cache_metrics()["hits"] == 1
+
+    old_version = screener.list_version
+    new_version = screener.update_lists(sanctions_db=screener.sanctions_db + [
+        SanctionedEntity(
+            entity_id="OFAC-002",
+            primary_name="Pedro Penduko",
+            aliases=[],
+            date_of_birth="1990-05-05",
+            nationality="PH",
+            addresses=[],
+            identifiers={},
+            sanction_programs=["SDN"],
+            listing_date="2024-01-01",
+            source="OFAC",
+        )
+    ])
+    assert new_version != old_version
+
+    rescreened = screener.screen_individual(subject)
+    assert rescreened is not first
+    assert rescreened.sanctions_hits
+    assert screener.get_cache_metrics()["size"] == 0
+
+
+@pytest.mark.skipif(
+    os.environ.get("KYC_RUN_SOAK") != "1",
+    reason="soak test; set KYC_RUN_SOAK=1 to run",
+)
+def test_soak_rss_stays_flat_over_distinct_names():
+    total = int(os.environ.get("AML_SOAK_NAMES", "1000000"))
+    max_entries = 10_000
+    screener = make_screener()
+    screener.false_positive_cache = ScreeningResultCache(max_entries=max_entries)
+    screener.false_positive_cache.ensure_version(screener.list_version)
+    logging.getLogger(AMLScreener.__module__).setLevel(logging.WARNING)
+
+    warmup = max_entries * 5
+    for i in range(warmup):
+        screener.screen_individual({"name": f"Warmup Subject {i}"})
+    baseline_rss = current_rss_bytes()
+
+    for i in range(total):
+        screener.screen_individual({"name": f"Soak Subject {i}"})
+
+    growth = current_rss_bytes() - baseline_rss
+    metrics = screener.get_cache_metrics()
+    assert metrics["size"] <= max_entries
+    assert metrics["evictions"] >= total
+    assert growth < 32 * 1024 * 1024, f"RSS grew by {growth / 1e6:.1f} MB"
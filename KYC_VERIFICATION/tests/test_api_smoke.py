@@ -132,6 +132,16 @@ def client():
     return TestClient(app)
 
 
+def test_startup_warms_up_risk_models(monkeypatch):
+    from src.risk.risk_engine import RiskEngine
+
+    warmed = []
+    monkeypatch.setattr(RiskEngine, "warm_up", lambda self: warmed.append(self) or {})
+
+    with TestClient(app):
+        assert len(warmed) == 1
+
+
 def test_root_health_ready(client, monkeypatch):
     install_component_stubs(monkeypatch)
 
@@ -0,0 +1,255 @@
+import os
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.forensics.authenticity_verifier import (  # noqa: E402
+    AuthenticityVerifier,
+    ForensicFinding,
+    SecurityFeature,
+    TamperType,
+)
+
+
+def textured_scene(height=480, width=640, seed=5):
+    """Smooth random texture, like paper grain or a background pattern"""
+    noise = np.random.default_rng(seed).normal(size=(height, width)).astype(np.float32)
+    texture = cv2.GaussianBlur(noise, (0, 0), 2.0)
+    texture = cv2.normalize(texture, None, 20, 235, cv2.NORM_MINMAX).astype(np.uint8)
+    return cv2.merge([texture, texture, texture])
+
+
+def clone(image, source, target, size):
+    tampered = image.copy()
+    (sy, sx), (ty, tx) = source, target
+    tampered[ty:ty + size, tx:tx + size] = image[sy:sy + size, sx:sx + size]
+    return tampered
+
+
+@pytest.fixture
+def verifier():
+    return AuthenticityVerifier()
+
+
+def test_detects_cloned_region(verifier):
+    tampered = clone(textured_scene(), (60, 80), (260, 400), 72)
+
+    findings = verifier.detect_copy_move(tampered)
+
+    assert len(findings) == 1
+    finding = findings[0]
+    assert finding.tamper_type == TamperType.COPY_MOVE
+    assert finding.severity == "critical"
+    assert finding.evidence["shift"] == (200, 320)
+    # Blocks straddling the border still correlate, so edges may be a few px off
+    assert np.allclose(finding.location, (80, 60, 72, 72), atol=6)
+    sy, sx = finding.evidence["source"]
+    ty, tx = finding.evidence["target"]
+    assert (ty - sy, tx - sx) == (200, 320)
+    assert finding.evidence["matched_blocks"] >= (72 - 15) ** 2
+
+
+def test_detects_clone_after_resize_and_recompression(verifier):
+    tampered = clone(textured_scene(), (300, 40), (90, 420), 96)
+    large = cv2.resize(tampered, (1600, 1200), interpolation=cv2.INTER_CUBIC)
+    _, encoded = cv2.imencode(".jpg", large, [cv2.IMWRITE_JPEG_QUALITY, 90])
+
+    findings = verifier.detect_copy_move(cv2.imdecode(encoded, cv2.IMREAD_COLOR))
+
+    assert len(findings) == 1
+    dy, dx = findings[0].evidence["shift"]
+    assert abs(dy - 525) <= 3 and abs(dx + 950) <= 3
+    x, y, w, h = findings[0].location
+    assert abs(x - 1050) <= 10 and abs(y - 225) <= 10
+
+
+def test_untouched_and_repetitive_images_are_clean(verifier):
+    assert verifier.detect_copy_move(textured_scene()) == []
+    assert verifier.detect_copy_move(np.full((300, 400, 3), 200, np.uint8)) == []
+
+    # A tiled pattern repeats at many offsets; that is structure, not a clone
+    tile = textured_scene(48, 48, seed=9)
+    assert verifier.detect_copy_move(np.tile(tile, (8, 10, 1))) == []
+
+
+def test_tiny_image_is_skipped(verifier):
+    assert verifier.detect_copy_move(np.zeros((10, 10, 3), np.uint8)) == []
+
+
+def test_sorted_neighbours_find_identical_blocks():
+    rng = np.random.default_rng(0)
+    features = rng.normal(scale=200, size=(10, 500)).astype(np.float32)
+    features[:, 400] = features[:, 17]
+    features[:, 401] = features[:, 250] + 5
+
+    first, second = AuthenticityVerifier._sorted_neighbour_pairs(features, 32.0, 32.0, 4)
+
+    pairs = {tuple(sorted(pair)) for pair in zip(first.tolist(), second.tolist())}
+    assert pairs == {(17, 400), (250, 401)}
+
+
+def stub_checks(verifier, deductions, security_passed=True):
+    """Replace every check with a stub returning one finding of the given weight"""
+    calls = []
+
+    def finding(weight):
+        return ForensicFinding(TamperType.DIGITAL_EDIT, weight / 0.3, None, "critical", "stub", {})
+
+    def check(name, with_heatmap):
+        def run(image, *args):
+            calls.append(name)
+            found = [finding(deductions[name])] if deductions.get(name) else []
+            return (found, None) if with_heatmap else found
+        return run
+
+    verifier.error_level_analysis = check("ela", True)
+    verifier.noise_analysis = check("noise", True)
+    verifier.texture_analysis = check("texture", True)
+    verifier.detect_resampling = check("resampling", False)
+    verifier.detect_copy_move = check("copy_move", False)
+    verifier.check_font_consistency = check("font", False)
+
+    def security(image, document_type):
+        calls.append("security_features")
+        return [SecurityFeature("hologram", security_passed, 0.8, None, security_passed)]
+    verifier.verify_security_features = security
+    return calls
+
+
+def test_settled_decision_skips_expensive_checks(verifier):
+    calls = stub_checks(verifier, {"ela": 0.3, "noise": 0.2})
+    image = np.zeros((64, 64, 3), np.uint8)
+
+    result = verifier.verify_authenticity(image)
+
+    assert result.is_authentic is False
+    assert result.metadata["checks_skipped"] == ["texture", "copy_move"]
+    assert result.metadata["early_exit"] is True
+    assert "texture" not in calls and "copy_move" not in calls
+    assert verifier.verify_authenticity(image, exhaustive=True).is_authentic is False
+    verifier.close()
+
+
+def test_borderline_document_runs_every_tier(verifier):
+    calls = stub_checks(verifier, {"ela": 0.25, "texture": 0.1})
+
+    result = verifier.verify_authenticity(np.zeros((64, 64, 3), np.uint8))
+
+    # 1.2 - 0.25 is within reach of texture + copy-move, then texture takes it below the threshold
+    assert result.is_authentic is False
+    assert "texture" in calls
+    assert result.metadata["checks_skipped"] == ["copy_move"]
+    assert [f.evidence for f in result.findings] == [{}, {}]
+    verifier.close()
+
+
+def test_clean_document_still_runs_copy_move(verifier):
+    calls = stub_checks(verifier, {})
+
+    result = verifier.verify_authenticity(np.zeros((64, 64, 3), np.uint8))
+
+    # 1.2 is 0.3 above the threshold: one full-confidence clone (-0.3) could still flip it
+    assert result.is_authentic is True
+    assert result.metadata["checks_skipped"] == []
+    assert "copy_move" in calls
+    verifier.close()
+
+
+def test_score_beyond_every_pending_deduction_skips_the_rest(verifier):
+    verifier.tamper_threshold = 0.3
+    calls = stub_checks(verifier, {})
+
+    result = verifier.verify_authenticity(np.zeros((64, 64, 3), np.uint8))
+
+    # Texture has no bound so it runs; 1.2 - 0.7 = 0.5 then exceeds copy-move (0.3)
+    assert result.is_authentic is True
+    assert result.metadata["checks_skipped"] == ["copy_move"]
+    assert "texture" in calls and "copy_move" not in calls
+    verifier.close()
+
+
+def test_many_texture_anomalies_still_fail_the_document(verifier):
+    stub_checks(verifier, {})
+    verifier.texture_analysis = lambda image: (
+        [ForensicFinding(TamperType.TEXTURE_ANOMALY, 1.0, None, "medium", "stub", {})] * 2, None)
+    verifier.verify_security_features = lambda image, document_type: [
+        SecurityFeature(name, passed, 0.8, None, passed)
+        for name, passed in [("hologram", True), ("microprint", False), ("watermark", False)]]
+
+    result = verifier.verify_authenticity(np.zeros((64, 64, 3), np.uint8))
+
+    # 1 - 2 * 0.1 + 0.2 / 3: every texture finding counts in full
+    assert result.authenticity_score == pytest.approx(0.8 + 0.2 / 3)
+    assert result.is_authentic is False
+    assert result.is_authentic == verifier.verify_authenticity(
+        np.zeros((64, 64, 3), np.uint8), exhaustive=True).is_authentic
+    verifier.close()
+
+
+def test_policy_checks_always_run(verifier):
+    verifier.config["schedule"]["always_run"] = ["copy_move"]
+    calls = stub_checks(verifier, {"ela": 0.3, "noise": 0.3}, security_passed=False)
+
+    result = verifier.verify_authenticity(np.zeros((64, 64, 3), np.uint8))
+
+    assert "copy_move" in calls and "texture" not in calls
+    assert result.metadata["checks_skipped"] == ["texture"]
+    verifier.close()
+
+
+def test_scheduled_and_exhaustive_results_agree_on_a_clone(verifier):
+    tampered = clone(textured_scene(), (60, 80), (260, 400), 72)
+
+    scheduled = verifier.verify_authenticity(tampered)
+    full = verifier.verify_authenticity(tampered, exhaustive=True)
+
+    assert scheduled.is_authentic == full.is_authentic
+    assert full.metadata["checks_skipped"] == []
+    assert set(full.metadata["checks_run"]) == {
+        "ela", "noise", "resampling", "font", "security_features", "texture", "copy_move"}
+    assert any(f.tamper_type == TamperType.COPY_MOVE for f in full.findings)
+    verifier.close()
+
+
+def reference_texture_variance(gray):
+    """Previous texture_analysis map: 12 full-resolution Gabor passes, 15 x 15 box"""
+    responses = [
+        cv2.filter2D(gray, cv2.CV_32F, cv2.getGaborKernel((31, 31), 4.0, theta * np.pi / 180, 10.0, freq, 0))
+        for freq in (0.1, 0.2, 0.3) for theta in (0, 45, 90, 135)
+    ]
+    texture_map = np.mean(responses, axis=0)
+    box = np.ones((15, 15)) / 225
+    local_mean = cv2.filter2D(texture_map, cv2.CV_32F, box)
+    return cv2.filter2D(texture_map ** 2, cv2.CV_32F, box) - local_mean ** 2
+
+
+@pytest.mark.parametrize("size", [(480, 640), (1200, 1600)])
+def test_texture_variance_tracks_full_gabor_bank(verifier, size):
+    scene = cv2.resize(textured_scene(seed=11), size[::-1], interpolation=cv2.INTER_CUBIC)
+    gray = cv2.cvtColor(scene, cv2.COLOR_BGR2GRAY)
+
+    variance = verifier._texture_variance(gray)
+
+    assert variance.shape == gray.shape
+    correlation = np.corrcoef(variance.ravel(), reference_texture_variance(gray).ravel())[0, 1]
+    assert correlation > (0.999 if max(size) <= 1024 else 0.99)
+
+
+def test_gabor_bank_is_built_once_per_scale(verifier):
+    verifier.texture_analysis(textured_scene())
+    verifier.texture_analysis(textured_scene(seed=6))
+    verifier.texture_analysis(cv2.resize(textured_scene(), (1600, 1200)))
+
+    assert sorted(verifier._gabor_kernels) == [1, 2]
+    assert verifier._gabor_kernels[1].shape == (31, 31)
@@ -0,0 +1,149 @@
+import os
+import sys
+import threading
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.classification.document_classifier import DocumentClassifier, TORCH_AVAILABLE, TRANSFORMS_AVAILABLE  # noqa: E402
+from src.classification.micro_batcher import MicroBatcher  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return DocumentClassifier()
+
+
+def id_card(width, height):
+    card = np.full((height, width, 3), (200, 130, 30), dtype=np.uint8)
+    cv2.rectangle(card, (width // 20, height // 5), (width // 3, height * 4 // 5), (180, 180, 180), -1)
+    cv2.rectangle(card, (width // 2, height // 4), (width * 9 // 10, height // 3), (255, 255, 255), -1)
+    return card
+
+
+def test_color_sample_is_bounded_and_deterministic(classifier):
+    image = id_card(4000, 2520)
+    sample = classifier._color_sample(image)
+
+    assert len(sample) <= classifier.COLOR_SAMPLE_PIXELS
+    assert np.array_equal(sample, classifier._color_sample(image))
+    # BGR (200, 130, 30) background comes back as RGB
+    assert (sample == (30, 130, 200)).all(axis=1).mean() > 0.5
+
+
+def test_dominant_colors_stable_across_resolutions(classifier):
+    small = classifier._extract_color_features(id_card(856, 540))
+    large = classifier._extract_color_features(id_card(4000, 2523))
+
+    for color in ((30, 130, 200), (180, 180, 180)):
+        assert min(np.linalg.norm(np.subtract(c, color)) for c in small["dominant_colors"]) < 10
+        assert min(np.linalg.norm(np.subtract(c, color)) for c in large["dominant_colors"]) < 10
+
+    # Histograms are still taken over the full image in RGB channel order
+    assert large["color_histogram"]["red"][30] > 0.5 * 4000 * 2523
+    assert sum(large["color_histogram"]["blue"]) == 0
+
+
+def test_extractors_share_one_preprocessing_bundle(classifier, monkeypatch):
+    conversions = []
+    cvt_color = cv2.cvtColor
+
+    def counting(image, code, *args):
+        conversions.append(code)
+        return cvt_color(image, code, *args)
+    monkeypatch.setattr(cv2, "cvtColor", counting)
+
+    classifier._extract_features(id_card(856, 540))
+    assert conversions.count(cv2.COLOR_BGR2GRAY) == 1
+
+
+def test_vectorized_template_scores(classifier):
+    features = {
+        "aspect_ratio": 1.585,
+        "dominant_colors": [(0, 56, 168), (255, 255, 255)],
+        "detected_features": ["MRZ", "MRZ", "Clear Corners"],
+        "has_mrz": True,
+    }
+    scores = classifier._match_templates(features)
+
+    # Same arithmetic as the per-template loop, for the built-in templates
+    for template in classifier.templates.values():
+        weight = 0.8 + (0.2 if template.mrz_format else 0.0)
+        expected = max(0, 1 - abs(1.585 - template.aspect_ratio) * 2) * 0.3
+        expected += max(max(0.0, 1 - np.linalg.norm(np.subtract(a, b)) / 441.67)
+                        for a in features["dominant_colors"] for b in template.color_scheme) * 0.2
+        expected += features["detected_features"].count("MRZ") * ("MRZ" in template.key_features) / \
+            len(template.key_features) * 0.3
+        expected += 0.2 if template.mrz_format else 0.0
+        assert scores[template.type.value] == pytest.approx(expected / weight)
+
+    passport = classifier._find_best_template(classifier.templates["ph_passport_v1"].type, features)
+    assert passport == "ph_passport_v1"
+
+
+def test_micro_batcher_coalesces_concurrent_calls():
+    batches = []
+
+    def double(items):
+        batches.append(len(items))
+        time.sleep(0.02)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(double, max_batch_size=4, max_wait_ms=20)
+    results = {}
+    threads = [threading.Thread(target=lambda i=i: results.update({i: batcher.submit(i)})) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert results == {i: i * 2 for i in range(8)}
+    assert max(batches) == 4 and len(batches) < 8
+    assert batcher.get_metrics()["items"] == 8
+    with pytest.raises(RuntimeError):
+        batcher.submit(1)
+
+
+def test_micro_batcher_propagates_errors():
+    def broken(items):
+        raise ValueError("bad batch")
+
+    batcher = MicroBatcher(broken, max_batch_size=2, max_wait_ms=1)
+    with pytest.raises(ValueError, match="bad batch"):
+        batcher.submit(1, timeout=5)
+    batcher.close()
+
+
+@pytest.mark.skipif(not (TORCH_AVAILABLE and TRANSFORMS_AVAILABLE), reason="torch/torchvision not installed")
+def test_batched_predictions_match_single_image_passes(classifier):
+    images = [id_card(856, 540), np.random.default_rng(3).integers(0, 255, (540, 856, 3), dtype=np.uint8)]
+    classifier.config["inference"]["micro_batching"] = False
+    expected = [classifier._get_model_predictions(image) for image in images]
+
+    classifier.config["inference"]["micro_batching"] = True
+    results = [None, None]
+
+    def predict(i):
+        results[i] = classifier._get_model_predictions(images[i])
+    threads = [threading.Thread(target=predict, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    classifier.close()
+
+    for got, want in zip(results, expected):
+        assert got.keys() == want.keys()
+        assert all(got[k] == pytest.approx(want[k], abs=1e-5) for k in want)
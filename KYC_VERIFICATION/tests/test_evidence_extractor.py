@@ -0,0 +1,172 @@
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.extraction.evidence_extractor import EvidenceExtractor, SUB_EXTRACTORS  # noqa: E402
+
+
+@pytest.fixture
+def extractor():
+    extractor = EvidenceExtractor()
+    yield extractor
+    extractor.close()
+
+
+@pytest.fixture
+def image():
+    return np.random.default_rng(0).integers(0, 255, (190, 300, 3), dtype=np.uint8)
+
+
+def sleeping(seconds, result):
+    def run(*_):
+        time.sleep(seconds)
+        return result
+    return run
+
+
+def test_runs_only_requested_extractors(extractor, image):
+    result = extractor.extract_all(image, extractors=["face"])
+    status = result.metadata["extractors"]
+
+    assert status["face"]["status"] == "ok"
+    assert all(status[name]["status"] == "skipped" for name in SUB_EXTRACTORS if name != "face")
+    assert result.ocr_text["fields"] == []
+    assert result.metadata["partial"] is False
+
+    with pytest.raises(ValueError):
+        extractor.extract_all(image, extractors=["ocr", "retina"])
+
+
+def test_sub_extractors_overlap(extractor, image):
+    extractor.extract_ocr = sleeping(0.2, {"fields": [], "full_text": "x"})
+    extractor._extract_mrz_band = sleeping(0.2, (None, None))
+    extractor.extract_barcodes = sleeping(0.2, [])
+    extractor.extract_faces = sleeping(0.2, [])
+
+    start = time.perf_counter()
+    result = extractor.extract_all(image)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert result.ocr_text["full_text"] == "x"
+    assert all(s["status"] in ("ok", "skipped") for s in result.metadata["extractors"].values())
+
+
+def test_slow_or_failing_extractor_yields_partial_result(extractor, image):
+    extractor.config["concurrency"]["timeouts_s"]["barcode"] = 0.05
+    extractor.extract_barcodes = sleeping(0.5, [{"type": "QRCODE"}])
+
+    def broken(_):
+        raise RuntimeError("detector crashed")
+    extractor.extract_faces = broken
+
+    start = time.perf_counter()
+    result = extractor.extract_all(image)
+    elapsed = time.perf_counter() - start
+
+    status = result.metadata["extractors"]
+    assert elapsed < 0.4
+    assert status["barcode"]["status"] == "timeout"
+    assert status["face"] == {"status": "error", "error": "detector crashed"}
+    assert status["ocr"]["status"] == "ok"
+    assert result.barcodes == []
+    assert result.faces == []
+    assert result.metadata["partial"] is True
+
+
+def test_timed_out_task_does_not_block_later_calls(extractor, image):
+    extractor.config["concurrency"]["max_workers"] = 1
+    extractor.config["concurrency"]["timeouts_s"]["barcode"] = 0.1
+    extractor.extract_barcodes = sleeping(1.0, [])
+
+    first = extractor.extract_all(image, extractors=["barcode"])
+    assert first.metadata["extractors"]["barcode"]["status"] == "timeout"
+
+    # The single worker thread is still stuck; the next call gets a fresh pool
+    extractor.extract_barcodes = sleeping(0, [{"type": "QRCODE"}])
+    second = extractor.extract_all(image, extractors=["barcode"])
+    assert second.metadata["extractors"]["barcode"]["status"] == "ok"
+    assert second.barcodes == [{"type": "QRCODE"}]
+
+
+TD3 = ["P<UTOERIKSSON<<ANNA<MARIA<<<<<<<<<<<<<<<<<<<",
+       "L898902C36UTO7408122F1204159ZE184226B<<<<<10"]
+TD1 = ["I<UTOD231458907<<<<<<<<<<<<<<<",
+       "7408122F1204159UTO<<<<<<<<<<<6",
+       "ERIKSSON<<ANNA<MARIA<<<<<<<<<<"]
+
+
+def synthetic_passport(mrz_lines, width=1250, height=880):
+    page = np.full((height, width, 3), 235, dtype=np.uint8)
+    cv2.rectangle(page, (60, 120), (380, 560), (120, 110, 100), -1)
+    for i, text in enumerate(["REPUBLIC OF UTOPIA", "Surname ERIKSSON", "Given names ANNA MARIA"]):
+        cv2.putText(page, text, (430, 150 + i * 70), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (40, 40, 40), 2)
+    scale = (width - 100) / cv2.getTextSize(mrz_lines[0], cv2.FONT_HERSHEY_PLAIN, 1, 1)[0][0]
+    for i, line in enumerate(mrz_lines):
+        cv2.putText(page, line, (50, height - 140 + i * 45), cv2.FONT_HERSHEY_PLAIN, scale * 0.98, (20, 20, 20), 2)
+    return page
+
+
+def test_parses_icao_specimens_with_checksums(extractor):
+    td3 = extractor._parse_td3(TD3)
+    assert all(td3.check_digits.values())
+    assert (td3.surname, td3.given_names, td3.document_number) == ("ERIKSSON", "ANNA MARIA", "L898902C3")
+
+    td1 = extractor._parse_td1(TD1)
+    assert all(td1.check_digits.values())
+    assert (td1.document_number, td1.birth_date, td1.expiry_date) == ("D23145890", "740812", "120415")
+
+    corrupted = extractor._parse_td3([TD3[0], TD3[1].replace("7408122", "7408132")])
+    assert not corrupted.check_digits["birth_date"]
+    assert not corrupted.check_digits["composite"]
+
+
+def test_locates_mrz_band_at_bottom_of_page(extractor):
+    page = synthetic_passport(TD3)
+    x, y, w, h = extractor._locate_mrz_band(page)
+
+    assert y > page.shape[0] * 0.7
+    assert w * h < page.shape[0] * page.shape[1] * 0.15
+    assert extractor._locate_mrz_band(np.full((880, 1250, 3), 235, dtype=np.uint8)) is None
+
+
+def test_validated_mrz_skips_full_page_ocr(extractor):
+    page = synthetic_passport(TD3)
+    extractor._extract_mrz_text = lambda band: list(TD3)
+    ocr_calls = []
+    extractor.extract_ocr = lambda image: ocr_calls.append(image) or {"fields": []}
+
+    result = extractor.extract_all(page, "PASSPORT")
+
+    assert ocr_calls == []
+    assert result.metadata["extractors"]["ocr"] == {"status": "skipped", "reason": "mrz_validated"}
+    assert result.metadata["ocr_pixels"]["full_page"] == 0
+    assert 0 < result.metadata["ocr_pixels"]["mrz_band"] < page.shape[0] * page.shape[1] * 0.15
+    assert result.mrz_data.document_number == "L898902C3"
+    assert result.validation_passed
+
+
+def test_invalid_mrz_falls_back_to_full_page_ocr(extractor):
+    page = synthetic_passport(TD3)
+    extractor._extract_mrz_text = lambda band: [TD3[0], TD3[1][:-1] + "9"]
+    ocr_calls = []
+    extractor.extract_ocr = lambda image: ocr_calls.append(image) or {"fields": []}
+
+    result = extractor.extract_all(page, "PASSPORT")
+
+    assert len(ocr_calls) == 1
+    assert result.metadata["extractors"]["ocr"]["status"] == "ok"
+    assert result.metadata["ocr_pixels"]["full_page"] == page.shape[0] * page.shape[1]
@@ -0,0 +1,168 @@
+import base64
+import os
+import pickle
+import sys
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.extraction.evidence_extractor import EvidenceExtractor  # noqa: E402
+from src.extraction.result_cache import ExtractionResultCache, image_cache_key  # noqa: E402
+
+cryptography = pytest.importorskip("cryptography")
+from cryptography.fernet import Fernet  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def image():
+    return np.random.default_rng(0).integers(0, 255, (190, 300, 3), dtype=np.uint8)
+
+
+def test_key_depends_on_pixels_and_config(image):
+    key = image_cache_key(image, "v1", "PASSPORT")
+    assert key == image_cache_key(image.copy(), "v1", "PASSPORT")
+    assert key != image_cache_key(image, "v2", "PASSPORT")
+    assert key != image_cache_key(image, "v1", "UMID")
+
+    changed = image.copy()
+    changed[0, 0, 0] ^= 1
+    assert key != image_cache_key(changed, "v1", "PASSPORT")
+
+
+def test_lru_eviction_ttl_and_hit_ratio():
+    clock = FakeClock()
+    cache = ExtractionResultCache(max_entries=2, ttl_seconds=60, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)  # evicts b, the least recently used
+
+    assert cache.get("b") is None
+    clock.now = 61
+    assert cache.get("a") is None
+
+    metrics = cache.get_metrics()
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 2
+    assert metrics["hit_ratio"] == pytest.approx(1 / 3)
+    assert metrics["evictions"] == 1
+    assert metrics["expirations"] == 1
+
+
+def test_disk_tier_is_encrypted_and_survives_restart(tmp_path):
+    key = Fernet.generate_key()
+    payload = {"surname": "ERIKSSON", "document_number": "L898902C3"}
+    ExtractionResultCache(disk_dir=tmp_path, encryption_key=key).put("k", payload)
+
+    files = list(tmp_path.glob("*.bin"))
+    assert len(files) == 1
+    assert b"ERIKSSON" not in files[0].read_bytes()
+    assert oct(files[0].stat().st_mode)[-3:] == "600"
+
+    restarted = ExtractionResultCache(disk_dir=tmp_path, encryption_key=key)
+    assert restarted.get("k") == payload
+    assert restarted.get_metrics()["disk_hits"] == 1
+
+    other_key = ExtractionResultCache(disk_dir=tmp_path, encryption_key=Fernet.generate_key())
+    assert other_key.get("k") is None
+
+
+def test_disk_entries_expire_and_respect_budget(tmp_path):
+    key = Fernet.generate_key()
+    cache = ExtractionResultCache(ttl_seconds=60, disk_dir=tmp_path, encryption_key=key)
+    stale = Fernet(key).encrypt_at_time(pickle.dumps("old"), int(time.time()) - 120)
+    (tmp_path / "stale.bin").write_bytes(stale)
+    assert cache.get("stale") is None
+    assert not (tmp_path / "stale.bin").exists()
+
+    small = ExtractionResultCache(disk_dir=tmp_path, encryption_key=key, max_disk_bytes=4096)
+    for i in range(20):
+        small.put(f"entry{i}", "x" * 500)
+    total = sum(path.stat().st_size for path in tmp_path.glob("*.bin"))
+    assert total <= 4096
+    assert small.get_metrics()["disk_evictions"] > 0
+
+
+def test_resubmitted_image_is_served_from_cache(image):
+    extractor = EvidenceExtractor(result_cache=ExtractionResultCache())
+    first = extractor.extract_all(image, "PHILIPPINE_ID")
+
+    start = time.perf_counter()
+    second = extractor.extract_all(image.copy(), "PHILIPPINE_ID")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    assert first.metadata["cache_hit"] is False
+    assert second.metadata["cache_hit"] is True
+    assert elapsed_ms < 5
+    assert second.extracted_fields == first.extracted_fields
+
+    subset = extractor.extract_all(image, "PHILIPPINE_ID", extractors=["face"])
+    assert subset.metadata["cache_hit"] is False
+    extractor.close()
+
+
+def test_cache_hits_do_not_share_mutable_state(image):
+    extractor = EvidenceExtractor(result_cache=ExtractionResultCache())
+    first = extractor.extract_all(image, "PHILIPPINE_ID")
+    expected = list(first.extracted_fields)
+
+    first.extracted_fields.append("tampered")
+    second = extractor.extract_all(image, "PHILIPPINE_ID")
+    second.faces.append("not a face")
+    third = extractor.extract_all(image, "PHILIPPINE_ID")
+
+    assert third.metadata["cache_hit"] is True
+    assert third.extracted_fields == expected
+    assert len(third.faces) == len(first.faces)
+    extractor.close()
+
+
+def test_partial_results_are_not_cached(image):
+    extractor = EvidenceExtractor(result_cache=ExtractionResultCache())
+
+    def broken(_):
+        raise RuntimeError("detector crashed")
+    extractor.extract_faces = broken
+
+    assert extractor.extract_all(image).metadata["partial"] is True
+    assert len(extractor.result_cache) == 0
+    extractor.close()
+
+
+def test_repeated_extract_request_returns_under_5ms():
+    from fastapi.testclient import TestClient
+    from api.app import app
+
+    image = np.random.default_rng(1).integers(0, 255, (190, 300, 3), dtype=np.uint8)
+    payload = {
+        "image_base64": base64.b64encode(cv2.imencode(".png", image)[1]).decode(),
+        "document_type": "PHILIPPINE_ID",
+    }
+    with TestClient(app) as client:
+        first = client.post("/extract", json=payload)
+        second = client.post("/extract", json=payload)
+        metrics = client.get("/metrics").json()["metrics"]
+
+    assert first.status_code == second.status_code == 200
+    assert second.json()["metadata"]["cache_hit"] is True
+    assert second.json()["metadata"]["processing_time_ms"] < 5
+    assert metrics["extraction_cache"]["hits"] >= 1
@@ -0,0 +1,169 @@
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.extraction import extractor_pool  # noqa: E402
+from src.extraction.extractor_pool import (  # noqa: E402
+    ExtractorPool,
+    PoolTimeoutError,
+    ResourcePool,
+    _tsv_to_dict,
+)
+
+
+def test_pool_builds_instances_once_and_tracks_utilization():
+    built = []
+    pool = ResourcePool(lambda: built.append(object()) or built[-1], size=2, name="test")
+    assert len(built) == 2
+
+    with pool.acquire() as first:
+        with pool.acquire() as second:
+            assert first is not second
+            metrics = pool.get_metrics()
+            assert metrics["in_use"] == 2
+            assert metrics["utilization"] == 1.0
+
+    for _ in range(5):
+        with pool.acquire() as item:
+            assert item in built
+
+    metrics = pool.get_metrics()
+    assert len(built) == 2
+    assert metrics["in_use"] == 0
+    assert metrics["peak_in_use"] == 2
+    assert metrics["acquisitions"] == 7
+    assert metrics["timeouts"] == 0
+
+
+def test_exhausted_pool_times_out_and_recovers():
+    pool = ResourcePool(object, size=1, name="test")
+    with pool.acquire():
+        with pytest.raises(PoolTimeoutError):
+            with pool.acquire(timeout=0.01):
+                pass
+    with pool.acquire(timeout=0.01):
+        pass
+
+    metrics = pool.get_metrics()
+    assert metrics["timeouts"] == 1
+    assert metrics["acquisitions"] == 2
+
+
+def test_waiting_caller_gets_released_instance():
+    pool = ResourcePool(object, size=1, name="test")
+    release = threading.Event()
+    acquired = threading.Event()
+
+    def hold():
+        with pool.acquire():
+            acquired.set()
+            release.wait(1)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    acquired.wait(1)
+    threading.Timer(0.05, release.set).start()
+    with pool.acquire(timeout=1):
+        pass
+    holder.join()
+
+    assert pool.get_metrics()["waits"] == 1
+
+
+def test_instance_returned_after_exception():
+    pool = ResourcePool(object, size=1, name="test")
+    with pytest.raises(RuntimeError):
+        with pool.acquire():
+            raise RuntimeError("extraction failed")
+    assert pool.get_metrics()["available"] == 1
+
+
+def test_tsv_output_parses_like_pytesseract_dict():
+    tsv = ("1\t1\t0\t0\t0\t0\t0\t0\t300\t190\t-1\t\n"
+           "5\t1\t1\t1\t1\t1\t12\t20\t80\t14\t91.5\tDELA\n")
+    data = _tsv_to_dict(tsv)
+    assert data["text"] == ["", "DELA"]
+    assert data["conf"] == [-1.0, 91.5]
+    assert data["left"] == [0, 12]
+
+
+def test_extractor_pool_reuses_evidence_extractors():
+    pool = ExtractorPool(size=2, tesseract_workers=0)
+    image = np.random.default_rng(0).integers(0, 255, (190, 300, 3), dtype=np.uint8)
+
+    seen = set()
+    for _ in range(3):
+        with pool.acquire() as extractor:
+            seen.add(id(extractor))
+            result = extractor.extract_all(image, "PHILIPPINE_ID")
+            assert result.extraction_time_ms >= 0
+
+    assert len(seen) == 1
+    assert pool.get_metrics()["extractors"]["acquisitions"] == 3
+    assert pool.get_metrics()["tesseract"] is None
+
+
+class RecordingWorker:
+    """Stands in for TesseractWorker where tesserocr is not installed"""
+    created = []
+
+    def __init__(self, lang="eng", oem=3):
+        self.lang, self.oem = lang, oem
+        self.calls = []
+        RecordingWorker.created.append(self)
+
+    def image_to_data(self, image, psm=3):
+        self.calls.append(("data", psm))
+        return _tsv_to_dict("5\t1\t1\t1\t1\t1\t12\t20\t80\t14\t91.5\tDELA\n")
+
+    def image_to_string(self, image, psm=3, whitelist=""):
+        self.calls.append(("string", psm))
+        return ""
+
+
+@pytest.fixture
+def recording_workers(monkeypatch):
+    RecordingWorker.created = []
+    monkeypatch.setattr(extractor_pool, "TESSEROCR_AVAILABLE", True)
+    monkeypatch.setattr(extractor_pool, "TesseractWorker", RecordingWorker)
+    return RecordingWorker.created
+
+
+def test_tesseract_workers_use_extractor_ocr_config(tmp_path, recording_workers):
+    config = {"ocr_config": {"lang": "fil", "oem": 1, "psm": 6, "confidence_threshold": 0.6}}
+    config_path = tmp_path / "extraction.json"
+    config_path.write_text(json.dumps(config))
+
+    pool = ExtractorPool(size=2, tesseract_workers=2, config_path=str(config_path))
+
+    assert [(w.lang, w.oem) for w in recording_workers] == [("fil", 1), ("fil", 1)]
+    with pool.acquire() as extractor:
+        assert extractor.ocr_pool is pool.ocr_pool
+        extractor.extract_ocr(np.full((190, 300, 3), 255, dtype=np.uint8))
+        # MRZ is read as eng/oem 3, which these workers are not loaded for
+        extractor._extract_mrz_text(np.full((40, 300), 255, dtype=np.uint8))
+    calls = [call for worker in recording_workers for call in worker.calls]
+    assert calls == [("data", 6)]
+    assert pool.get_metrics()["tesseract"]["acquisitions"] == 1
+
+
+def test_tesseract_pool_is_off_by_default(monkeypatch, recording_workers):
+    monkeypatch.delenv("TESSERACT_POOL_SIZE", raising=False)
+    pool = extractor_pool.create_extractor_pool(size=1)
+
+    assert pool.ocr_pool is None
+    assert recording_workers == []
+    pool.close()
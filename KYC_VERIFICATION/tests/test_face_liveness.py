@@ -0,0 +1,117 @@
+import os
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+pytest.importorskip("dlib")
+pytest.importorskip("face_recognition")
+from src.biometrics.face_matcher import FaceMatcher, LivenessFrame, LivenessType  # noqa: E402
+
+
+def reference_lbp(gray):
+    """Previous per-pixel LBP loop"""
+    rows, cols = gray.shape
+    lbp = np.zeros_like(gray)
+    for i in range(1, rows - 1):
+        for j in range(1, cols - 1):
+            center = gray[i, j]
+            neighbors = [
+                gray[i-1, j-1], gray[i-1, j], gray[i-1, j+1],
+                gray[i, j+1], gray[i+1, j+1], gray[i+1, j],
+                gray[i+1, j-1], gray[i, j-1]
+            ]
+            lbp[i, j] = sum(1 << k for k, neighbor in enumerate(neighbors) if neighbor >= center)
+    return lbp
+
+
+def reference_passive_scores(frame):
+    """Previous texture, frequency and reflection scores of one frame"""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+    hist, _ = np.histogram(reference_lbp(gray).ravel(), bins=256, range=(0, 256))
+    hist = hist.astype("float") / (hist.sum() + 1e-6)
+    texture = min(1.0, -np.sum(hist * np.log(hist + 1e-6)) / 5.0)
+
+    magnitude = np.abs(np.fft.fftshift(np.fft.fft2(gray)))
+    crow, ccol = gray.shape[0] // 2, gray.shape[1] // 2
+    ratio = (np.sum(magnitude[crow-30:crow+30, ccol-30:ccol+30])
+             / (np.sum(magnitude[crow-60:crow+60, ccol-60:ccol+60]) + 1e-6))
+    frequency = 1 / (1 + np.exp(-10 * (ratio - 0.3)))
+
+    v = cv2.split(cv2.cvtColor(frame, cv2.COLOR_BGR2HSV))[2]
+    lines = cv2.HoughLinesP(cv2.Canny(v, 50, 150), 1, np.pi/180, 100, minLineLength=100, maxLineGap=10)
+    reflection = 0.3 if lines is not None and len(lines) > 10 else 1.0 - np.sum(v > 240) / v.size * 2
+    return texture, frequency, max(0, min(1, reflection))
+
+
+def make_frames(count, seed=0):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for i in range(count):
+        frame = cv2.GaussianBlur(rng.integers(0, 256, (144, 176, 3), dtype=np.uint8), (0, 0), 1.0)
+        cv2.rectangle(frame, (20 + 4 * i, 30), (150, 130), (255, 255, 255), -1 if i % 2 else 2)
+        frames.append(frame)
+    return frames
+
+
+@pytest.fixture
+def matcher():
+    matcher = FaceMatcher()
+    yield matcher
+    matcher.close()
+
+
+def test_lbp_matches_reference_loop(matcher):
+    rng = np.random.default_rng(3)
+    for gray in (rng.integers(0, 256, (37, 53), dtype=np.uint8),
+                 rng.integers(0, 3, (20, 20), dtype=np.uint8),
+                 np.zeros((2, 9), np.uint8)):
+        assert np.array_equal(matcher._calculate_lbp(gray), reference_lbp(gray))
+
+
+def test_passive_scores_unchanged(matcher):
+    frames = make_frames(6)
+
+    results = {r.liveness_type: r for r in matcher.detect_liveness(frames)}
+
+    expected = np.array([reference_passive_scores(frame) for frame in frames[:5]])
+    assert results[LivenessType.TEXTURE_ANALYSIS].frame_scores == pytest.approx(expected[:, 0], abs=1e-12)
+    assert results[LivenessType.FREQUENCY_ANALYSIS].frame_scores == pytest.approx(expected[:, 1], abs=1e-12)
+    assert results[LivenessType.PASSIVE].frame_scores == pytest.approx(expected[:, 2], abs=1e-12)
+
+
+def test_faces_are_detected_once_per_frame(matcher):
+    calls = []
+    detector = matcher.face_detector
+
+    def counting_detector(gray):
+        calls.append(gray.shape)
+        return detector(gray)
+    matcher.face_detector = counting_detector
+
+    results = matcher.detect_liveness(make_frames(12))
+
+    # Blink and head movement both need the face of all 12 frames
+    assert len(calls) == 12
+    assert [r.liveness_type for r in results][:3] == [
+        LivenessType.TEXTURE_ANALYSIS, LivenessType.FREQUENCY_ANALYSIS, LivenessType.PASSIVE]
+
+
+def test_liveness_frame_value_is_hsv_value(matcher):
+    frame = make_frames(1, seed=4)[0]
+
+    shared = LivenessFrame(frame, matcher.face_detector)
+
+    assert np.array_equal(shared.value, cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)[:, :, 2])
+    assert np.array_equal(shared.gray, cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
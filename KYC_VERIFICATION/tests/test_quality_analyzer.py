@@ -0,0 +1,97 @@
+import os
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.capture.quality_analyzer import CaptureQualityAnalyzer, FrameAnalysis  # noqa: E402
+
+
+def card_frame(width=2560, height=1920):
+    """Sharp, high-contrast card on a dark table"""
+    rng = np.random.default_rng(11)
+    frame = np.full((height, width, 3), 30, dtype=np.uint8)
+    x0, y0 = width // 16, height // 12
+    cv2.rectangle(frame, (x0, y0), (width - x0, height - y0), (235, 235, 235), -1)
+    for _ in range(10):
+        w, h = int(rng.integers(width // 10, width // 4)), int(rng.integers(height // 10, height // 4))
+        x, y = int(rng.integers(x0, width - x0 - w)), int(rng.integers(y0, height - y0 - h))
+        cv2.rectangle(frame, (x, y), (x + w, y + h), (25, 25, 25), -1)
+    for i in range(8):
+        cv2.putText(frame, "REPUBLIKA NG PILIPINAS 123456789", (width // 11, height // 7 + i * height // 11),
+                    cv2.FONT_HERSHEY_SIMPLEX, width / 900, (120, 120, 120), 6)
+    return frame
+
+
+@pytest.fixture
+def analyzers():
+    full = CaptureQualityAnalyzer()
+    full.config["analysis_max_side"] = None
+    return full, CaptureQualityAnalyzer()
+
+
+def test_frame_analysis_caches_shared_views(monkeypatch):
+    conversions = []
+    cvt_color = cv2.cvtColor
+
+    def counting(image, code, *args):
+        conversions.append(code)
+        return cvt_color(image, code, *args)
+    monkeypatch.setattr(cv2, "cvtColor", counting)
+
+    frame = FrameAnalysis(card_frame(), analysis_max_side=1280)
+    assert max(frame.level.shape[:2]) == 1280
+    assert frame.scale == pytest.approx(0.5)
+    assert frame.gray is frame.gray and frame.edges is frame.edges
+    assert frame.value.shape == frame.gray.shape
+    assert conversions == [cv2.COLOR_BGR2GRAY]
+
+    small = FrameAnalysis(np.zeros((100, 200, 3), np.uint8), analysis_max_side=1280)
+    assert small.level is small.image and small.gray is small.full_gray
+
+
+def test_analysis_resolution_keeps_pass_fail(analyzers):
+    clean = card_frame()
+    degraded = [
+        cv2.GaussianBlur(clean, (0, 0), 2),
+        cv2.convertScaleAbs(clean, alpha=0.4),
+        cv2.warpAffine(clean, cv2.getRotationMatrix2D((1280, 960), 12, 1.0), (2560, 1920),
+                       borderValue=(255, 255, 255)),
+    ]
+    for analyzer in analyzers:
+        assert analyzer.validate_capture(clean)[0]
+        assert not any(analyzer.validate_capture(frame)[0] for frame in degraded)
+
+    full, fast = (analyzer.analyze_frame(clean)[0] for analyzer in analyzers)
+    assert fast.resolution == full.resolution == (2560, 1920)
+    assert fast.blur_score == full.blur_score
+    assert fast.overall_score == pytest.approx(full.overall_score, abs=0.01)
+
+
+def test_multi_frame_ranks_and_exits_early():
+    analyzer = CaptureQualityAnalyzer()
+    analyzer.config["multi_frame"].update(top_k=4, max_workers=2, early_exit_margin=0.0)
+    sharp = card_frame(1440, 1080)
+    frames = [cv2.GaussianBlur(sharp, (0, 0), sigma) for sigma in (6, 4, 3, 5, 2.5, 7)]
+    frames.insert(4, sharp)
+
+    exhaustive = analyzer.process_multi_frame(frames, exhaustive=True)
+    ranked = analyzer.process_multi_frame(frames)
+    analyzer.close()
+
+    assert exhaustive["consensus"]["frames_analyzed"] == len(frames)
+    assert ranked["consensus"]["best_frame_index"] == exhaustive["consensus"]["best_frame_index"] == 4
+    # The sharp frame ranks first, passes, and ends analysis after the first wave
+    assert ranked["consensus"]["frames_analyzed"] == 2
+    assert ranked["consensus"]["early_exit"] is True
+    assert ranked["all_frames"][0]["prescore"] == max(fm["prescore"] for fm in exhaustive["all_frames"])
@@ -0,0 +1,94 @@
+import os
+import random
+import sys
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.risk.risk_engine import RiskEngine  # noqa: E402
+
+
+def random_applicant(rng):
+    data = {}
+    if rng.random() < 0.9:
+        data["quality"] = {"blur_score": rng.random(), "glare_score": rng.random(),
+                           "resolution_adequate": rng.random() < 0.8}
+    if rng.random() < 0.9:
+        data["classification"] = {"confidence": rng.random()}
+    if rng.random() < 0.8:
+        data["extraction"] = {"ocr_confidence": rng.random(), "mrz_valid": rng.random() < 0.7,
+                              "expected_fields": ["a", "b", "c", "d"],
+                              "extracted_fields": ["a", "b", "c", "d"][: rng.randint(0, 4)],
+                              "fields_missing": ["d"] if rng.random() < 0.2 else []}
+    if rng.random() < 0.8:
+        data["forensics"] = {"is_authentic": rng.random() < 0.85, "manipulation_score": rng.random()}
+    if rng.random() < 0.9:
+        data["biometrics"] = {"similarity_score": rng.random(), "liveness_confidence": rng.random()}
+    if rng.random() < 0.7:
+        data["validation"] = {"checksum_valid": rng.random() < 0.9,
+                              "expiry_status": rng.choice(["valid", "expired"])}
+    if rng.random() < 0.7:
+        data["device"] = {"risk_score": rng.random(), "vpn_detected": rng.random() < 0.1,
+                          "emulator_detected": rng.random() < 0.05}
+    if rng.random() < 0.5:
+        data["velocity"] = {"anomaly_detected": rng.random() < 0.1}
+    if rng.random() < 0.1:
+        data["tor_detected"] = True
+    return data
+
+
+def make_trained_engine():
+    engine = RiskEngine()
+    rng = np.random.default_rng(0)
+    X = rng.random((400, len(engine.feature_names)))
+    y = (X[:, :5].mean(axis=1) + 0.2 * rng.random(400) > 0.6).astype(int)
+    engine.models = {
+        "random_forest": RandomForestClassifier(n_estimators=20, max_depth=6, random_state=42).fit(X, y),
+        "gradient_boost": GradientBoostingClassifier(n_estimators=20, max_depth=3, random_state=42).fit(X, y),
+    }
+    return engine
+
+
+def test_batch_scoring_matches_single_item_path():
+    engine = make_trained_engine()
+    rng = random.Random(11)
+    applicants = [random_applicant(rng) for _ in range(150)]
+
+    batch = engine.calculate_risk_batch(applicants)
+    assert len(batch) == len(applicants)
+    for data, (batch_score, batch_decision) in zip(applicants, batch):
+        single_score, single_decision = engine.calculate_risk(data)
+        assert batch_score == single_score
+        assert batch_decision == single_decision
+
+
+def test_feature_matrix_uses_fixed_column_order():
+    engine = make_trained_engine()
+    features = engine._extract_features({"biometrics": {"similarity_score": 0.8, "liveness_confidence": 0.4}})
+    X = engine._feature_matrix([features, list(reversed(features)), []])
+
+    assert X.shape == (3, len(engine.feature_names))
+    assert X[0, engine.feature_names.index("face_match_score")] == 0.8
+    assert X[0, engine.feature_names.index("liveness_score")] == 0.4
+    np.testing.assert_array_equal(X[0], X[1])
+    assert not X[2].any()
+    assert engine.calculate_risk_batch([]) == []
+
+
+def test_batch_scoring_handles_empty_and_untrained_feature_sets():
+    engine = RiskEngine()
+    applicants = [{}, {"velocity": {"anomaly_detected": True}}, {}]
+
+    batch = engine.calculate_risk_batch(applicants)
+
+    assert [score for score, _ in batch] == [engine.calculate_risk(data)[0] for data in applicants]
+    assert batch[0][0].overall_score == 0.0 and batch[0][0].feature_importance == []
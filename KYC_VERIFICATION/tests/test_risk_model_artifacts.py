@@ -0,0 +1,155 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+from sklearn.ensemble import ExtraTreesClassifier, GradientBoostingClassifier, RandomForestClassifier
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.risk.model_artifacts import (  # noqa: E402
+    FlatTreeEnsemble,
+    flatten_model,
+    load_model_artifact,
+    save_model_artifact,
+)
+from src.risk.risk_engine import RiskEngine  # noqa: E402
+
+
+def training_data(n_features, n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.random((n, n_features))
+    y = (X[:, :5].mean(axis=1) + 0.2 * rng.random(n) > 0.6).astype(int)
+    return X, y
+
+
+def test_flat_artifacts_are_memory_mapped_and_match_sklearn(tmp_path):
+    X, y = training_data(8)
+    models = {
+        "random_forest": RandomForestClassifier(n_estimators=15, max_depth=6, random_state=1).fit(X, y),
+        "gradient_boost": GradientBoostingClassifier(n_estimators=15, max_depth=3, random_state=1).fit(X, y),
+    }
+    for name, model in models.items():
+        path = save_model_artifact(model, tmp_path, name)
+        assert path.name == f"{name}.flat"
+
+        loaded = load_model_artifact(tmp_path, name)
+        assert isinstance(loaded, FlatTreeEnsemble)
+        assert isinstance(loaded.threshold, np.memmap)
+        assert load_model_artifact(tmp_path, name) is loaded  # cached per process
+        np.testing.assert_allclose(loaded.predict_proba(X), model.predict_proba(X), rtol=0, atol=1e-9)
+
+    assert load_model_artifact(tmp_path, "xgboost") is None
+
+
+def test_resaving_never_touches_arrays_already_mapped(tmp_path):
+    X, y = training_data(8)
+    first = RandomForestClassifier(n_estimators=10, max_depth=4, random_state=1).fit(X, y)
+    second = RandomForestClassifier(n_estimators=12, max_depth=5, random_state=2).fit(X, 1 - y)
+    save_model_artifact(first, tmp_path, "random_forest")
+    old = load_model_artifact(tmp_path, "random_forest")
+    old_threshold = np.array(old.threshold)
+
+    path = save_model_artifact(second, tmp_path, "random_forest")
+
+    # The mapped arrays still hold the first model; a fresh load sees the second
+    np.testing.assert_array_equal(old.threshold, old_threshold)
+    np.testing.assert_allclose(old.predict_proba(X), first.predict_proba(X), rtol=0, atol=1e-9)
+    new = load_model_artifact(tmp_path, "random_forest")
+    assert new is not old
+    np.testing.assert_allclose(new.predict_proba(X), second.predict_proba(X), rtol=0, atol=1e-9)
+    # Only the published version remains next to the link
+    assert path.is_symlink()
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(["random_forest.flat", path.resolve().name])
+
+
+def test_engine_loads_artifacts_and_warms_up(tmp_path):
+    trainer = RiskEngine()
+    X, y = training_data(len(trainer.feature_names))
+    for model in trainer.models.values():
+        model.fit(X, y)
+    exported = trainer.export_models(str(tmp_path / "models"))
+    assert set(exported) == set(trainer.models)
+
+    config_path = tmp_path / "risk.json"
+    config_path.write_text(json.dumps({"model_dir": str(tmp_path / "models")}))
+    engine = RiskEngine(str(config_path))
+
+    assert all(isinstance(m, FlatTreeEnsemble) for m in engine.models.values())
+    assert set(engine.warm_up()) == set(engine.models)
+    data = {"biometrics": {"similarity_score": 0.9, "liveness_confidence": 0.8}}
+    loaded_score, trained_score = engine.calculate_risk(data)[0], trainer.calculate_risk(data)[0]
+    for name, value in trained_score.model_scores.items():
+        assert abs(loaded_score.model_scores[name] - value) < 1e-9
+    assert abs(loaded_score.overall_score - trained_score.overall_score) < 1e-9
+
+
+def test_untrained_models_are_excluded_from_scoring(tmp_path):
+    config_path = tmp_path / "risk.json"
+    config_path.write_text(json.dumps({"model_dir": str(tmp_path / "missing")}))
+    engine = RiskEngine(str(config_path))
+
+    assert engine.warm_up() == {}
+    data = {"biometrics": {"similarity_score": 0.9, "liveness_confidence": 0.8}}
+    first, second = engine.calculate_risk(data)[0], engine.calculate_risk(data)[0]
+    assert first.model_scores == {}
+    assert first.overall_score == second.overall_score
+
+
+@pytest.mark.parametrize("model", [
+    RandomForestClassifier(n_estimators=40, max_depth=10, min_samples_split=5, random_state=42),
+    RandomForestClassifier(n_estimators=10, max_depth=None, random_state=3),
+    ExtraTreesClassifier(n_estimators=20, max_depth=8, random_state=5),
+    GradientBoostingClassifier(n_estimators=40, max_depth=5, learning_rate=0.1, random_state=42),
+    GradientBoostingClassifier(n_estimators=10, max_depth=3, init="zero", random_state=2),
+    GradientBoostingClassifier(n_estimators=10, max_depth=2, min_samples_leaf=400, random_state=4),
+], ids=["rf", "rf-deep", "extra-trees", "gb", "gb-zero-init", "gb-stumps"])
+def test_flat_evaluator_matches_sklearn(model):
+    X, y = training_data(12, n=800, seed=9)
+    model.fit(X, y)
+    flat = flatten_model(model)
+    X_test = np.random.default_rng(1).random((1000, 12))
+
+    for batch in (1, 10, 1000):
+        np.testing.assert_allclose(flat.predict_proba(X_test[:batch]), model.predict_proba(X_test[:batch]),
+                                   rtol=0, atol=1e-9)
+    np.testing.assert_allclose(flat.predict_proba(X_test[0]), model.predict_proba(X_test[:1]), rtol=0, atol=1e-9)
+
+
+def test_flat_evaluator_matches_multiclass_boosting():
+    X, _ = training_data(6, n=600, seed=3)
+    y = np.digitize(X[:, 0] + X[:, 1], [0.7, 1.3])
+    model = GradientBoostingClassifier(n_estimators=20, max_depth=3, random_state=0).fit(X, y)
+    flat = flatten_model(model)
+
+    np.testing.assert_allclose(flat.predict_proba(X), model.predict_proba(X), rtol=0, atol=1e-9)
+    np.testing.assert_array_equal(flat.predict(X), model.predict(X))
+
+
+def test_engine_compiles_trained_models_and_recompiles_after_refit():
+    engine = RiskEngine()
+    X, y = training_data(len(engine.feature_names))
+    for model in engine.models.values():
+        model.fit(X, y)
+    data = {"biometrics": {"similarity_score": 0.4, "liveness_confidence": 0.9}, "device": {"risk_score": 0.2}}
+
+    compiled_score = engine.calculate_risk(data)[0]
+    assert all(isinstance(entry[2], FlatTreeEnsemble) for entry in engine.compiled_models.values())
+    engine.config["compiled_inference"] = False
+    reference_score = engine.calculate_risk(data)[0]
+    for name, value in reference_score.model_scores.items():
+        assert abs(compiled_score.model_scores[name] - value) < 1e-9
+
+    engine.config["compiled_inference"] = True
+    engine.models["random_forest"].fit(X, 1 - y)
+    refit_score = engine.calculate_risk(data)[0]
+    expected = engine.models["random_forest"].predict_proba(engine._feature_matrix([engine._extract_features(data)]))
+    assert abs(refit_score.model_scores["random_forest"] - expected[0, 1]) < 1e-9
@@ -0,0 +1,164 @@
+import json
+import os
+import random
+import sys
+import threading
+
+import pytest
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.risk.risk_engine import (  # noqa: E402
+    CompiledPolicySet,
+    DecisionType,
+    RiskEngine,
+    RiskPolicy,
+)
+
+# Sample policy pack: one entry overrides a built-in, the others add policies
+SAMPLE_POLICY_PACK = """
+risk_policies:
+  - name: "sanctions_hit_confirmed"
+    priority: 1
+    conditions:
+      aml.sanctions_hit_confirmed: true
+    action: "deny"
+    message: "Confirmed sanctions list match"
+
+  - name: "tor_usage"
+    priority: 4
+    conditions:
+      tor_detected: true
+    action: "review"
+    message: "TOR network usage detected (pack)"
+
+  - name: "blacklisted_device"
+    priority: 1
+    conditions:
+      device.blacklisted: true
+    action: "deny"
+    message: "Device is on the deny list"
+
+  - name: "broken_entry"
+    conditions:
+      device.blacklisted: true
+    action: "not-an-action"
+"""
+
+FIELDS = ["tor_detected", "device.emulator", "device.tier", "aml.pep_match", "doc.type", "score.band"]
+VALUES = [True, False, 1, 2, "passport", "umid", None, ["x"]]
+
+
+def reference_match(policies, data):
+    """The previous loop: every enabled policy in priority order, every condition."""
+    def nested(path):
+        value = data
+        for key in path.split('.'):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    for policy in sorted(policies, key=lambda p: p.priority):
+        if policy.enabled and all(nested(k) == v for k, v in policy.conditions.items()):
+            return policy
+    return None
+
+
+def random_policies(rng, count):
+    return [
+        RiskPolicy(
+            name=f"P{i}",
+            enabled=rng.random() < 0.9,
+            priority=rng.randint(1, 5),
+            conditions={f: rng.choice(VALUES) for f in rng.sample(FIELDS, rng.randint(1, 3))},
+            action=rng.choice(list(DecisionType)),
+            message=f"policy {i}",
+        )
+        for i in range(count)
+    ]
+
+
+def random_data(rng):
+    data = {}
+    for field in FIELDS:
+        if rng.random() < 0.7:
+            node = data
+            *parents, leaf = field.split('.')
+            for key in parents:
+                node = node.setdefault(key, {})
+            node[leaf] = rng.choice(VALUES)
+    return data
+
+
+def test_compiled_set_matches_reference_loop():
+    rng = random.Random(5)
+    for _ in range(30):
+        policies = random_policies(rng, rng.randint(1, 60))
+        compiled = CompiledPolicySet(policies)
+        for _ in range(200):
+            data = random_data(rng)
+            assert compiled.match(data) is reference_match(policies, data)
+
+
+def engine_with_pack(tmp_path, pack_text):
+    pytest.importorskip("yaml")
+    pack_path = tmp_path / "policy_pack.yaml"
+    pack_path.write_text(pack_text)
+    config_path = tmp_path / "risk.json"
+    config_path.write_text(json.dumps({"policy_pack": str(pack_path)}))
+    return RiskEngine(str(config_path))
+
+
+def test_policy_pack_entries_are_compiled(tmp_path):
+    builtin = {p.name for p in RiskEngine().policies}
+    engine = engine_with_pack(tmp_path, SAMPLE_POLICY_PACK)
+    names = {p.name for p in engine.policies}
+    assert names == builtin | {"sanctions_hit_confirmed", "blacklisted_device"}
+
+    decision = engine._check_policies({"aml": {"sanctions_hit_confirmed": True}, "tor_detected": True})
+    assert decision.decision_type == DecisionType.DENY
+    assert decision.policy_violations == ["sanctions_hit_confirmed"]
+    tor = engine._check_policies({"tor_detected": True})
+    assert tor.policy_violations == ["tor_usage"]
+    assert tor.reasons == ["TOR network usage detected (pack)"]
+    assert engine._check_policies({"device": {"blacklisted": False}}) is None
+
+
+def test_shipped_policy_pack_adds_no_policies():
+    engine = RiskEngine()
+    assert engine._load_policy_pack(engine.config["policy_pack"]) == []
+
+
+def test_hot_reload_swaps_compiled_set_atomically():
+    engine = RiskEngine()
+    data = {"tor_detected": True}
+    old, new = DecisionType.REVIEW, DecisionType.DENY
+    replacement = [RiskPolicy("tor_block", True, 1, {"tor_detected": True}, new, "TOR blocked")]
+
+    seen = set()
+    stop = threading.Event()
+
+    def evaluate():
+        while not stop.is_set():
+            seen.add(engine._check_policies(data).decision_type)
+
+    worker = threading.Thread(target=evaluate)
+    worker.start()
+    try:
+        assert engine.reload_policies(replacement) == 1
+    finally:
+        stop.set()
+        worker.join()
+
+    assert seen <= {old, new}
+    assert engine._check_policies(data).decision_type == new
+    assert engine.reload_policies() == len(engine.compiled_policies) == len(RiskEngine().policies)
+    assert engine._check_policies(data).decision_type == old
@@ -0,0 +1,90 @@
+import json
+import os
+import signal
+import sys
+import time
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+import pytest  # noqa: E402
+
+from src.config import threshold_manager as tm_module  # noqa: E402
+from src.face.handlers import handle_burst_upload  # noqa: E402
+
+
+def write_thresholds(path, max_frames):
+    path.write_text(json.dumps({"face_burst_max_frames": {"value": max_frames}}))
+
+
+def frames(count):
+    return [{"timestamp_ms": i * 100} for i in range(count)]
+
+
+@pytest.fixture
+def shared_thresholds(tmp_path, monkeypatch):
+    config_path = tmp_path / "thresholds.json"
+    write_thresholds(config_path, 24)
+    reads = []
+    original = tm_module.ThresholdManager._load_from_file
+
+    def counting_load(self):
+        reads.append(self.config_path)
+        return original(self)
+
+    monkeypatch.setattr(tm_module.ThresholdManager, "_load_from_file", counting_load)
+    monkeypatch.setattr(tm_module, "RELOAD_CHECK_INTERVAL_SECONDS", 0.2)
+    tm_module.reset_threshold_manager(config_path)
+    yield config_path, reads
+    tm_module.reset_threshold_manager()
+
+
+def test_requests_share_snapshot_and_pick_up_file_edits(shared_thresholds):
+    config_path, reads = shared_thresholds
+
+    for i in range(200):
+        assert handle_burst_upload(f"thr-{i % 5}", frames(20))["ok"]
+    assert len(reads) == 1
+    first = tm_module.get_threshold_manager()
+    assert first.get("face_burst_max_frames") == 24
+
+    write_thresholds(config_path, 12)
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    time.sleep(0.25)
+
+    result = handle_burst_upload("thr-edit", frames(20))
+    assert not result["ok"] and "Too many frames" in result["error"]
+    for _ in range(200):
+        handle_burst_upload("thr-edit", frames(5))
+    assert len(reads) == 2
+
+    current = tm_module.get_threshold_manager()
+    assert current.version == first.version + 1
+    assert first.get("face_burst_max_frames") == 24  # old snapshot is untouched
+
+
+def test_sighup_forces_reload(shared_thresholds):
+    _, reads = shared_thresholds
+    before = tm_module.get_threshold_manager()
+    assert tm_module.get_threshold_manager() is before
+
+    previous = signal.getsignal(signal.SIGHUP) if hasattr(signal, "SIGHUP") else None
+    if tm_module.install_reload_signal_handler():
+        try:
+            os.kill(os.getpid(), signal.SIGHUP)
+        finally:
+            signal.signal(signal.SIGHUP, previous)
+    else:
+        tm_module.request_threshold_reload()
+
+    after = tm_module.get_threshold_manager()
+    assert after is not before
+    assert after.version == before.version + 1
+    assert len(reads) == 2
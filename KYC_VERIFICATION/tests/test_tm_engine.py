@@ -0,0 +1,231 @@
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.transaction_monitoring.tm_engine import (  # noqa: E402
+    MANILA_TZ,
+    AlertType,
+    GeovelocityMonitor,
+    LatencyHistogram,
+    Location,
+    StructuringDetector,
+    Transaction,
+    TransactionMonitoringEngine,
+    TransactionType,
+    encode_geohash,
+)
+
+CITIES = [
+    Location(14.5995, 120.9842, "Philippines", "Manila"),
+    Location(10.3157, 123.8854, "Philippines", "Cebu"),
+    Location(7.1907, 125.4553, "Philippines", "Davao"),
+    Location(1.3521, 103.8198, "Singapore", "Singapore"),
+    Location(35.6762, 139.6503, "Japan", "Tokyo"),
+    Location(40.7128, -74.0060, "USA", "New York"),
+]
+
+
+def make_txn(i, customer_id, timestamp, location):
+    return Transaction(
+        transaction_id=f"TXN{i:06d}",
+        customer_id=customer_id,
+        timestamp=timestamp,
+        amount=1000.0,
+        currency="PHP",
+        transaction_type=TransactionType.CARD_PURCHASE,
+        location=location,
+    )
+
+
+def reference_geovelocity(history, current_time, current_location, max_speed=1000):
+    """Exhaustive pairwise check over the full 7-day history."""
+    alert_type = None
+    for prev_time, prev_location in history:
+        hours = (current_time - prev_time).total_seconds() / 3600
+        if hours <= 0 or current_time - prev_time > timedelta(days=7):
+            continue
+        speed = current_location.distance_to(prev_location) / hours
+        if speed > max_speed:
+            return AlertType.GEOVELOCITY_IMPOSSIBLE
+        if speed > 500 and hours < 2:
+            alert_type = AlertType.RAPID_MOVEMENT
+    return alert_type
+
+
+def test_geohash_matches_reference_encoding():
+    assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert encode_geohash(14.5995, 120.9842, 5) == encode_geohash(14.5990, 120.9850, 5)
+
+
+def test_detects_impossible_travel_and_rapid_movement():
+    monitor = GeovelocityMonitor()
+    t0 = datetime(2025, 1, 1, 8, 0, tzinfo=MANILA_TZ)
+    assert monitor.check_geovelocity(make_txn(1, "C1", t0, CITIES[0])) is None
+
+    alert = monitor.check_geovelocity(make_txn(2, "C1", t0 + timedelta(hours=1), CITIES[5]))
+    assert alert.alert_type == AlertType.GEOVELOCITY_IMPOSSIBLE
+    assert alert.auto_escalate
+
+    monitor = GeovelocityMonitor()
+    monitor.check_geovelocity(make_txn(3, "C2", t0, CITIES[0]))
+    alert = monitor.check_geovelocity(make_txn(4, "C2", t0 + timedelta(hours=1.2), CITIES[2]))
+    assert alert.alert_type == AlertType.RAPID_MOVEMENT
+
+
+def test_matches_exhaustive_check_on_random_itineraries():
+    rng = random.Random(42)
+    for customer in range(20):
+        monitor = GeovelocityMonitor()
+        history = []
+        now = datetime(2025, 1, 1, tzinfo=MANILA_TZ)
+        for i in range(300):
+            now += timedelta(minutes=rng.choice([5, 30, 90, 240, 720]))
+            location = rng.choice(CITIES)
+            expected = reference_geovelocity(history, now, location)
+            alert = monitor.check_geovelocity(make_txn(i, f"C{customer}", now, location))
+            assert (alert.alert_type if alert else None) == expected
+            history.append((now, location))
+
+
+def test_candidate_set_independent_of_history_length():
+    monitor = GeovelocityMonitor()
+    now = datetime(2025, 1, 1, tzinfo=MANILA_TZ)
+    for i in range(5000):
+        now += timedelta(seconds=60)
+        jitter = (i % 10) * 0.0001
+        monitor.check_geovelocity(make_txn(i, "HEAVY", now, Location(
+            14.5995 + jitter, 120.9842 + jitter, "Philippines", "Manila")))
+
+    assert len(monitor.location_history["HEAVY"]) <= monitor.max_history_points
+    assert len(monitor._candidate_points("HEAVY", now + timedelta(minutes=1))) == 1
+
+
+def random_structuring_sequence(rng, customers=5, length=4000):
+    amounts = [490000, 480000, 455000, 5000, 10000, 50000, 1020, 200000, 499999]
+    types = [TransactionType.DEPOSIT, TransactionType.WITHDRAWAL, TransactionType.DEPOSIT,
+             TransactionType.CARD_PURCHASE, TransactionType.TRANSFER_OUT]
+    now = {f"S{c}": datetime(2025, 1, 1, tzinfo=MANILA_TZ) for c in range(customers)}
+    for i in range(length):
+        customer_id = rng.choice(list(now))
+        now[customer_id] += timedelta(minutes=rng.choice([0, 5, 60, 60, 60, 180, 600, 1500]))
+        amount = rng.choice(amounts) if rng.random() < 0.6 else round(rng.uniform(100, 600000), 2)
+        yield Transaction(
+            transaction_id=f"TXN{i:06d}",
+            customer_id=customer_id,
+            timestamp=now[customer_id],
+            amount=amount,
+            currency="PHP",
+            transaction_type=rng.choice(types),
+            location=None,
+        )
+
+
+def test_incremental_structuring_matches_list_based_detector():
+    rng = random.Random(7)
+    incremental = StructuringDetector()
+    reference = StructuringDetector()
+    history = {}
+    fired = 0
+
+    for txn in random_structuring_sequence(rng):
+        expected = reference.detect_structuring(txn, history.get(txn.customer_id, []))
+        actual = incremental.check_structuring(txn)
+        history.setdefault(txn.customer_id, []).append(txn)
+
+        assert (actual is None) == (expected is None), txn.transaction_id
+        if expected is None:
+            continue
+        fired += 1
+        assert actual.alert_id == expected.alert_id
+        assert actual.risk_score == expected.risk_score
+        assert actual.transaction_ids == expected.transaction_ids
+        assert actual.details == expected.details
+
+    assert fired > 100
+
+
+def test_structuring_window_decays_on_expiry():
+    detector = StructuringDetector()
+    t0 = datetime(2025, 1, 1, tzinfo=MANILA_TZ)
+    for i in range(3):
+        txn = make_txn(i, "S1", t0 + timedelta(hours=i), None)
+        txn.amount, txn.transaction_type = 490000, TransactionType.DEPOSIT
+        detector.check_structuring(txn)
+
+    window = detector.windows["S1"]
+    assert window.below_threshold_count == 3
+    window.expire(t0 + timedelta(hours=30), detector._is_below_threshold, detector._is_round_amount)
+    assert len(window) == 0
+    assert window.below_threshold_count == 0
+    assert window.amount_sum == 0
+
+
+def test_latency_histogram_is_bounded_and_mergeable():
+    hist = LatencyHistogram()
+    for i in range(10000):
+        hist.observe(0.2 if i % 100 else 40.0)
+    other = LatencyHistogram()
+    other.observe(2000.0)
+    hist.merge(other)
+
+    assert hist.count == 10001
+    assert len(hist.counts) == len(hist.bounds) + 1
+    assert hist.percentile(50) == 0.25
+    assert hist.percentile(99.5) == 50
+    assert hist.percentile(100) == 2000.0
+
+
+def test_batch_replay_matches_sequential_processing():
+    rng = random.Random(3)
+    transactions = list(random_structuring_sequence(rng, customers=8, length=600))
+    for txn in transactions:
+        txn.location = rng.choice(CITIES)
+    shuffled = transactions[:]
+    rng.shuffle(shuffled)
+
+    # Ties keep input order, so compare against a stable sort of the same input
+    ordered = sorted(shuffled, key=lambda t: t.timestamp)
+    sequential = TransactionMonitoringEngine()
+    expected = []
+    for txn in ordered:
+        expected.extend(sequential.process_transaction(txn))
+    expected_ids = sorted(a.alert_id for a in expected)
+
+    single = TransactionMonitoringEngine()
+    assert sorted(a.alert_id for a in single.process_batch(shuffled)) == expected_ids
+
+    parallel = TransactionMonitoringEngine()
+    streamed = list(parallel.replay(ordered, workers=3, chunk_size=100))
+    assert sorted(a.alert_id for a in streamed) == expected_ids
+    summary = parallel.get_metrics_summary()
+    assert summary["transactions_processed"] == len(transactions)
+    assert summary["alerts_generated"] == len(expected)
+    assert parallel.latency_histogram.count == len(transactions)
+    # Streaming only counts alerts; keeping them is opt-in
+    assert parallel.alerts == [] and not parallel.alert_history
+    assert len(single.alerts) == len(expected)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_replay_raises_when_a_row_fails(workers):
+    start = datetime(2024, 1, 1, 9, tzinfo=MANILA_TZ)
+    transactions = [make_txn(i, f"CUST{i % 4}", start + timedelta(minutes=i), CITIES[0]) for i in range(20)]
+    transactions[7].amount = "not-a-number"
+
+    engine = TransactionMonitoringEngine()
+    with pytest.raises((TypeError, RuntimeError)) as excinfo:
+        list(engine.replay(transactions, workers=workers, chunk_size=10))
+    if workers > 1:
+        assert "TypeError" in str(excinfo.value)
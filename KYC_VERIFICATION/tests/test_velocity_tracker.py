@@ -0,0 +1,107 @@
+import math
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+
+# Ensure the KYC VERIFICATION src path is importable
+CURRENT_DIR = os.path.dirname(__file__)
+KYC_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+SRC_PATH = os.path.join(KYC_ROOT, "src")
+for p in [KYC_ROOT, SRC_PATH]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.monitoring.transaction_monitor import (  # noqa: E402
+    MANILA_TZ,
+    Transaction,
+    TransactionType,
+    VelocityTracker,
+)
+
+WINDOWS = {"minute": timedelta(minutes=1), "weekly": timedelta(days=7)}
+
+
+def make_txn(i, customer_id, when, amount):
+    return Transaction(
+        transaction_id=f"TX{i}",
+        customer_id=customer_id,
+        amount=amount,
+        currency="PHP",
+        transaction_type=TransactionType.PAYMENT,
+        timestamp=when.isoformat(),
+    )
+
+
+def reference_totals(history, now, window):
+    """The previous implementation: re-sum every entry inside the window."""
+    in_window = [amount for when, amount in history if when >= now - window]
+    return len(in_window), sum(in_window)
+
+
+def test_running_totals_match_full_summation_property():
+    for seed in range(25):
+        rng = random.Random(seed)
+        tracker = VelocityTracker(windows=WINDOWS)
+        history = {}
+        now = datetime(2025, 1, 1, tzinfo=MANILA_TZ)
+
+        for i in range(rng.randint(50, 1500)):
+            customer_id = f"C{rng.randrange(4)}"
+            now += timedelta(seconds=rng.choice([0, 1, 15, 45, 600, 3600, 20000, 90000]))
+            amount = round(rng.uniform(1, 250000), 2)
+            # Some transactions arrive late, possibly already outside a window
+            late = timedelta(seconds=rng.choice([0] * 6 + [30, 2000, 3 * 3600, 2 * 86400]))
+            tracker.add_transaction(make_txn(i, customer_id, now - late, amount), now=now)
+            history.setdefault(customer_id, []).append((now - late, amount))
+
+            check_at = now + timedelta(seconds=rng.choice([0, 0, 30, 300]))
+            now = check_at
+            totals = tracker.get_window_totals(customer_id, now=check_at)
+            for name, window in tracker.windows.items():
+                count, amount_sum = reference_totals(history[customer_id], check_at, window)
+                assert totals[name][0] == count, (seed, i, name)
+                assert math.isclose(totals[name][1], amount_sum, rel_tol=1e-9, abs_tol=1e-6)
+
+
+def test_check_velocity_reports_hourly_and_daily_separately():
+    tracker = VelocityTracker()
+    start = datetime(2025, 1, 1, 8, 0, tzinfo=MANILA_TZ)
+    for i in range(12):
+        tracker.add_transaction(make_txn(i, "C1", start + timedelta(hours=2, minutes=i), 1000), now=start)
+
+    exceeded, details = tracker.check_velocity("C1", now=start + timedelta(hours=2, minutes=30))
+    assert exceeded and details["hourly_exceeded"]
+    assert details["hourly_count"] == 12
+
+    exceeded, details = tracker.check_velocity("C1", now=start + timedelta(hours=5))
+    assert not exceeded
+    assert details["hourly_count"] == 0
+    assert details["hourly_amount"] == 0.0
+    assert details["daily_count"] == 12
+    assert tracker.check_velocity("UNKNOWN") == (False, {})
+
+
+def test_buffer_compacts_entries_expired_from_every_window():
+    tracker = VelocityTracker()
+    now = datetime(2025, 1, 1, tzinfo=MANILA_TZ)
+    for i in range(5000):
+        now += timedelta(minutes=1)
+        tracker.add_transaction(make_txn(i, "C1", now, 10), now=now)
+
+    buffer = tracker.transactions["C1"]
+    assert buffer.counts["daily"] == 24 * 60 + 1  # window start is inclusive
+    assert len(buffer.entries) < 24 * 60 + 2 * buffer.COMPACT_THRESHOLD
+
+
+def test_late_transaction_outside_window_is_not_counted():
+    tracker = VelocityTracker()
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=MANILA_TZ)
+    tracker.add_transaction(make_txn(1, "C1", now - timedelta(minutes=5), 100), now=now)
+    tracker.add_transaction(make_txn(2, "C1", now - timedelta(hours=3), 100), now=now)
+
+    totals = tracker.get_window_totals("C1", now=now)
+    assert totals["hourly"] == (1, 100.0)
+    assert totals["daily"] == (2, 200.0)
+    assert [e["id"] for e in tracker.transactions["C1"].entries] == ["TX2", "TX1"]